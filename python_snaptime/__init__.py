@@ -1,5 +1,60 @@
 """Python Snaptime package."""
 
-from python_snaptime.main import snap
+from __future__ import annotations
 
-__all__ = ["snap"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from python_snaptime.epochs import snap_epoch
+    from python_snaptime.main import snap
+    from python_snaptime.many import snap_many
+    from python_snaptime.parsers import cache_clear, cache_info, compile, set_cache_size  # noqa: A004
+    from python_snaptime.plans import SnapPlan
+    from python_snaptime.ranges import snap_range
+    from python_snaptime.windows import TimeWindow, time_window, time_windows
+
+__all__ = [
+    "SnapPlan",
+    "TimeWindow",
+    "cache_clear",
+    "cache_info",
+    "compile",
+    "set_cache_size",
+    "snap",
+    "snap_epoch",
+    "snap_many",
+    "snap_range",
+    "time_window",
+    "time_windows",
+]
+
+# the public API is imported on first use, to keep `import python_snaptime` fast
+_LAZY_IMPORTS = {
+    "SnapPlan": "python_snaptime.plans",
+    "TimeWindow": "python_snaptime.windows",
+    "cache_clear": "python_snaptime.parsers",
+    "cache_info": "python_snaptime.parsers",
+    "compile": "python_snaptime.parsers",
+    "set_cache_size": "python_snaptime.parsers",
+    "snap": "python_snaptime.main",
+    "snap_epoch": "python_snaptime.epochs",
+    "snap_many": "python_snaptime.many",
+    "snap_range": "python_snaptime.ranges",
+    "time_window": "python_snaptime.windows",
+    "time_windows": "python_snaptime.windows",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
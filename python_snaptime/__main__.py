@@ -0,0 +1,8 @@
+"""Entry point for `python -m python_snaptime`."""
+
+import sys
+
+from python_snaptime.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+"""Helpers for processing iterables in batches."""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_T = TypeVar("_T")
+
+
+def batches(iterable: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    """Split an iterable into lists of `size` items, the last of which can be shorter."""
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
@@ -0,0 +1,50 @@
+"""Helpers for sharing the result of a plan starting with a snap between the datetimes of its bucket.
+
+When a plan starts with a snap, e.g `@d-2h`, its result only depends on the bucket the datetime falls in (e.g its
+day), its timezone and its `fold`, so callers such as `MemoizedPlan` and `snap_iso` compute it once per bucket.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from python_snaptime.models import Action, Unit
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Sequence
+
+    from python_snaptime.models import Operation
+
+# the number of leading datetime fields (year, month, day, hour, minute, second) that decide the bucket of a snap unit
+_BUCKET_FIELDS = {Unit.SECOND: 6, Unit.MINUTE: 5, Unit.HOUR: 4, Unit.DAY: 3, Unit.WEEK: 3, Unit.MONTH: 2}
+
+
+def leading_snap(operations: Sequence[Operation]) -> Unit | None:
+    """Get the unit of the snap a plan starts with, or `None` if it starts with a delta."""
+    if not operations or operations[0].action != Action.SNAP:
+        return None
+    return operations[0].unit
+
+
+def bucket(unit: Unit, dtm: datetime.datetime) -> tuple[int, ...]:
+    """Get the wall time fields that decide the result of a snap to a unit."""
+    # a week snap steps back from the day of the datetime, so its result is only shared by datetimes of the same day
+    if unit == Unit.QUARTER:
+        return dtm.year, (dtm.month - 1) // 3
+    if unit == Unit.YEAR:
+        return (dtm.year,)
+    return (dtm.year, dtm.month, dtm.day, dtm.hour, dtm.minute, dtm.second)[: _BUCKET_FIELDS[unit]]
+
+
+def skipped(dtm: datetime.datetime) -> bool:
+    """Check if the wall time of a builtin datetime is skipped by a DST transition.
+
+    A skipped wall time is shifted before it is snapped, so its result is not shared by the other datetimes of its
+    bucket.
+    """
+    if dtm.tzinfo is None:
+        return False
+    before = dtm.replace(fold=0).utcoffset()
+    after = dtm.replace(fold=1).utcoffset()
+    return before is not None and after is not None and after > before
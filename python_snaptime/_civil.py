@@ -0,0 +1,56 @@
+"""Closed-form proleptic Gregorian calendar arithmetic.
+
+The functions only use integer arithmetic and comparisons, so they work on both Python integers and NumPy integer
+arrays. Days are counted from the Unix epoch (1970-01-01 is day 0).
+"""
+
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+_T = TypeVar("_T", bound=Any)
+
+
+def days_from_civil(year: _T, month: _T, day: _T) -> _T:
+    """Get the number of days since the epoch of a civil date."""
+    year = year - (month <= 2)
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def civil_from_days(days: _T) -> tuple[_T, _T, _T]:
+    """Get the civil `(year, month, day)` of a number of days since the epoch."""
+    days = days + 719468
+    era = days // 146097
+    doe = days - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 - 12 * (mp >= 10)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def days_in_month(year: _T, month: _T) -> _T:
+    """Get the number of days in a month."""
+    return days_from_civil(year + (month == 12), month % 12 + 1, 1) - days_from_civil(year, month, 1)
+
+
+def weekday(days: _T) -> _T:
+    """Get the day of the week of a number of days since the epoch, where Monday is `0`."""
+    return (days + 3) % 7
+
+
+def add_months(days: _T, months: int) -> _T:
+    """Add months to a number of days since the epoch, clamping the day to the end of the month."""
+    year, month, day = civil_from_days(days)
+    total = year * 12 + month - 1 + months
+    year = total // 12
+    month = total % 12 + 1
+    last_day = days_in_month(year, month)
+    day = day - (day > last_day) * (day - last_day)
+    return days_from_civil(year, month, day)
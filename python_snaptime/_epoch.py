@@ -0,0 +1,100 @@
+"""Integer engine for applying snaptime operations in timezones without transitions.
+
+Without transitions the wall time is the UTC time shifted by a constant offset, so every snaptime operation is integer
+arithmetic on the wall time in microseconds since the epoch: sub-day units are plain multiples, and days, weeks,
+months, quarters and years use closed-form calendar arithmetic.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+from python_snaptime import _civil
+from python_snaptime.models import Action, Unit
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Iterable
+
+    from python_snaptime.models import Operation
+
+_D = TypeVar("_D", bound="datetime.datetime")
+
+_MICROSECONDS_PER_DAY = 86_400_000_000
+_SNAP_MICROSECONDS = {
+    Unit.SECOND: 1_000_000,
+    Unit.MINUTE: 60_000_000,
+    Unit.HOUR: 3_600_000_000,
+    Unit.DAY: _MICROSECONDS_PER_DAY,
+}
+# the size of each fixed length delta unit, e.g to fold leading deltas of a plan into one shift of the wall time
+DELTA_MICROSECONDS = {
+    Unit.MICROSECOND: 1,
+    Unit.MILLISECOND: 1_000,
+    Unit.SECOND: 1_000_000,
+    Unit.MINUTE: 60_000_000,
+    Unit.HOUR: 3_600_000_000,
+    Unit.DAY: _MICROSECONDS_PER_DAY,
+    Unit.WEEK: 7 * _MICROSECONDS_PER_DAY,
+}
+_DELTA_MONTHS = {Unit.MONTH: 1, Unit.QUARTER: 3, Unit.YEAR: 12}
+
+
+def to_microseconds(dtm: datetime.datetime) -> int:
+    """Get the wall time of a datetime in microseconds since the epoch."""
+    days = _civil.days_from_civil(dtm.year, dtm.month, dtm.day)
+    return (((days * 24 + dtm.hour) * 60 + dtm.minute) * 60 + dtm.second) * 1_000_000 + dtm.microsecond
+
+
+def from_microseconds(microseconds: int, dtm: _D) -> _D:
+    """Create a datetime of the same type and timezone as `dtm` from a wall time in microseconds since the epoch."""
+    days, microseconds = divmod(microseconds, _MICROSECONDS_PER_DAY)
+    year, month, day = _civil.civil_from_days(days)
+    seconds, microsecond = divmod(microseconds, 1_000_000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return type(dtm)(year, month, day, hour, minute, second, microsecond, tzinfo=dtm.tzinfo)
+
+
+def _snap(unit: Unit, microseconds: int) -> int:
+    size = _SNAP_MICROSECONDS.get(unit)
+    if size is not None:
+        return microseconds - microseconds % size
+    days = microseconds // _MICROSECONDS_PER_DAY
+    if unit == Unit.WEEK:
+        days -= _civil.weekday(days)
+    else:
+        year, month, _ = _civil.civil_from_days(days)
+        if unit == Unit.QUARTER:
+            month -= (month - 1) % 3
+        elif unit == Unit.YEAR:
+            month = 1
+        days = _civil.days_from_civil(year, month, 1)
+    return days * _MICROSECONDS_PER_DAY
+
+
+def run(operations: Iterable[Operation], microseconds: int) -> int:
+    """Apply snaptime operations to a wall time in microseconds since the epoch.
+
+    Args:
+        operations (Iterable[Operation]): The snaptime operations to apply, in order.
+        microseconds (int): The wall time in microseconds since the epoch.
+
+    Returns:
+        int: The resulting wall time in microseconds since the epoch.
+    """
+    for operation in operations:
+        if operation.action == Action.SNAP:
+            microseconds = _snap(operation.unit, microseconds)
+            continue
+        time_int = operation.time_int or 0
+        if operation.action == Action.SUB:
+            time_int = -time_int
+        size = DELTA_MICROSECONDS.get(operation.unit)
+        if size is not None:
+            microseconds += time_int * size
+        else:
+            days, time_of_day = divmod(microseconds, _MICROSECONDS_PER_DAY)
+            days = _civil.add_months(days, time_int * _DELTA_MONTHS[operation.unit])
+            microseconds = days * _MICROSECONDS_PER_DAY + time_of_day
+    return microseconds
@@ -0,0 +1,130 @@
+"""Engine for applying snaptime operations to builtin `datetime` objects with `zoneinfo` timezones.
+
+The operations mirror `pendulum` exactly, so the results match `snap` on the equivalent `pendulum.DateTime`:
+
+- snaps replace the wall time, keeping `fold`.
+- days, weeks, months, quarters and years are added to the wall time, with `fold=1`.
+- microseconds, milliseconds, seconds, minutes and hours, and zero deltas of any unit, are added to the UTC time.
+- wall times skipped by a transition, including the input, are shifted by the size of the gap, forwards with
+  `fold=1` and backwards with `fold=0`.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from python_snaptime import _civil
+from python_snaptime.models import Action, Unit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from python_snaptime.models import Operation
+
+_UTC = datetime.timezone.utc
+_ZERO = datetime.timedelta(0)
+_FIXED_DELTAS = {
+    Unit.MICROSECOND: datetime.timedelta(microseconds=1),
+    Unit.MILLISECOND: datetime.timedelta(milliseconds=1),
+    Unit.SECOND: datetime.timedelta(seconds=1),
+    Unit.MINUTE: datetime.timedelta(minutes=1),
+    Unit.HOUR: datetime.timedelta(hours=1),
+}
+_DELTA_DAYS = {Unit.DAY: 1, Unit.WEEK: 7}
+_DELTA_MONTHS = {Unit.MONTH: 1, Unit.QUARTER: 3, Unit.YEAR: 12}
+
+
+def _localize(wall: datetime.datetime, tz: datetime.tzinfo, fold: int) -> datetime.datetime:
+    before = wall.replace(tzinfo=tz, fold=0).utcoffset()
+    after = wall.replace(tzinfo=tz, fold=1).utcoffset()
+    if before is not None and after is not None and after > before:
+        # skipped wall time
+        return (wall + (after - before if fold else before - after)).replace(tzinfo=tz)
+    return wall.replace(tzinfo=tz, fold=fold)
+
+
+def _set(dtm: datetime.datetime, **kwargs: int) -> datetime.datetime:
+    return _localize(dtm.replace(tzinfo=None, fold=0, **kwargs), dtm.tzinfo, dtm.fold)  # type: ignore[arg-type]
+
+
+def _add_days(dtm: datetime.datetime, days: int) -> datetime.datetime:
+    return _localize(dtm.replace(tzinfo=None, fold=0) + datetime.timedelta(days=days), dtm.tzinfo, 1)  # type: ignore[arg-type]
+
+
+def _add_months(dtm: datetime.datetime, months: int) -> datetime.datetime:
+    total = dtm.year * 12 + dtm.month - 1 + months
+    year, month = divmod(total, 12)
+    day = min(dtm.day, _civil.days_in_month(year, month + 1))
+    return _localize(dtm.replace(year=year, month=month + 1, day=day, tzinfo=None, fold=0), dtm.tzinfo, 1)  # type: ignore[arg-type]
+
+
+def _start_of_day(dtm: datetime.datetime) -> datetime.datetime:
+    return _set(dtm, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _snap_week(dtm: datetime.datetime) -> datetime.datetime:
+    # mirrors `pendulum`: snap to the day, step back a day at a time until Monday, then snap to the day again
+    if dtm.weekday() != 0:
+        dtm = _start_of_day(dtm)
+        while True:
+            wall = dtm.replace(tzinfo=None, fold=0) - datetime.timedelta(days=1)
+            dtm = _localize(wall, dtm.tzinfo, 1)  # type: ignore[arg-type]
+            if dtm.day != wall.day:
+                # a whole skipped day (e.g Pacific/Apia in 2011) is shifted forwards to the day `pendulum` stepped back
+                # from, which it loops on forever, so keep stepping back from the skipped day
+                dtm = wall.replace(tzinfo=dtm.tzinfo, fold=1)
+            if dtm.weekday() == 0:
+                break
+    return _start_of_day(dtm)
+
+
+def _snap(unit: Unit, dtm: datetime.datetime) -> datetime.datetime:
+    if unit == Unit.SECOND:
+        return _set(dtm, microsecond=0)
+    if unit == Unit.MINUTE:
+        return _set(dtm, second=0, microsecond=0)
+    if unit == Unit.HOUR:
+        return _set(dtm, minute=0, second=0, microsecond=0)
+    if unit == Unit.DAY:
+        return _start_of_day(dtm)
+    if unit == Unit.WEEK:
+        return _snap_week(dtm)
+    if unit == Unit.MONTH:
+        month = dtm.month
+    elif unit == Unit.QUARTER:
+        month = (dtm.month - 1) // 3 * 3 + 1
+    else:
+        month = 1
+    return _set(dtm, month=month, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _delta(unit: Unit, time_int: int, dtm: datetime.datetime) -> datetime.datetime:
+    if unit in _FIXED_DELTAS or not time_int:
+        # `pendulum` adds zero calendar deltas to the UTC time too
+        utc = dtm.replace(tzinfo=None, fold=0) - (dtm.utcoffset() or _ZERO) + _FIXED_DELTAS.get(unit, _ZERO) * time_int
+        return utc.replace(tzinfo=_UTC).astimezone(dtm.tzinfo)
+    if unit in _DELTA_DAYS:
+        return _add_days(dtm, time_int * _DELTA_DAYS[unit])
+    return _add_months(dtm, time_int * _DELTA_MONTHS[unit])
+
+
+def run(operations: Iterable[Operation], dtm: datetime.datetime) -> datetime.datetime:
+    """Apply snaptime operations to an aware datetime.
+
+    Args:
+        operations (Iterable[Operation]): The snaptime operations to apply, in order.
+        dtm (datetime.datetime): The datetime, with a `zoneinfo.ZoneInfo` timezone.
+
+    Returns:
+        datetime.datetime: The resulting datetime, in the same timezone.
+    """
+    # a skipped wall time is shifted as `pendulum.instance` does
+    dtm = _set(dtm)
+    for operation in operations:
+        if operation.action == Action.SNAP:
+            dtm = _snap(operation.unit, dtm)
+        else:
+            time_int = operation.time_int or 0
+            dtm = _delta(operation.unit, -time_int if operation.action == Action.SUB else time_int, dtm)
+    return dtm
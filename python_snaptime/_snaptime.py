@@ -0,0 +1,62 @@
+"""Module defining the pydantic `Snaptime` model.
+
+Imported on first access of `python_snaptime.models.Snaptime`, so pydantic is not needed to snap datetimes.
+"""
+
+from __future__ import annotations
+
+from typing import TypedDict
+
+from pydantic import BaseModel, model_validator
+
+from python_snaptime.models import Action, Operation, Unit
+
+
+class SnaptimeDict(TypedDict, total=False):
+    """Dictionary representing a snaptime configuration."""
+
+    action: str | None
+    unit: str | None
+    time_int: int | None
+
+
+class Snaptime(BaseModel):
+    """Model representing a snaptime configuration."""
+
+    action: Action | None = None
+    unit: Unit | None = None
+    time_int: int | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _verify_model(cls, values: SnaptimeDict) -> SnaptimeDict:
+        action = values.get("action")
+        unit = values.get("unit")
+        time_int = values.get("time_int")
+
+        if action is None:
+            raise ValueError("Snaptime string is invalid: must provide either a snap `@` or time delta `+-`.")
+
+        if action == Action.SNAP:
+            if time_int is not None:
+                raise ValueError("Snaptime string is invalid: cannot use a time integer when snapping.")
+            if unit is None:
+                raise ValueError("Snaptime string is invalid: missing time unit when snapping.")
+            if unit in Unit.MILLISECOND.value:
+                raise ValueError("Snaptime string is invalid: cannot snap to nearest millisecond.")
+            if unit in Unit.MICROSECOND.value:
+                raise ValueError("Snaptime string is invalid: cannot snap to nearest microsecond.")
+        elif action in (Action.ADD, Action.SUB):
+            if time_int is None:
+                raise ValueError("Snaptime string is invalid: missing time integer for time addition or subtraction.")
+            if unit is None:
+                raise ValueError("Snaptime string is invalid: missing time unit for time addition or subtraction.")
+        return values
+
+    def to_operation(self) -> Operation:
+        """Convert the snaptime to the lightweight `Operation` used when evaluating snaptimes.
+
+        Returns:
+            Operation: The validated operation.
+        """
+        return Operation.create(self.action, self.unit, self.time_int)
@@ -0,0 +1,71 @@
+"""Helpers for inspecting timezones."""
+
+from __future__ import annotations
+
+import datetime
+import zoneinfo
+from typing import Union
+
+TimezoneLike = Union[str, datetime.tzinfo, None]
+
+_UTC_KEYS = frozenset(("UTC", "Etc/UTC", "Etc/Universal", "Etc/Zulu", "Etc/GMT", "GMT", "Universal", "Zulu"))
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_PROBE_SECONDS = 86_400
+
+
+def fixed_offset(tz: datetime.tzinfo | None) -> datetime.timedelta | None:
+    """Get the UTC offset of a timezone without transitions.
+
+    Args:
+        tz (datetime.tzinfo | None): The timezone. `None` is treated as UTC.
+
+    Returns:
+        datetime.timedelta | None: The constant UTC offset, or `None` if the timezone has transitions.
+    """
+    if tz is None:
+        return datetime.timedelta(0)
+    if isinstance(tz, zoneinfo.ZoneInfo):
+        return datetime.timedelta(0) if tz.key in _UTC_KEYS else None
+    return tz.utcoffset(None)
+
+
+def _utc_offset(tz: datetime.tzinfo, seconds: int) -> int:
+    offset = (_EPOCH + datetime.timedelta(seconds=seconds)).astimezone(tz).utcoffset()
+    if offset is None:  # pragma: no cover
+        raise ValueError("Timezone must provide a UTC offset.")
+    return offset // datetime.timedelta(seconds=1)
+
+
+def transitions(tz: datetime.tzinfo, start: int, end: int) -> tuple[list[int], list[int]]:
+    """Find the transitions of a timezone between two instants.
+
+    The UTC offset is probed once a day and each change is located to the second with a binary search, so transitions
+    less than a day apart that cancel out (which the tz database does not contain) are not found.
+
+    Args:
+        tz (datetime.tzinfo): The timezone.
+        start (int): The first instant, in seconds since the epoch.
+        end (int): The last instant, in seconds since the epoch.
+
+    Returns:
+        tuple[list[int], list[int]]: The instants of the transitions after `start` up to `end`, in seconds since the
+            epoch, and the UTC offsets in seconds at `start` and after each transition.
+    """
+    times: list[int] = []
+    offsets = [_utc_offset(tz, start)]
+    previous = start
+    while previous < end:
+        current = min(previous + _PROBE_SECONDS, end)
+        offset = _utc_offset(tz, current)
+        if offset != offsets[-1]:
+            low, high = previous, current
+            while high - low > 1:
+                middle = (low + high) // 2
+                if _utc_offset(tz, middle) == offsets[-1]:
+                    low = middle
+                else:
+                    high = middle
+            times.append(high)
+            offsets.append(offset)
+        previous = current
+    return times, offsets
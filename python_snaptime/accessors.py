@@ -0,0 +1,98 @@
+"""Module registering the `snaptime` accessor on pandas `Series` and `DatetimeIndex` objects.
+
+Importing this module registers the accessor:
+
+```python
+import pandas as pd
+import python_snaptime.accessors  # noqa: F401
+
+series = pd.Series(pd.date_range("2024-12-30", periods=3, freq="7h", tz="Europe/London"))
+series.snaptime("@d-2h")
+```
+"""
+
+from __future__ import annotations
+
+import zoneinfo
+from typing import TYPE_CHECKING
+
+try:
+    import pandas as pd
+except ImportError as e:  # pragma: no cover
+    raise ImportError("python_snaptime.accessors requires pandas: `pip install python-snaptime[pandas]`.") from e
+
+import numpy as np
+
+from python_snaptime import parsers
+from python_snaptime.arrays import snap_array
+from python_snaptime.plans import SnapPlan
+
+if TYPE_CHECKING:
+    import datetime
+
+    from numpy.typing import NDArray
+
+__all__ = ["SnaptimeAccessor"]
+
+_SUPPORTED_UNITS = ("us", "ns")
+
+
+def _timezone(tz: datetime.tzinfo | None) -> datetime.tzinfo | None:
+    # `pytz` timezones only give the correct offsets through `localize`, so use the equivalent `zoneinfo` timezone
+    zone = getattr(tz, "zone", None)
+    if isinstance(zone, str):
+        return zoneinfo.ZoneInfo(zone)
+    return tz
+
+
+def _snap_values(values: pd.DatetimeIndex, plan: SnapPlan) -> pd.DatetimeIndex:
+    tz = values.tz
+    arr: NDArray[np.datetime64] = (values if tz is None else values.tz_convert(None)).to_numpy()
+    unit = np.datetime_data(arr.dtype)[0]
+    if unit not in _SUPPORTED_UNITS:
+        snapped = snap_array(arr.astype("datetime64[us]"), plan, tz=_timezone(tz))
+        arr_snapped = snapped.astype(arr.dtype)
+        if (arr_snapped.astype(snapped.dtype).view(np.int64) != snapped.view(np.int64)).any():
+            msg = f"Snapped datetimes cannot be represented with the `{unit}` resolution of the input."
+            raise ValueError(msg)
+    else:
+        arr_snapped = snap_array(arr, plan, tz=_timezone(tz))
+    result = pd.DatetimeIndex(arr_snapped, name=values.name)
+    return result if tz is None else result.tz_localize("UTC").tz_convert(tz)
+
+
+class SnaptimeAccessor:
+    """Snap pandas datetimes using relative time modifiers, e.g `series.snaptime("@d-2h")`.
+
+    The snaptime string is compiled once and applied to the whole column without creating a datetime object per
+    element. The dtype and timezone are kept, and `NaT` values are passed through.
+    """
+
+    def __init__(self, obj: pd.Series | pd.DatetimeIndex) -> None:
+        """Initialise the accessor.
+
+        Args:
+            obj (pd.Series | pd.DatetimeIndex): The datetimes to snap.
+        """
+        if not isinstance(obj.dtype, pd.DatetimeTZDtype) and obj.dtype.kind != "M":
+            raise AttributeError("Can only use the .snaptime accessor with datetime values.")
+        self._obj = obj
+
+    def __call__(self, snap: str | SnapPlan) -> pd.Series | pd.DatetimeIndex:
+        """Transform the datetimes using relative time modifiers.
+
+        Args:
+            snap (str | SnapPlan): The snaptime string, or compiled plan, defining the relative time transformation.
+
+        Returns:
+            pd.Series | pd.DatetimeIndex: The resulting snapped datetimes, of the same type as the input.
+        """
+        plan = snap if isinstance(snap, SnapPlan) else parsers.compile(snap)
+        if isinstance(self._obj, pd.Series):
+            snapped = _snap_values(pd.DatetimeIndex(self._obj), plan)
+            return pd.Series(snapped, index=self._obj.index, name=self._obj.name)
+        return _snap_values(self._obj, plan)
+
+
+pd.api.extensions.register_series_accessor("snaptime")(SnaptimeAccessor)
+pd.api.extensions.register_index_accessor("snaptime")(SnaptimeAccessor)
@@ -0,0 +1,126 @@
+"""Module for snapping batches of datetimes without blocking an `asyncio` event loop.
+
+Batches are snapped a chunk at a time, giving control back to the event loop between chunks, or handing each chunk
+to an executor. Batches no larger than one chunk are snapped inline, without the overhead of an executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Union
+
+from python_snaptime import parsers
+from python_snaptime._batching import batches
+from python_snaptime.plans import SnapPlan
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    import datetime
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "asnap_batch", "asnap_iter"]
+
+DEFAULT_CHUNK_SIZE = 512
+
+DatetimeIterable = Union["Iterable[datetime.datetime]", "AsyncIterable[datetime.datetime]"]
+
+
+def _snap_chunk(plan: SnapPlan, chunk: list[datetime.datetime]) -> list[datetime.datetime]:
+    return [plan.apply(dtm) for dtm in chunk]
+
+
+def _validate(chunk_size: int) -> None:
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+
+
+async def _chunks(values: DatetimeIterable, size: int) -> AsyncIterator[list[datetime.datetime]]:
+    if hasattr(values, "__aiter__"):
+        chunk: list[datetime.datetime] = []
+        async for dtm in values:  # type: ignore[union-attr]
+            chunk.append(dtm)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+    for chunk in batches(values, size):  # type: ignore[arg-type]
+        yield chunk
+
+
+async def _run_chunk(
+    plan: SnapPlan, chunk: list[datetime.datetime], executor: concurrent.futures.Executor | None
+) -> list[datetime.datetime]:
+    if executor is None:
+        results = _snap_chunk(plan, chunk)
+        # give control back to the event loop between chunks
+        await asyncio.sleep(0)
+        return results
+    return await asyncio.get_running_loop().run_in_executor(executor, _snap_chunk, plan, chunk)
+
+
+async def asnap_batch(
+    values: DatetimeIterable,
+    snap: str | SnapPlan,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: concurrent.futures.Executor | None = None,
+) -> list[datetime.datetime]:
+    """Transform a batch of datetimes using relative time modifiers, without blocking the event loop.
+
+    Args:
+        values (Iterable[datetime.datetime] | AsyncIterable[datetime.datetime]): The datetimes to be transformed.
+        snap (str | SnapPlan): The snaptime string, or compiled plan, defining the relative time transformation.
+        chunk_size (int): The number of datetimes snapped at a time.
+        executor (concurrent.futures.Executor | None): An executor to snap the chunks in, e.g a
+            `ProcessPoolExecutor`. Without one the chunks are snapped on the event loop, giving control back to it
+            between chunks.
+
+    Returns:
+        list[datetime.datetime]: The resulting snapped datetimes, in input order.
+    """
+    _validate(chunk_size)
+    plan = snap if isinstance(snap, SnapPlan) else parsers.compile(snap)
+    if isinstance(values, (list, tuple)) and len(values) <= chunk_size:
+        return _snap_chunk(plan, list(values))
+
+    results: list[datetime.datetime] = []
+    if executor is None:
+        async for chunk in _chunks(values, chunk_size):
+            results.extend(await _run_chunk(plan, chunk, None))
+        return results
+    # the chunks are snapped concurrently, `gather` keeps them in order
+    loop = asyncio.get_running_loop()
+    futures = [loop.run_in_executor(executor, _snap_chunk, plan, chunk) async for chunk in _chunks(values, chunk_size)]
+    for snapped in await asyncio.gather(*futures):
+        results.extend(snapped)
+    return results
+
+
+async def asnap_iter(
+    values: DatetimeIterable,
+    snap: str | SnapPlan,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: concurrent.futures.Executor | None = None,
+) -> AsyncIterator[datetime.datetime]:
+    """Transform a stream of datetimes using relative time modifiers, without blocking the event loop.
+
+    Datetimes are read and snapped a chunk at a time, so arbitrarily long streams are snapped in constant memory.
+
+    Args:
+        values (Iterable[datetime.datetime] | AsyncIterable[datetime.datetime]): The datetimes to be transformed.
+        snap (str | SnapPlan): The snaptime string, or compiled plan, defining the relative time transformation.
+        chunk_size (int): The number of datetimes snapped at a time.
+        executor (concurrent.futures.Executor | None): An executor to snap the chunks in. Without one the chunks are
+            snapped on the event loop, giving control back to it between chunks.
+
+    Yields:
+        datetime.datetime: The resulting snapped datetimes, in input order.
+    """
+    _validate(chunk_size)
+    plan = snap if isinstance(snap, SnapPlan) else parsers.compile(snap)
+    async for chunk in _chunks(values, chunk_size):
+        for result in await _run_chunk(plan, chunk, executor):
+            yield result
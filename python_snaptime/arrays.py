@@ -0,0 +1,431 @@
+"""Module for snapping NumPy `datetime64` arrays.
+
+The snaptime operations are applied to whole arrays at once using integer arithmetic, mirroring the semantics of the
+`pendulum` handlers in `python_snaptime.handlers` (including DST `fold` handling) without creating a datetime object
+per element.
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+import zoneinfo
+from typing import TYPE_CHECKING, Any, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError("python_snaptime.arrays requires numpy: `pip install python-snaptime[numpy]`.") from e
+
+from python_snaptime import _civil, instrumentation, parsers
+from python_snaptime._zones import TimezoneLike, fixed_offset, transitions
+from python_snaptime.cache import ThreadLocalCache
+from python_snaptime.models import Action, Unit
+from python_snaptime.plans import SnapPlan
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from python_snaptime.models import Operation
+
+__all__ = ["snap_array", "snap_range_array"]
+
+DatetimeLike = Union[str, datetime.datetime, np.datetime64]
+
+_EPOCH = datetime.datetime(1970, 1, 1)  # noqa: DTZ001
+_NAT = np.iinfo(np.int64).min
+_TICKS_PER_SECOND = {"us": 1_000_000, "ns": 1_000_000_000}
+_BLOCK_SECONDS = 1 << 25
+_MIN_SECONDS = (datetime.datetime(1, 1, 3) - _EPOCH) // datetime.timedelta(seconds=1)  # noqa: DTZ001
+_MAX_SECONDS = (datetime.datetime(9999, 12, 29) - _EPOCH) // datetime.timedelta(seconds=1)  # noqa: DTZ001
+
+_SNAP_SECONDS = {Unit.SECOND: 1, Unit.MINUTE: 60, Unit.HOUR: 3600, Unit.DAY: 86400}
+_DELTA_MICROSECONDS = {
+    Unit.MICROSECOND: 1,
+    Unit.MILLISECOND: 1000,
+    Unit.SECOND: 1_000_000,
+    Unit.MINUTE: 60_000_000,
+    Unit.HOUR: 3_600_000_000,
+}
+_DELTA_DAYS = {Unit.DAY: 1, Unit.WEEK: 7}
+_DELTA_MONTHS = {Unit.MONTH: 1, Unit.QUARTER: 3, Unit.YEAR: 12}
+
+
+class _FixedZone:
+    """A timezone with a constant UTC offset, in ticks."""
+
+    fixed = True
+
+    def __init__(self, offset: int) -> None:
+        self.offset = offset
+
+    def utc_offsets(self, utc: NDArray[np.int64]) -> NDArray[np.int64]:
+        return np.full_like(utc, self.offset)
+
+    def wall_offsets(self, wall: NDArray[np.int64], fold: NDArray[np.int8] | int) -> NDArray[np.int64]:  # noqa: ARG002
+        return np.full_like(wall, self.offset)
+
+    def first_instants(self, wall: NDArray[np.int64]) -> NDArray[np.int64]:
+        return wall - self.offset
+
+
+class _Transitions:
+    """The transitions of a timezone over a range of instants, in seconds since the epoch."""
+
+    def __init__(self, start: int, end: int, times: list[int], offsets: list[int]) -> None:
+        self.start = start
+        self.end = end
+        self.times = np.array(times, dtype=np.int64)
+        self.offsets = np.array(offsets, dtype=np.int64)
+        before, after = self.offsets[:-1], self.offsets[1:]
+        # a wall time in a gap or a fold resolves to the offset before the transition with `fold=0`, and to the
+        # offset after it with `fold=1`
+        self.wall_times = (self.times + np.maximum(before, after), self.times + np.minimum(before, after))
+
+    def covers(self, start: int, end: int) -> bool:
+        return self.start <= start and end <= self.end
+
+    def extend(self, tz: datetime.tzinfo, start: int, end: int) -> _Transitions:
+        start, end = min(start, self.start), max(end, self.end)
+        before_times, before_offsets = transitions(tz, start, self.start)
+        after_times, after_offsets = transitions(tz, self.end, end)
+        return _Transitions(
+            start,
+            end,
+            before_times + self.times.tolist() + after_times,
+            before_offsets + self.offsets[1:].tolist() + after_offsets[1:],
+        )
+
+
+_TRANSITIONS: ThreadLocalCache[datetime.tzinfo, _Transitions] = ThreadLocalCache(128)
+
+
+def _get_transitions(tz: datetime.tzinfo, start: int, end: int) -> _Transitions:
+    # tables cover whole blocks of about a year, within the range of `datetime`, and are extended when needed
+    start = min(max(start // _BLOCK_SECONDS * _BLOCK_SECONDS, _MIN_SECONDS), _MAX_SECONDS)
+    end = max(min(-(-end // _BLOCK_SECONDS) * _BLOCK_SECONDS, _MAX_SECONDS), _MIN_SECONDS)
+    table = _TRANSITIONS.get(tz)
+    if table is not None and table.covers(start, end):
+        return table
+    table = _Transitions(start, end, *transitions(tz, start, end)) if table is None else table.extend(tz, start, end)
+    # tables are never modified, so a table being read by another thread stays valid when it is replaced
+    _TRANSITIONS.put(tz, table)
+    return table
+
+
+def _scale(seconds: NDArray[np.int64], ticks_per_second: int) -> NDArray[np.int64]:
+    # instants out of the range of the array unit are clipped, they are before or after any element
+    limit = np.iinfo(np.int64).max // ticks_per_second
+    return np.clip(seconds, -limit, limit) * ticks_per_second
+
+
+class _TransitionZone:
+    """A timezone with transitions, whose UTC offsets are looked up in a cached table of its transitions."""
+
+    fixed = False
+
+    def __init__(self, tz: datetime.tzinfo, ticks_per_second: int) -> None:
+        self._tz = tz
+        self._ticks_per_second = ticks_per_second
+
+    def _ticks(self, seconds: NDArray[np.int64]) -> NDArray[np.int64]:
+        return _scale(seconds, self._ticks_per_second)
+
+    def _table(self, ticks: NDArray[np.int64], margin: int) -> _Transitions:
+        seconds = ticks // self._ticks_per_second
+        return _get_transitions(self._tz, int(seconds.min()) - margin, int(seconds.max()) + margin)
+
+    def utc_offsets(self, utc: NDArray[np.int64]) -> NDArray[np.int64]:
+        if not utc.size:
+            return np.zeros_like(utc)
+        table = self._table(utc, 0)
+        return self._ticks(table.offsets)[np.searchsorted(self._ticks(table.times), utc, side="right")]
+
+    def wall_offsets(self, wall: NDArray[np.int64], fold: NDArray[np.int8] | int) -> NDArray[np.int64]:
+        if not wall.size:
+            return np.zeros_like(wall)
+        # wall times differ from UTC by less than a day
+        table = self._table(wall, 86400)
+        offsets = self._ticks(table.offsets)
+        before = offsets[np.searchsorted(self._ticks(table.wall_times[0]), wall, side="right")]
+        if isinstance(fold, int) and fold == 0:
+            return before
+        after = offsets[np.searchsorted(self._ticks(table.wall_times[1]), wall, side="right")]
+        if isinstance(fold, int):
+            return after
+        return np.where(fold == 1, after, before)
+
+    def first_instants(self, wall: NDArray[np.int64]) -> NDArray[np.int64]:
+        # the first UTC instants whose wall time is at least `wall`, the transition itself for skipped wall times
+        before = self.wall_offsets(wall, 0)
+        utc = wall - before
+        skipped = self.wall_offsets(wall, 1) > before
+        if not skipped.any():
+            return utc
+        times = self._ticks(self._table(utc, 0).times)
+        return np.where(skipped, times[np.maximum(np.searchsorted(times, utc, side="right") - 1, 0)], utc)
+
+
+_Zone = Union[_FixedZone, _TransitionZone]
+
+
+def _get_zone(tz: TimezoneLike, ticks_per_second: int) -> _Zone:
+    if tz is None:
+        return _FixedZone(0)
+    _tz = zoneinfo.ZoneInfo(tz) if isinstance(tz, str) else tz
+    offset = fixed_offset(_tz)
+    if offset is not None:
+        return _FixedZone(offset // datetime.timedelta(microseconds=1) * ticks_per_second // 1_000_000)
+    return _TransitionZone(_tz, ticks_per_second)
+
+
+class _Kernel:
+    """Applies snaptime operations to arrays of local wall times.
+
+    As with `pendulum`, each element carries a `fold` which decides how ambiguous and skipped wall times resolve.
+    """
+
+    def __init__(self, zone: _Zone, ticks_per_second: int) -> None:
+        self.zone = zone
+        self.ticks_per_second = ticks_per_second
+        self.ticks_per_day = 86400 * ticks_per_second
+
+    def from_utc(self, utc: NDArray[np.int64]) -> tuple[NDArray[np.int64], NDArray[np.int8]]:
+        if self.zone.fixed:
+            return utc + self.zone.utc_offsets(utc), np.zeros(len(utc), dtype=np.int8)
+        offsets = self.zone.utc_offsets(utc)
+        wall = utc + offsets
+        # the second occurrence of an ambiguous wall time has `fold=1`
+        fold = (self.zone.wall_offsets(wall, 0) != offsets).astype(np.int8)
+        return wall, fold
+
+    def to_utc(self, wall: NDArray[np.int64], fold: NDArray[np.int8]) -> NDArray[np.int64]:
+        return wall - self.zone.wall_offsets(wall, fold)
+
+    def localize(
+        self, wall: NDArray[np.int64], fold: NDArray[np.int8] | int
+    ) -> tuple[NDArray[np.int64], NDArray[np.int8]]:
+        _fold = np.broadcast_to(np.int8(fold), wall.shape) if isinstance(fold, int) else fold
+        if self.zone.fixed:
+            return wall, _fold
+        before = self.zone.wall_offsets(wall, 0)
+        after = self.zone.wall_offsets(wall, 1)
+        skipped = after > before
+        if not skipped.any():
+            return wall, _fold
+        # skipped wall times are moved forwards (`fold=1`) or backwards (`fold=0`) by the size of the gap
+        shift = np.where(_fold == 1, after - before, before - after)
+        return np.where(skipped, wall + shift, wall), np.where(skipped, 0, _fold).astype(np.int8)
+
+    def _snap_day(self, wall: NDArray[np.int64], fold: NDArray[np.int8]) -> tuple[NDArray[np.int64], NDArray[np.int8]]:
+        return self.localize(wall - wall % self.ticks_per_day, fold)
+
+    def _snap_week(self, wall: NDArray[np.int64], fold: NDArray[np.int8]) -> tuple[NDArray[np.int64], NDArray[np.int8]]:
+        # mirrors `pendulum`: snap to the day, step back a day at a time until monday, then snap to the day again
+        pending = _civil.weekday(wall // self.ticks_per_day) != 0
+        wall, fold = self._snap_day(wall, fold)
+        while pending.any():
+            stepped = wall[pending] - self.ticks_per_day
+            wall_pending, fold_pending = self.localize(stepped, 1)
+            # a whole skipped day (e.g Pacific/Apia in 2011) is shifted forwards to the day `pendulum` stepped back
+            # from, which it loops on forever, so keep stepping back from the skipped day
+            skipped = wall_pending // self.ticks_per_day != stepped // self.ticks_per_day
+            wall_pending[skipped] = stepped[skipped]
+            wall, fold = wall.copy(), fold.copy()
+            wall[pending], fold[pending] = wall_pending, fold_pending
+            pending &= _civil.weekday(wall // self.ticks_per_day) != 0
+        return self._snap_day(wall, fold)
+
+    def _snap_month(
+        self, wall: NDArray[np.int64], fold: NDArray[np.int8], months: int
+    ) -> tuple[NDArray[np.int64], NDArray[np.int8]]:
+        year, month, _ = _civil.civil_from_days(wall // self.ticks_per_day)
+        month = (month - 1) // months * months + 1
+        return self.localize(_civil.days_from_civil(year, month, 1) * self.ticks_per_day, fold)
+
+    def snap(
+        self, unit: Unit, wall: NDArray[np.int64], fold: NDArray[np.int8]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int8]]:
+        if unit in _SNAP_SECONDS:
+            ticks = _SNAP_SECONDS[unit] * self.ticks_per_second
+            return self.localize(wall - wall % ticks, fold)
+        if unit == Unit.WEEK:
+            return self._snap_week(wall, fold)
+        if unit == Unit.MONTH:
+            return self._snap_month(wall, fold, 1)
+        if unit == Unit.QUARTER:
+            return self._snap_month(wall, fold, 3)
+        if unit == Unit.YEAR:
+            return self._snap_month(wall, fold, 12)
+        raise ValueError("Snaptime string is invalid: cannot snap to the given unit.")  # pragma: no cover
+
+    def delta(
+        self, unit: Unit, time_int: int, wall: NDArray[np.int64], fold: NDArray[np.int8]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int8]]:
+        if unit in _DELTA_MICROSECONDS or not time_int:
+            # fixed durations, and zero deltas of any unit, are added to the UTC time, as `pendulum` does
+            size = _DELTA_MICROSECONDS.get(unit, 0)
+            utc = self.to_utc(wall, fold) + time_int * size * self.ticks_per_second // 1_000_000
+            return self.from_utc(utc)
+        # calendar units are added to the wall time, then resolved with `fold=1`
+        if unit in _DELTA_DAYS:
+            return self.localize(wall + time_int * _DELTA_DAYS[unit] * self.ticks_per_day, 1)
+        days, time = np.divmod(wall, self.ticks_per_day)
+        days = _civil.add_months(days, time_int * _DELTA_MONTHS[unit])
+        return self.localize(days * self.ticks_per_day + time, 1)
+
+    def run(self, operations: tuple[Operation, ...], utc: NDArray[np.int64]) -> NDArray[np.int64]:
+        wall, fold = self.from_utc(utc)
+        for operation in operations:
+            if operation.action == Action.SNAP:
+                wall, fold = self.snap(operation.unit, wall, fold)
+            elif operation.action == Action.ADD:
+                wall, fold = self.delta(operation.unit, operation.time_int or 0, wall, fold)
+            elif operation.action == Action.SUB:
+                wall, fold = self.delta(operation.unit, -(operation.time_int or 0), wall, fold)
+        return self.to_utc(wall, fold)
+
+
+def _ticks_per_second(arr: NDArray[Any]) -> int:
+    unit = np.datetime_data(arr.dtype)[0] if arr.dtype.kind == "M" else None
+    if unit not in _TICKS_PER_SECOND or np.datetime_data(arr.dtype)[1] != 1:
+        raise TypeError("Invalid array type. Must be datetime64[us] or datetime64[ns].")
+    return _TICKS_PER_SECOND[unit]
+
+
+def _to_ticks(value: DatetimeLike, dtype: np.dtype[Any]) -> int:
+    # aware datetimes are UTC instants, anything else is read like the elements of an array
+    if isinstance(value, datetime.datetime) and value.utcoffset() is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    ticks = int(np.datetime64(value).astype(dtype).view(np.int64))
+    if ticks == _NAT:
+        raise ValueError("Boundaries must not be NaT.")
+    return ticks
+
+
+def _snap_ticks(
+    arr: NDArray[np.datetime64], plan: SnapPlan, tz: TimezoneLike, ticks_per_second: int
+) -> NDArray[np.int64]:
+    kernel = _Kernel(_get_zone(tz, ticks_per_second), ticks_per_second)
+    operations = plan.fixed_offset_operations if kernel.zone.fixed else plan.operations
+    ticks = arr.view(np.int64).reshape(-1)
+    valid = ticks != _NAT
+    if valid.all():
+        return kernel.run(operations, ticks)
+    result = np.full_like(ticks, _NAT)
+    result[valid] = kernel.run(operations, ticks[valid])
+    return result
+
+
+def snap_array(
+    arr: ArrayLike,
+    snap: str | SnapPlan,
+    tz: TimezoneLike = None,
+    out: NDArray[np.datetime64] | None = None,
+) -> NDArray[np.datetime64]:
+    """Transform an array of datetimes using relative time modifiers.
+
+    The results match applying `snap` to each element as a `pendulum.DateTime`. `NaT` elements are passed through.
+
+    Args:
+        arr (ArrayLike): A `datetime64[us]` or `datetime64[ns]` array. Without `tz` the elements are naive datetimes,
+            otherwise they are UTC instants.
+        snap (str | SnapPlan): The snaptime string, or compiled plan, defining the relative time transformation.
+        tz (str | datetime.tzinfo | None): The timezone to snap in, e.g `Europe/London`. The results are UTC instants.
+        out (NDArray[np.datetime64] | None): An optional array, of the same shape and dtype as `arr`, to write the
+            results to.
+
+    Returns:
+        NDArray[np.datetime64]: The resulting snapped datetimes.
+    """
+    _arr = np.asarray(arr)
+    ticks_per_second = _ticks_per_second(_arr)
+    if out is not None and (out.shape != _arr.shape or out.dtype != _arr.dtype):
+        raise ValueError("Output array must have the same shape and dtype as the input array.")
+    plan = snap if isinstance(snap, SnapPlan) else parsers.compile(snap)
+
+    recorder = instrumentation.recorder
+    if recorder is None:
+        result = _snap_ticks(_arr, plan, tz, ticks_per_second)
+    else:
+        start = time.perf_counter_ns()
+        result = _snap_ticks(_arr, plan, tz, ticks_per_second)
+        recorder.record("apply.array", time.perf_counter_ns() - start)
+
+    snapped = result.view(_arr.dtype).reshape(_arr.shape)
+    if out is None:
+        return snapped
+    out[...] = snapped
+    return out
+
+
+def _range_block(
+    kernel: _Kernel, step: Operation, first: NDArray[np.int64], steps: NDArray[np.int64]
+) -> NDArray[np.int64]:
+    time_int = steps * ((step.time_int or 0) * (-1 if step.action == Action.SUB else 1))
+    if step.unit in _DELTA_MICROSECONDS:
+        return first + time_int * (_DELTA_MICROSECONDS[step.unit] * kernel.ticks_per_second // 1_000_000)
+    wall, _ = kernel.from_utc(first)
+    if step.unit in _DELTA_DAYS:
+        wall = wall + time_int * _DELTA_DAYS[step.unit] * kernel.ticks_per_day
+    else:
+        days, time = np.divmod(wall, kernel.ticks_per_day)
+        wall = _civil.add_months(days, time_int * _DELTA_MONTHS[step.unit]) * kernel.ticks_per_day + time
+    result = kernel.to_utc(*kernel.localize(wall, 1))
+    # the first boundary is the aligned start itself
+    return np.where(steps == 0, first, result)
+
+
+def snap_range_array(  # noqa: PLR0913
+    start: DatetimeLike,
+    end: DatetimeLike,
+    step: str | SnapPlan,
+    align: str | SnapPlan | None = None,
+    *,
+    tz: TimezoneLike = None,
+    unit: str = "us",
+) -> NDArray[np.datetime64]:
+    """Generate the boundaries from an aligned start up to an end as an array.
+
+    The boundaries match `python_snaptime.ranges.snap_range`, computed in bulk without creating a datetime per
+    boundary. Use `.view("int64")` for the ticks since the epoch.
+
+    Args:
+        start (str | datetime.datetime | np.datetime64): The start of the range, the first boundary once aligned.
+            Aware datetimes are converted to UTC, anything else is read like the elements of `snap_array`.
+        end (str | datetime.datetime | np.datetime64): The end of the range, exclusive.
+        step (str | SnapPlan): The time delta between boundaries, e.g `+15m` or `15m`. A negative step, e.g `-1d`,
+            gives a descending range.
+        align (str | SnapPlan | None): A snaptime string, or compiled plan, to align the start with, e.g `@h`.
+        tz (str | datetime.tzinfo | None): The timezone to align and step in, e.g `Europe/London`. The boundaries are
+            UTC instants.
+        unit (str): The unit of the array, `us` or `ns`.
+
+    Returns:
+        NDArray[np.datetime64]: The boundaries, as a `datetime64[us]` or `datetime64[ns]` array.
+    """
+    from python_snaptime.ranges import _parse_step  # noqa: PLC0415
+
+    dtype = np.dtype(f"datetime64[{unit}]")
+    ticks_per_second = _ticks_per_second(np.empty(0, dtype=dtype))
+    operation = _parse_step(step)
+    kernel = _Kernel(_get_zone(tz, ticks_per_second), ticks_per_second)
+    first = np.array([_to_ticks(start, dtype)], dtype=np.int64)
+    if align is not None:
+        plan = align if isinstance(align, SnapPlan) else parsers.compile(align)
+        first = kernel.run(plan.fixed_offset_operations if kernel.zone.fixed else plan.operations, first)
+    stop = _to_ticks(end, dtype)
+    descending = operation.action == Action.SUB
+
+    # boundaries are generated in growing blocks until one reaches the end
+    blocks: list[NDArray[np.int64]] = []
+    done, size = 0, 64
+    while True:
+        ticks = _range_block(kernel, operation, first, np.arange(done, done + size, dtype=np.int64))
+        inside = ticks > stop if descending else ticks < stop
+        count = size if inside.all() else int(np.argmin(inside))
+        blocks.append(ticks[:count])
+        if count < size:
+            break
+        done, size = done + size, min(size * 2, 1 << 20)
+    return np.concatenate(blocks).view(dtype)
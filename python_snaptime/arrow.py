@@ -0,0 +1,108 @@
+"""Module for snapping Apache Arrow timestamp arrays.
+
+The `int64` values of a `TimestampArray` are read in place as a `datetime64` array and snapped with
+`python_snaptime.arrays`, in the timezone of the column, and the snapped values are wrapped in a new Arrow array of the
+same type without another copy. Null values are passed through.
+
+```python
+import pyarrow.parquet as pq
+from python_snaptime.arrow import snap_arrow
+
+table = pq.read_table("events.parquet")
+table = table.append_column("hour", snap_arrow(table["timestamp"], "@h"))
+```
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+import zoneinfo
+from typing import TYPE_CHECKING, TypeVar
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as e:  # pragma: no cover
+    raise ImportError("python_snaptime.arrow requires pyarrow: `pip install python-snaptime[arrow]`.") from e
+
+import numpy as np
+
+from python_snaptime import parsers
+from python_snaptime.arrays import _NAT, snap_array
+from python_snaptime.plans import SnapPlan
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+__all__ = ["snap_arrow"]
+
+_A = TypeVar("_A", pa.TimestampArray, pa.ChunkedArray)
+
+# `s` and `ms` values are snapped as microseconds, `us` and `ns` values in place
+_SNAP_UNITS = {"s": "us", "ms": "us", "us": "us", "ns": "ns"}
+_OFFSET_PATTERN = re.compile(r"([+-])(\d{2}):(\d{2})")
+
+
+def _timezone(tz: str | None) -> datetime.tzinfo | None:
+    # Arrow timezones are IANA names or fixed offsets, e.g `+05:30`
+    if tz is None:
+        return None
+    match = _OFFSET_PATTERN.fullmatch(tz)
+    if match is None:
+        return zoneinfo.ZoneInfo(tz)
+    sign, hours, minutes = match.groups()
+    offset = datetime.timedelta(hours=int(hours), minutes=int(minutes))
+    return datetime.timezone(-offset if sign == "-" else offset)
+
+
+def _values(arr: pa.TimestampArray) -> NDArray[np.int64]:
+    # a view of the data buffer, without copying it
+    return np.frombuffer(arr.buffers()[1], dtype=np.int64, count=len(arr), offset=arr.offset * 8)
+
+
+def _snap_chunk(arr: pa.TimestampArray, plan: SnapPlan) -> pa.TimestampArray:
+    unit = arr.type.unit
+    values = _values(arr)
+    if arr.null_count:
+        # the values of null slots are undefined, so they are snapped as `NaT`
+        values = np.where(pc.is_valid(arr).to_numpy(zero_copy_only=False), values, _NAT)
+    dtype = np.dtype(f"datetime64[{unit}]")
+    snap_dtype = np.dtype(f"datetime64[{_SNAP_UNITS[unit]}]")
+    snapped = snap_array(values.view(dtype).astype(snap_dtype, copy=False), plan, tz=_timezone(arr.type.tz))
+    result = snapped.astype(dtype, copy=False)
+    if result is not snapped and (result.astype(snap_dtype).view(np.int64) != snapped.view(np.int64)).any():
+        msg = f"Snapped datetimes cannot be represented with the `{unit}` resolution of the input."
+        raise ValueError(msg)
+
+    # the validity bitmap of the input is reused, unless the input is a slice which does not start at its first bit
+    validity = None
+    if arr.null_count:
+        validity = arr.buffers()[0] if arr.offset == 0 else pc.is_valid(arr).buffers()[1]
+    return pa.Array.from_buffers(arr.type, len(arr), [validity, pa.py_buffer(result.view(np.int64))], arr.null_count)
+
+
+def snap_arrow(arr: _A, snap: str | SnapPlan) -> _A:
+    """Transform an Arrow timestamp array using relative time modifiers.
+
+    The results match applying `snap` to each element as a `pendulum.DateTime`, in the timezone of the array. Values of
+    arrays without a timezone are naive datetimes.
+
+    Args:
+        arr (pa.TimestampArray | pa.ChunkedArray): The timestamps, of any unit, e.g a column of a `pyarrow.Table`.
+        snap (str | SnapPlan): The snaptime string, or compiled plan, defining the relative time transformation.
+
+    Raises:
+        TypeError: If the array is not a timestamp array.
+        ValueError: If a snapped timestamp cannot be represented with the unit of the array, e.g `+1ms` on seconds.
+
+    Returns:
+        pa.TimestampArray | pa.ChunkedArray: The resulting snapped timestamps, in a new array of the same type and
+            chunks, with the same nulls.
+    """
+    if not pa.types.is_timestamp(arr.type):
+        raise TypeError("Invalid array type. Must be an Arrow timestamp array.")
+    plan = snap if isinstance(snap, SnapPlan) else parsers.compile(snap)
+    if isinstance(arr, pa.ChunkedArray):
+        return pa.chunked_array([_snap_chunk(chunk, plan) for chunk in arr.chunks], type=arr.type)
+    return _snap_chunk(arr, plan)
@@ -0,0 +1,132 @@
+"""Module for bucketing NumPy `datetime64` arrays by snap units.
+
+The buckets of a unit are the periods that timestamps snap to, e.g `@h` or `@d`, and `15m` groups every 15
+consecutive `@m` buckets. Bucket indices are computed in bulk with integer arithmetic, without creating a datetime per
+element. Calendar units count wall-clock days, weeks, months, quarters and years, so e.g a day is 23 or 25 hours long
+across a DST transition.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError("python_snaptime.buckets requires numpy: `pip install python-snaptime[numpy]`.") from e
+
+from python_snaptime import _civil
+from python_snaptime.arrays import _NAT, _get_zone, _Kernel, _ticks_per_second, _to_ticks
+from python_snaptime.models import Unit, _resolve_unit
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from python_snaptime.arrays import DatetimeLike, TimezoneLike
+
+__all__ = ["bucket_ids", "histogram"]
+
+_BUCKET_UNIT_PATTERN = re.compile(r"@?(\d*)([a-z]+)")
+_SNAP_SECONDS = {Unit.SECOND: 1, Unit.MINUTE: 60, Unit.HOUR: 3600}
+_MONTHS = {Unit.MONTH: 1, Unit.QUARTER: 3, Unit.YEAR: 12}
+
+
+def _parse_unit(unit: Unit | str) -> tuple[int, Unit]:
+    if isinstance(unit, Unit):
+        size, _unit = 1, unit
+    else:
+        match = _BUCKET_UNIT_PATTERN.fullmatch(unit)
+        if match is None:
+            msg = f"Invalid bucket unit `{unit}`."
+            raise ValueError(msg)
+        size, _unit = int(match.group(1) or 1), _resolve_unit(match.group(2))
+    if _unit in (Unit.MICROSECOND, Unit.MILLISECOND) or size < 1:
+        msg = f"Invalid bucket unit `{unit}`: must be a positive multiple of a snap unit."
+        raise ValueError(msg)
+    return size, _unit
+
+
+def _ordinals(kernel: _Kernel, unit: Unit, utc: NDArray[np.int64]) -> NDArray[np.int64]:
+    # the number of the bucket each timestamp snaps to, counted from the epoch
+    wall, fold = kernel.from_utc(utc)
+    if unit in _SNAP_SECONDS:
+        # a snap to the hour is ambiguous when the clocks go back, so buckets are counted in UTC
+        size = _SNAP_SECONDS[unit] * kernel.ticks_per_second
+        return kernel.to_utc(*kernel.snap(unit, wall, fold)) // size
+    days = wall // kernel.ticks_per_day
+    if unit == Unit.DAY:
+        return days
+    if unit == Unit.WEEK:
+        return (days - _civil.weekday(days)) // 7
+    year, month, _ = _civil.civil_from_days(days)
+    return (year * 12 + month - 1) // _MONTHS[unit]
+
+
+class _Bucketer:
+    """Assigns bucket indices, relative to the bucket of an origin, to arrays of ticks."""
+
+    def __init__(self, arr: NDArray[np.datetime64], unit: Unit | str, tz: TimezoneLike) -> None:
+        self.size, self.unit = _parse_unit(unit)
+        ticks_per_second = _ticks_per_second(arr)
+        self.kernel = _Kernel(_get_zone(tz, ticks_per_second), ticks_per_second)
+
+    def ids(self, ticks: NDArray[np.int64], origin: int) -> NDArray[np.int64]:
+        ordinals = _ordinals(self.kernel, self.unit, np.append(ticks, origin))
+        return (ordinals[:-1] - ordinals[-1]) // self.size
+
+
+def bucket_ids(
+    arr: ArrayLike, unit: Unit | str, origin: DatetimeLike | None = None, tz: TimezoneLike = None
+) -> NDArray[np.int64]:
+    """Get the index of the bucket each timestamp of an array falls in.
+
+    Args:
+        arr (ArrayLike): A `datetime64[us]` or `datetime64[ns]` array. Without `tz` the elements are naive datetimes,
+            otherwise they are UTC instants.
+        unit (Unit | str): The bucket unit, e.g `Unit.HOUR`, `d` or `15m`.
+        origin (str | datetime.datetime | np.datetime64 | None): A timestamp in bucket `0`, defaults to the epoch. For
+            multiples of a unit, e.g `15m`, the buckets are aligned to the bucket of the origin.
+        tz (str | datetime.tzinfo | None): The timezone to bucket in, e.g `Europe/London`.
+
+    Returns:
+        NDArray[np.int64]: The bucket indices, of the same shape as `arr`. `NaT` elements give the minimum `int64`.
+    """
+    _arr = np.asarray(arr)
+    bucketer = _Bucketer(_arr, unit, tz)
+    ticks = _arr.view(np.int64).reshape(-1)
+    start = 0 if origin is None else _to_ticks(origin, _arr.dtype)
+    valid = ticks != _NAT
+    if valid.all():
+        return bucketer.ids(ticks, start).reshape(_arr.shape)
+    ids = np.full_like(ticks, _NAT)
+    ids[valid] = bucketer.ids(ticks[valid], start)
+    return ids.reshape(_arr.shape)
+
+
+def histogram(
+    arr: ArrayLike, unit: Unit | str, start: DatetimeLike, end: DatetimeLike, tz: TimezoneLike = None
+) -> NDArray[np.int64]:
+    """Count the timestamps of an array in each bucket from `start` up to `end`.
+
+    Args:
+        arr (ArrayLike): A `datetime64[us]` or `datetime64[ns]` array. Without `tz` the elements are naive datetimes,
+            otherwise they are UTC instants.
+        unit (Unit | str): The bucket unit, e.g `Unit.HOUR`, `d` or `15m`.
+        start (str | datetime.datetime | np.datetime64): The first timestamp counted, in the first bucket.
+        end (str | datetime.datetime | np.datetime64): The end of the counted timestamps, exclusive.
+        tz (str | datetime.tzinfo | None): The timezone to bucket in, e.g `Europe/London`.
+
+    Returns:
+        NDArray[np.int64]: The number of timestamps in each bucket, from the bucket of `start` to the bucket of the
+            last timestamp before `end`. `NaT` elements are not counted.
+    """
+    _arr = np.asarray(arr)
+    bucketer = _Bucketer(_arr, unit, tz)
+    first, stop = _to_ticks(start, _arr.dtype), _to_ticks(end, _arr.dtype)
+    if stop <= first:
+        return np.zeros(0, dtype=np.int64)
+    ticks = _arr.view(np.int64).reshape(-1)
+    ticks = ticks[(ticks >= first) & (ticks < stop)]
+    ids = bucketer.ids(np.append(ticks, stop - 1), first)
+    return np.bincount(ids[:-1], minlength=int(ids[-1]) + 1).astype(np.int64)
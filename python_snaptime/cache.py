@@ -0,0 +1,303 @@
+"""Module defining the bounded caches used by python-snaptime."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Generic, NamedTuple, TypeVar
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics describing the usage of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[_K, _V]):
+    """A bounded, thread-safe, least recently used cache with hit/miss/eviction statistics."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialise the cache.
+
+        Args:
+            maxsize (int): The maximum number of entries to hold. `0` disables the cache.
+        """
+        self._data: OrderedDict[_K, _V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = self._verify_maxsize(maxsize)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _verify_maxsize(maxsize: int) -> int:
+        if maxsize < 0:
+            raise ValueError("Cache size must be a positive integer or zero.")
+        return maxsize
+
+    @property
+    def maxsize(self) -> int:
+        """int: The maximum number of entries held by the cache."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = self._verify_maxsize(maxsize)
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, key: _K) -> _V | None:
+        """Get an entry from the cache, marking it as most recently used.
+
+        Args:
+            key (_K): The key of the entry.
+
+        Returns:
+            _V | None: The cached value, or `None` if the key is not cached.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Add an entry to the cache, evicting the least recently used entries if full.
+
+        Args:
+            key (_K): The key of the entry.
+            value (_V): The value to cache.
+        """
+        with self._lock:
+            if not self._maxsize:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def setdefault(self, key: _K, value: _V) -> _V:
+        """Get an entry from the cache, adding it if the key is not cached.
+
+        Unlike `get`, the cache statistics are not updated.
+
+        Args:
+            key (_K): The key of the entry.
+            value (_V): The value to cache if the key is not cached.
+
+        Returns:
+            _V: The cached value.
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+            if not self._maxsize:
+                return value
+            self._data[key] = value
+            self._evict()
+            return value
+
+    def info(self) -> CacheInfo:
+        """Get the cache statistics.
+
+        Returns:
+            CacheInfo: The hits, misses, evictions, maximum size and current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache and reset its statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._data)
+
+
+class _Front:
+    """The entries a thread has looked up in a `ThreadLocalCache`, and its hits, for one generation of the cache."""
+
+    __slots__ = ("data", "epoch", "generation", "hits", "touched")
+
+    def __init__(self, generation: int, epoch: int) -> None:
+        self.data: dict[Any, Any] = {}
+        self.generation = generation
+        self.epoch = epoch
+        self.hits = 0
+        # the keys hit since the recency of the shared cache was last updated
+        self.touched: list[Any] = []
+
+
+class _Token:
+    """An object living as long as the thread-local state of a thread, to retire its front when the thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+class ThreadLocalCache(LRUCache[_K, _V]):
+    """A bounded, least recently used cache read without locks, through a front cache per thread.
+
+    Each thread first looks entries up in a plain dict only it uses, so threads looking up cached entries neither take
+    a lock nor write to shared memory, which keeps them from contending on free-threaded builds. Only lookups missing
+    the front of a thread go through the shared, locked cache. Values are shared by threads, so they must be immutable.
+
+    The keys hit in a front are marked as recently used in the shared cache in batches, taking its lock once per batch.
+    Evicting, clearing or resizing the shared cache empties and invalidates the fronts of all threads, so they never
+    hold entries which are no longer cached. The hits of the fronts are counted in the statistics of the cache.
+    """
+
+    _TOUCH_BATCH = 32
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialise the cache.
+
+        Args:
+            maxsize (int): The maximum number of entries to hold. `0` disables the cache.
+        """
+        super().__init__(maxsize)
+        self._local = threading.local()
+        # the generation invalidates the fronts, the epoch the hits counted before the cache was last cleared
+        self._generation = 0
+        self._epoch = 0
+        self._fronts: set[_Front] = set()
+        self._retired_hits = 0
+
+    @LRUCache.maxsize.setter
+    def maxsize(self, maxsize: int) -> None:  # noqa: D102
+        with self._lock:
+            self._maxsize = self._verify_maxsize(maxsize)
+            self._evict()
+            self._invalidate()
+
+    def _evict(self) -> None:
+        evictions = self._evictions
+        super()._evict()
+        if self._evictions != evictions:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        # called with the lock held; the data of other threads is only written here, when entries stop being cached
+        self._generation += 1
+        for front in self._fronts:
+            front.data.clear()
+
+    def _front(self) -> _Front:
+        front: _Front | None = getattr(self._local, "front", None)
+        if front is not None and front.generation == self._generation:
+            return front
+        with self._lock:
+            front = _Front(self._generation, self._epoch)
+            self._fronts.add(front)
+        # the finalizer of the token replaced here, or of the last token of the thread, retires the front it guards
+        token = _Token()
+        weakref.finalize(token, self._retire, front)
+        self._local.front, self._local.token = front, token
+        return front
+
+    def _retire(self, front: _Front) -> None:
+        with self._lock:
+            self._fronts.discard(front)
+            if front.epoch == self._epoch:
+                self._retired_hits += front.hits
+
+    def _remember(self, front: _Front, key: _K, value: _V) -> None:
+        if self._maxsize and front.generation == self._generation:
+            front.data[key] = value
+
+    def _touch(self, front: _Front) -> None:
+        with self._lock:
+            for key in front.touched:
+                if key in self._data:
+                    self._data.move_to_end(key)
+        front.touched.clear()
+
+    def get(self, key: _K) -> _V | None:
+        """Get an entry from the front of the thread, or from the shared cache, marking it as most recently used.
+
+        Args:
+            key (_K): The key of the entry.
+
+        Returns:
+            _V | None: The cached value, or `None` if the key is not cached.
+        """
+        front = self._front()
+        value = front.data.get(key)
+        if value is not None:
+            front.hits += 1
+            front.touched.append(key)
+            if len(front.touched) >= self._TOUCH_BATCH:
+                self._touch(front)
+            return value
+        value = super().get(key)
+        if value is not None:
+            self._remember(front, key, value)
+        return value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Add an entry to the cache, evicting the least recently used entries if full.
+
+        Args:
+            key (_K): The key of the entry.
+            value (_V): The value to cache.
+        """
+        super().put(key, value)
+        self._remember(self._front(), key, value)
+
+    def setdefault(self, key: _K, value: _V) -> _V:
+        """Get an entry from the cache, adding it if the key is not cached.
+
+        Unlike `get`, the cache statistics are not updated.
+
+        Args:
+            key (_K): The key of the entry.
+            value (_V): The value to cache if the key is not cached.
+
+        Returns:
+            _V: The cached value.
+        """
+        value = super().setdefault(key, value)
+        self._remember(self._front(), key, value)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Get the cache statistics, including the hits of the fronts of all threads.
+
+        Returns:
+            CacheInfo: The hits, misses, evictions, maximum size and current size of the cache.
+        """
+        with self._lock:
+            front_hits = sum(front.hits for front in self._fronts if front.epoch == self._epoch)
+            hits = self._hits + self._retired_hits + front_hits
+            return CacheInfo(hits, self._misses, self._evictions, self._maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache and the fronts of all threads, and reset its statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._retired_hits = 0
+            self._epoch += 1
+            self._invalidate()
@@ -0,0 +1,179 @@
+"""Module for indexing the month, quarter and year starts of a timezone.
+
+A `CalendarIndex` holds the sorted UTC instants at which each month, quarter and year starts in a timezone over a range
+of datetimes. Snapping to `@mon`, `@q` or `@y` is then a binary search over the index instead of calendar arithmetic
+per datetime, and the same index serves single datetimes and `datetime64` arrays.
+"""
+
+from __future__ import annotations
+
+import datetime
+import zoneinfo
+from typing import TYPE_CHECKING, Any, overload
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError("python_snaptime.calendars requires numpy: `pip install python-snaptime[numpy]`.") from e
+
+from python_snaptime import _civil
+from python_snaptime.arrays import _NAT, _get_zone, _Kernel, _scale, _ticks_per_second, _to_ticks
+from python_snaptime.models import Unit, _resolve_unit
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from python_snaptime.arrays import DatetimeLike, TimezoneLike
+
+__all__ = ["CalendarIndex"]
+
+_SECONDS = np.dtype("datetime64[s]")
+_MICROSECONDS = np.dtype("datetime64[us]")
+_MONTHS = {Unit.MONTH: 1, Unit.QUARTER: 3, Unit.YEAR: 12}
+
+
+def _parse_unit(unit: Unit | str) -> Unit:
+    _unit = _resolve_unit(unit if isinstance(unit, Unit) else unit.removeprefix("@"))
+    if _unit not in _MONTHS:
+        msg = f"Invalid calendar unit `{unit}`: must be a month, quarter or year."
+        raise ValueError(msg)
+    return _unit
+
+
+def _month_ordinal(seconds: int) -> int:
+    year, month, _ = _civil.civil_from_days(seconds // 86400)
+    return year * 12 + month - 1
+
+
+class _Periods:
+    """The periods of a calendar unit, in seconds since the epoch."""
+
+    def __init__(
+        self, walls: NDArray[np.int64], starts: NDArray[np.int64], snaps: tuple[NDArray[np.int64], NDArray[np.int64]]
+    ) -> None:
+        # `walls` are the wall times the periods start at, `starts` the first instants of each period, and `snaps` the
+        # results of snapping to it with `fold=0` and `fold=1`, which differ when its wall time is ambiguous or skipped
+        self.walls = walls
+        self.starts = starts
+        self.snaps = snaps
+
+
+class CalendarIndex:
+    """The sorted UTC instants of the month, quarter and year starts of a timezone over a range of datetimes.
+
+    Snapping with the index gives the same results as `snap` with `@mon`, `@q` or `@y`, including DST `fold` handling,
+    for any datetime within the range. The index is immutable and can be shared between threads.
+    """
+
+    __slots__ = ("_kernel", "_periods", "_tz", "_tzinfo")
+
+    def __init__(self, tz: TimezoneLike, start: DatetimeLike, end: DatetimeLike) -> None:
+        """Initialise the index.
+
+        Args:
+            tz (str | datetime.tzinfo | None): The timezone to snap in, e.g `Europe/London`. `None` for naive
+                datetimes.
+            start (str | datetime.datetime | np.datetime64): The first datetime of the range. Aware datetimes are
+                converted to UTC, anything else is read like the elements of `snap_array`.
+            end (str | datetime.datetime | np.datetime64): The last datetime of the range, inclusive.
+        """
+        first, last = _to_ticks(start, _SECONDS), _to_ticks(end, _SECONDS)
+        if last < first:
+            raise ValueError("The end of a calendar index must not be before its start.")
+        self._tz = tz
+        self._tzinfo = zoneinfo.ZoneInfo(tz) if isinstance(tz, str) else tz
+        self._kernel = _Kernel(_get_zone(tz, 1), 1)
+
+        # wall times differ from UTC by less than a day, and the start of the year after the range ends the last period
+        ordinals = np.arange(
+            _month_ordinal(first - 86400) // 12 * 12, (_month_ordinal(last + 86400) // 12 + 1) * 12 + 1, dtype=np.int64
+        )
+        wall = _civil.days_from_civil(ordinals // 12, ordinals % 12 + 1, 1) * 86400
+        starts = self._kernel.zone.first_instants(wall)
+        snaps = tuple(self._kernel.to_utc(*self._kernel.localize(wall, fold)) for fold in (0, 1))
+        self._periods = {}
+        for unit, months in _MONTHS.items():
+            selected = ordinals % months == 0
+            self._periods[unit] = _Periods(wall[selected], starts[selected], (snaps[0][selected], snaps[1][selected]))
+
+    @property
+    def tz(self) -> TimezoneLike:
+        """str | datetime.tzinfo | None: The timezone of the index."""  # noqa: D403
+        return self._tz
+
+    def _is_zone(self, tz: datetime.tzinfo | None) -> bool:
+        if tz is None or self._tzinfo is None:
+            return False
+        if isinstance(tz, zoneinfo.ZoneInfo) and isinstance(self._tzinfo, zoneinfo.ZoneInfo):
+            # e.g a `pendulum` timezone and the `zoneinfo` timezone of the same key
+            return tz.key == self._tzinfo.key
+        return tz is self._tzinfo
+
+    def starts(self, unit: Unit | str) -> NDArray[np.datetime64]:
+        """Get the sorted UTC instants at which the periods of a unit start.
+
+        Args:
+            unit (Unit | str): The calendar unit, `mon`, `q` or `y`.
+
+        Returns:
+            NDArray[np.datetime64]: The instants, as a `datetime64[s]` array, from the period before the range up to the
+                period after it.
+        """
+        return self._periods[_parse_unit(unit)].starts.view(_SECONDS)
+
+    def _snap(
+        self, unit: Unit | str, ticks: NDArray[np.int64], ticks_per_second: int, fold: int | None = None
+    ) -> NDArray[np.int64]:
+        periods = self._periods[_parse_unit(unit)]
+        starts = _scale(periods.starts, ticks_per_second)
+        if ticks.size and (ticks.min() < starts[0] or ticks.max() >= starts[-1]):
+            raise ValueError("Datetimes must be within the range of the calendar index.")
+        index = np.searchsorted(starts, ticks, side="right") - 1
+        result = _scale(periods.snaps[0], ticks_per_second)[index]
+        # the `fold` of a datetime only matters when its period starts at an ambiguous or skipped wall time, and when
+        # the clocks go back across the start of a period the repeated wall times belong to the period before it
+        varies = np.flatnonzero(periods.snaps[1][index] != periods.snaps[0][index])
+        if len(varies):
+            wall, folds = self._kernel.from_utc(ticks[varies] // ticks_per_second)
+            index = np.searchsorted(periods.walls, wall, side="right") - 1
+            snaps = np.where((folds if fold is None else fold) == 1, periods.snaps[1][index], periods.snaps[0][index])
+            result[varies] = _scale(snaps, ticks_per_second)
+        return result
+
+    @overload
+    def snap(self, values: datetime.datetime, unit: Unit | str) -> datetime.datetime: ...
+
+    @overload
+    def snap(self, values: ArrayLike, unit: Unit | str) -> NDArray[np.datetime64]: ...
+
+    def snap(self, values: datetime.datetime | ArrayLike, unit: Unit | str) -> datetime.datetime | NDArray[Any]:
+        """Snap datetimes to the start of their month, quarter or year.
+
+        Args:
+            values (pendulum.DateTime | datetime.datetime | ArrayLike): A datetime, or a `datetime64[us]` or
+                `datetime64[ns]` array. Aware datetimes are converted to the timezone of the index, anything else is
+                read like the elements of `snap_array`. `NaT` elements are passed through.
+            unit (Unit | str): The calendar unit, `mon`, `q` or `y`, optionally prefixed with `@`.
+
+        Returns:
+            pendulum.DateTime | datetime.datetime | NDArray[np.datetime64]: The snapped datetime, of the same type and
+                timezone, or array, of the same shape and dtype.
+        """
+        if isinstance(values, datetime.datetime):
+            # as with `snap`, datetimes in the timezone of the index keep their `fold`
+            fold = values.fold if self._is_zone(values.tzinfo) else None
+            (seconds,) = self._snap(unit, np.array([_to_ticks(values, _MICROSECONDS)]), 1_000_000, fold) // 1_000_000
+            if values.tzinfo is None:
+                return type(values).fromtimestamp(int(seconds), tz=datetime.timezone.utc).replace(tzinfo=None)
+            return type(values).fromtimestamp(int(seconds), tz=values.tzinfo)
+
+        _values = np.asarray(values)
+        ticks_per_second = _ticks_per_second(_values)
+        ticks = _values.view(np.int64).reshape(-1)
+        valid = ticks != _NAT
+        if valid.all():
+            result = self._snap(unit, ticks, ticks_per_second)
+        else:
+            result = np.full_like(ticks, _NAT)
+            result[valid] = self._snap(unit, ticks[valid], ticks_per_second)
+        return result.view(_values.dtype).reshape(_values.shape)
@@ -0,0 +1,238 @@
+"""Command-line interface for snapping timestamps read line by line from files or stdin.
+
+```sh
+# snap ISO-8601 timestamps to the start of the day, and to the start of the previous hour
+python -m python_snaptime -e @d -e @h-1h timestamps.txt
+
+# snap epoch milliseconds to the start of the week in a timezone
+cut -f3 events.tsv | python -m python_snaptime -e @w --tz Europe/London --unit ms
+
+# append the snapped second field of each CSV row
+python -m python_snaptime -e @mon --field 2 --delimiter , --header events.csv
+```
+
+Lines are read, snapped and written in chunks with buffered I/O, so memory use does not depend on the size of the
+input, and each snaptime string is compiled once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import datetime
+import io
+import re
+import sys
+import zoneinfo
+from typing import TYPE_CHECKING
+
+from python_snaptime import parsers
+from python_snaptime._batching import batches
+from python_snaptime.epochs import NANOSECONDS, EpochSnapper
+from python_snaptime.iso import _parse_iso
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import TextIO
+
+    from python_snaptime.plans import SnapPlan
+
+__all__ = ["main"]
+
+DEFAULT_CHUNK_SIZE = 8192
+
+_BUFFER_SIZE = 1 << 20
+_UTC = datetime.timezone.utc
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=_UTC)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_EPOCH_PATTERN = re.compile(r"-?\d+(\.\d+)?")
+
+
+class InvalidTimestampError(ValueError):
+    """Raised when a timestamp cannot be parsed."""
+
+
+def _parse_epoch(text: str, nanoseconds_per_unit: int) -> int:
+    whole, _, fraction = text.lstrip("-").partition(".")
+    nanoseconds = int(whole) * nanoseconds_per_unit + int(fraction[:9].ljust(9, "0")) * nanoseconds_per_unit // 10**9
+    return -nanoseconds if text.startswith("-") else nanoseconds
+
+
+def _format_epoch(nanoseconds: int, nanoseconds_per_unit: int) -> str:
+    sign = "-" if nanoseconds < 0 else ""
+    whole, fraction = divmod(abs(nanoseconds), nanoseconds_per_unit)
+    if not fraction:
+        return f"{sign}{whole}"
+    digits = len(str(nanoseconds_per_unit)) - 1
+    return f"{sign}{whole}.{fraction:0{digits}d}".rstrip("0")
+
+
+class _Snapper:
+    """Snaps timestamp strings with one or more compiled plans.
+
+    Epoch timestamps are snapped as integers, with the `_epoch` engine in timezones without transitions, and ISO-8601
+    timestamps as builtin datetimes, so `pendulum` is never imported for UTC, fixed offsets or `zoneinfo` timezones.
+    """
+
+    def __init__(
+        self,
+        plans: list[SnapPlan],
+        tz: datetime.tzinfo | None,
+        input_format: str,
+        output_format: str | None,
+        unit: str,
+    ) -> None:
+        self.plans = plans
+        self.tz = tz
+        self.input_format = input_format
+        self.output_format = output_format
+        self.nanoseconds_per_unit = NANOSECONDS[unit]
+        # epochs are parsed into nanoseconds, which keep their sub-microsecond precision through a plan without snaps
+        self.epoch_snappers = [EpochSnapper(plan, tz, "ns") for plan in plans]
+
+    def _format_instant(self, nanoseconds: int) -> str:
+        if self.output_format in {None, "epoch"}:
+            return _format_epoch(nanoseconds, self.nanoseconds_per_unit)
+        dtm = _EPOCH + datetime.timedelta(microseconds=nanoseconds // 1_000)
+        return dtm.astimezone(self.tz or _UTC).isoformat()
+
+    def _snap_epoch(self, text: str) -> list[str]:
+        nanoseconds = _parse_epoch(text, self.nanoseconds_per_unit)
+        return [self._format_instant(snapper.snap(nanoseconds)) for snapper in self.epoch_snappers]
+
+    def _snap_iso(self, text: str) -> list[str]:
+        dtm = _parse_iso(text)
+        if self.tz is not None:
+            dtm = dtm.replace(tzinfo=self.tz) if dtm.tzinfo is None else dtm.astimezone(self.tz)
+        results = [plan.apply(dtm) for plan in self.plans]
+        if self.output_format in {None, "iso"}:
+            return [result.isoformat() for result in results]
+        # naive timestamps are taken to be UTC
+        microseconds = [(result.replace(tzinfo=result.tzinfo or _UTC) - _EPOCH) // _MICROSECOND for result in results]
+        return [_format_epoch(value * 1_000, self.nanoseconds_per_unit) for value in microseconds]
+
+    def __call__(self, text: str) -> list[str]:
+        """Snap a timestamp with each plan.
+
+        Args:
+            text (str): The ISO-8601 or epoch timestamp.
+
+        Raises:
+            InvalidTimestampError: If the timestamp cannot be parsed.
+
+        Returns:
+            list[str]: The snapped timestamps, one per plan.
+        """
+        text = text.strip()
+        msg = f"Invalid timestamp `{text}`."
+        is_epoch = _EPOCH_PATTERN.fullmatch(text) is not None
+        if self.input_format == "epoch" and not is_epoch:
+            raise InvalidTimestampError(msg)
+        try:
+            return self._snap_epoch(text) if is_epoch and self.input_format != "iso" else self._snap_iso(text)
+        except (ValueError, OverflowError) as e:
+            raise InvalidTimestampError(msg) from e
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m python_snaptime",
+        description="Snap ISO-8601 or epoch timestamps, one per line, with snaptime strings.",
+    )
+    parser.add_argument("files", nargs="*", default=["-"], help="files to read, `-` for stdin (default: stdin)")
+    parser.add_argument(
+        "-e",
+        "--expression",
+        action="append",
+        required=True,
+        dest="expressions",
+        metavar="SNAPTIME",
+        help="snaptime string to apply, e.g `@d-2h` or `-e=-1h`; repeat to output a column per snaptime string",
+    )
+    parser.add_argument("--tz", help="IANA timezone to snap in (default: the timestamp's own, or UTC for epochs)")
+    parser.add_argument("--input-format", choices=("auto", "iso", "epoch"), default="auto", help="(default: auto)")
+    parser.add_argument("--output-format", choices=("iso", "epoch"), help="(default: the input format)")
+    parser.add_argument("--unit", choices=tuple(NANOSECONDS), default="s", help="unit of epochs (default: s)")
+    parser.add_argument("--field", type=int, help="1-based field of delimited lines to snap; results are appended")
+    parser.add_argument("--delimiter", default="\t", help="field delimiter used with --field (default: tab)")
+    parser.add_argument("--header", action="store_true", help="pass the first line of each file through with --field")
+    parser.add_argument("--skip-invalid", action="store_true", help="output empty results for invalid timestamps")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines per chunk (default: 8192)")
+    return parser
+
+
+def _snap_lines(snapper: _Snapper, source: TextIO, out: TextIO, args: argparse.Namespace) -> None:
+    lines = (line.rstrip("\r\n") for line in source)
+    for chunk in batches(enumerate(lines, 1), args.chunk_size):
+        results: list[str] = []
+        try:
+            results.extend(f"{args.delimiter.join(_snap(snapper, line, number, args))}\n" for number, line in chunk)
+        finally:
+            # the lines before an invalid timestamp are still written
+            out.write("".join(results))
+
+
+def _snap_fields(snapper: _Snapper, source: TextIO, out: TextIO, args: argparse.Namespace) -> None:
+    rows = csv.reader(source, delimiter=args.delimiter)
+    if args.header:
+        header = next(rows, None)
+        if header is not None:
+            csv.writer(out, delimiter=args.delimiter, lineterminator="\n").writerow(header + args.expressions)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=args.delimiter, lineterminator="\n")
+    for chunk in batches(enumerate(rows, 1 + args.header), args.chunk_size):
+        try:
+            for number, row in chunk:
+                text = row[args.field - 1] if len(row) >= args.field else ""
+                writer.writerow(row + _snap(snapper, text, number, args))
+        finally:
+            out.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+
+
+def _snap(snapper: _Snapper, text: str, number: int, args: argparse.Namespace) -> list[str]:
+    try:
+        return snapper(text)
+    except InvalidTimestampError as e:
+        if args.skip_invalid:
+            return [""] * len(snapper.plans)
+        msg = f"line {number}: {e}"
+        raise InvalidTimestampError(msg) from e
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command-line interface.
+
+    Args:
+        argv (Sequence[str] | None): The command-line arguments, defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.field is not None and args.field < 1:
+        parser.error("--field must be a positive integer")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive integer")
+    try:
+        plans = [parsers.compile(expression) for expression in args.expressions]
+        tz = zoneinfo.ZoneInfo(args.tz) if args.tz else None
+    except (ValueError, zoneinfo.ZoneInfoNotFoundError) as e:
+        parser.error(str(e))
+
+    snapper = _Snapper(plans, tz, args.input_format, args.output_format, args.unit)
+    snap_source = _snap_lines if args.field is None else _snap_fields
+    for path in args.files:
+        try:
+            if path == "-":
+                snap_source(snapper, sys.stdin, sys.stdout, args)
+                continue
+            with open(path, encoding="utf-8", newline="", buffering=_BUFFER_SIZE) as source:  # noqa: PTH123
+                snap_source(snapper, source, sys.stdout, args)
+        except (OSError, InvalidTimestampError) as e:
+            sys.stdout.flush()
+            print(f"{parser.prog}: {path}: {e}", file=sys.stderr)  # noqa: T201
+            return 1
+    return 0
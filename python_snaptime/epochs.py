@@ -0,0 +1,164 @@
+"""Module for snapping epoch timestamps, e.g the integer timestamps of log or message pipelines.
+
+Epoch timestamps are snapped as integers without creating datetime objects: in timezones without transitions with the
+`_epoch` engine on the wall time, and batches in other timezones with the engine of `python_snaptime.arrays` when
+`numpy` is installed. Only single timestamps in timezones with transitions, or batches without `numpy`, are snapped
+as `zoneinfo` datetimes.
+"""
+
+from __future__ import annotations
+
+import datetime
+import sys
+import zoneinfo
+from typing import TYPE_CHECKING, overload
+
+from python_snaptime import _epoch, parsers
+from python_snaptime._zones import TimezoneLike, fixed_offset
+from python_snaptime.cache import ThreadLocalCache
+from python_snaptime.models import Action
+from python_snaptime.plans import SnapPlan
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+__all__ = ["snap_epoch"]
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+# the number of nanoseconds in each epoch unit, shared with the command line like `EpochSnapper`
+NANOSECONDS = {"s": 1_000_000_000, "ms": 1_000_000, "us": 1_000, "ns": 1}
+# below this size a batch is snapped one timestamp at a time, which is faster than the array engine
+_MIN_ARRAY_SIZE = 64
+
+
+class EpochSnapper:
+    """Snaps epoch integers of a unit with a compiled plan in a timezone.
+
+    Not exported: it is the internal interface of `snap_epoch` and of the command line.
+    """
+
+    __slots__ = ("keeps_nanoseconds", "nanoseconds_per_unit", "offset", "plan", "tz")
+
+    def __init__(self, plan: SnapPlan, tz: TimezoneLike, unit: str) -> None:
+        if unit not in NANOSECONDS:
+            msg = f"Invalid epoch unit `{unit}`: must be one of s, ms, us or ns."
+            raise ValueError(msg)
+        self.plan = plan
+        self.tz = zoneinfo.ZoneInfo(tz) if isinstance(tz, str) else tz
+        self.nanoseconds_per_unit = NANOSECONDS[unit]
+        offset = fixed_offset(self.tz)
+        self.offset = None if offset is None else offset // _MICROSECOND
+        # every snap truncates to at least a second, so sub-microsecond precision only survives a plan without snaps
+        self.keeps_nanoseconds = all(operation.action != Action.SNAP for operation in plan.operations)
+
+    def _snap_microseconds(self, microseconds: int) -> int:
+        if self.offset is not None:
+            return _epoch.run(self.plan.fixed_offset_operations, microseconds + self.offset) - self.offset
+        dtm = (_EPOCH + datetime.timedelta(microseconds=microseconds)).astimezone(self.tz)
+        return (self.plan.apply(dtm) - _EPOCH) // _MICROSECOND
+
+    def snap(self, timestamp: int) -> int:
+        """Snap an epoch timestamp in the unit of the snapper."""
+        if self.nanoseconds_per_unit == 1:
+            microseconds, nanoseconds = divmod(timestamp, 1_000)
+            return self._snap_microseconds(microseconds) * 1_000 + nanoseconds * self.keeps_nanoseconds
+        # results with a fraction of the unit, e.g epoch seconds after `+500ms`, are rounded down
+        factor = self.nanoseconds_per_unit // 1_000
+        return self._snap_microseconds(timestamp * factor) // factor
+
+    def snap_array(self, timestamps: NDArray[np.int64]) -> NDArray[np.int64]:
+        """Snap an `int64` array of epoch timestamps in the unit of the snapper."""
+        from python_snaptime.arrays import _get_zone, _Kernel  # noqa: PLC0415
+
+        ticks_per_second = 1_000_000_000 if self.nanoseconds_per_unit == 1 else 1_000_000
+        kernel = _Kernel(_get_zone(self.tz, ticks_per_second), ticks_per_second)
+        operations = self.plan.fixed_offset_operations if kernel.zone.fixed else self.plan.operations
+        if self.nanoseconds_per_unit == 1:
+            return kernel.run(operations, timestamps)
+        factor = self.nanoseconds_per_unit // 1_000
+        return kernel.run(operations, timestamps * factor) // factor
+
+
+_SNAPPERS: ThreadLocalCache[tuple[str | SnapPlan, TimezoneLike, str], EpochSnapper] = ThreadLocalCache(256)
+
+
+def _get_snapper(snap: str | SnapPlan, tz: TimezoneLike, unit: str) -> EpochSnapper:
+    # the plan and the offset of the timezone are looked up once per snaptime string, timezone and unit
+    key = (snap, tz, unit)
+    snapper = _SNAPPERS.get(key)
+    if snapper is None:
+        snapper = EpochSnapper(snap if isinstance(snap, SnapPlan) else parsers.compile(snap), tz, unit)
+        _SNAPPERS.put(key, snapper)
+    return snapper
+
+
+def _has_numpy() -> bool:
+    if "numpy" in sys.modules:
+        return True
+    try:
+        import numpy  # noqa: F401, ICN001, PLC0415
+    except ImportError:  # pragma: no cover
+        return False
+    return True
+
+
+@overload
+def snap_epoch(timestamps: int, snap: str | SnapPlan, tz: TimezoneLike = None, unit: str = "s") -> int: ...
+
+
+@overload
+def snap_epoch(
+    timestamps: NDArray[np.integer], snap: str | SnapPlan, tz: TimezoneLike = None, unit: str = "s"
+) -> NDArray[np.int64]: ...
+
+
+@overload
+def snap_epoch(
+    timestamps: Iterable[int], snap: str | SnapPlan, tz: TimezoneLike = None, unit: str = "s"
+) -> list[int]: ...
+
+
+def snap_epoch(
+    timestamps: int | Iterable[int] | NDArray[np.integer],
+    snap: str | SnapPlan,
+    tz: TimezoneLike = None,
+    unit: str = "s",
+) -> int | list[int] | NDArray[np.int64]:
+    """Transform epoch timestamps using relative time modifiers.
+
+    The results match applying `snap` to the equivalent `pendulum.DateTime` in the timezone and converting it back to
+    an epoch timestamp, rounded down to the unit, e.g epoch seconds after `+500ms`.
+
+    Args:
+        timestamps (int | Iterable[int] | NDArray[np.integer]): An epoch timestamp, i.e a UTC instant since
+            1970-01-01, or an iterable or NumPy integer array of them.
+        snap (str | SnapPlan): The snaptime string, or compiled plan, defining the relative time transformation.
+        tz (str | datetime.tzinfo | None): The timezone to snap in, e.g `Europe/London`. `None` for UTC.
+        unit (str): The unit of the timestamps, `s`, `ms`, `us` or `ns`.
+
+    Raises:
+        ValueError: If the unit is invalid.
+
+    Returns:
+        int | list[int] | NDArray[np.int64]: The snapped timestamp, in the same unit, or a list of them for an
+            iterable, or an `int64` array for a NumPy array.
+    """
+    snapper = _get_snapper(snap, tz, unit)
+    if isinstance(timestamps, int):
+        return snapper.snap(timestamps)
+
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(timestamps, numpy.integer):
+        return snapper.snap(int(timestamps))
+    if numpy is not None and isinstance(timestamps, numpy.ndarray):
+        return snapper.snap_array(timestamps.astype(numpy.int64, copy=False))
+    _timestamps = timestamps if isinstance(timestamps, (list, tuple)) else list(timestamps)
+    if len(_timestamps) < _MIN_ARRAY_SIZE or not _has_numpy():
+        return [snapper.snap(timestamp) for timestamp in _timestamps]
+    import numpy as np  # noqa: PLC0415
+
+    return snapper.snap_array(np.array(_timestamps, dtype=np.int64)).tolist()
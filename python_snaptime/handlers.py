@@ -1,11 +1,20 @@
 """Module to handle the snaptime cases."""
 
-import pendulum
+from __future__ import annotations
 
-from python_snaptime.models import Action, Snaptime, Unit
+from typing import TYPE_CHECKING, Union
 
+from python_snaptime.models import Action, Unit
 
-def _handle_snap_cases(snap: Snaptime, dtm: pendulum.DateTime) -> pendulum.DateTime:
+if TYPE_CHECKING:
+    import pendulum
+
+    from python_snaptime.models import Operation, Snaptime
+
+SnaptimeOperation = Union["Snaptime", "Operation"]
+
+
+def _handle_snap_cases(snap: SnaptimeOperation, dtm: pendulum.DateTime) -> pendulum.DateTime:
     if snap.time_int is not None:
         raise ValueError("Time integer is not allowed for SNAP action.")
     if snap.unit == Unit.SECOND:
@@ -28,7 +37,7 @@ def _handle_snap_cases(snap: Snaptime, dtm: pendulum.DateTime) -> pendulum.DateT
     return dtm
 
 
-def _handle_addition_cases(snap: Snaptime, dtm: pendulum.DateTime) -> pendulum.DateTime:
+def _handle_addition_cases(snap: SnaptimeOperation, dtm: pendulum.DateTime) -> pendulum.DateTime:
     if snap.time_int is None:
         raise ValueError("Time integer is required for ADD action.")
     if snap.unit == Unit.MICROSECOND:
@@ -54,7 +63,7 @@ def _handle_addition_cases(snap: Snaptime, dtm: pendulum.DateTime) -> pendulum.D
     return dtm
 
 
-def _handle_subtraction_cases(snap: Snaptime, dtm: pendulum.DateTime) -> pendulum.DateTime:
+def _handle_subtraction_cases(snap: SnaptimeOperation, dtm: pendulum.DateTime) -> pendulum.DateTime:
     if snap.time_int is None:
         raise ValueError("Time integer is required for SUB action.")
     if snap.unit == Unit.MICROSECOND:
@@ -80,7 +89,7 @@ def _handle_subtraction_cases(snap: Snaptime, dtm: pendulum.DateTime) -> pendulu
     return dtm
 
 
-def _handle_delta_cases(snap: Snaptime, dtm: pendulum.DateTime) -> pendulum.DateTime:
+def _handle_delta_cases(snap: SnaptimeOperation, dtm: pendulum.DateTime) -> pendulum.DateTime:
     if snap.action == Action.ADD:
         dtm = _handle_addition_cases(snap, dtm)
     elif snap.action == Action.SUB:
@@ -88,11 +97,12 @@ def _handle_delta_cases(snap: Snaptime, dtm: pendulum.DateTime) -> pendulum.Date
     return dtm
 
 
-def handle_timesnapping(snap: Snaptime, dtm: pendulum.DateTime) -> pendulum.DateTime:
+def handle_timesnapping(snap: SnaptimeOperation, dtm: pendulum.DateTime) -> pendulum.DateTime:
     """Handle different time snapping cases using the snaptime action.
 
     Args:
-        snap (Snaptime): An instance of `Snaptime` containing the time snapping to be performed.
+        snap (Snaptime | Operation): An instance of `Snaptime` or `Operation` containing the time snapping to be
+            performed.
         dtm (pendulum.DateTime): The datetime object to apply to the time snapping.
 
     Returns:
@@ -0,0 +1,161 @@
+"""Module for instrumenting the evaluation of snaptime strings.
+
+Instrumentation is disabled by default and costs a single attribute check per call when disabled. Once enabled with
+`enable`, each phase of an evaluation is counted and timed:
+
+- `cache.hit` / `cache.miss`: looking up a compiled plan in the plan cache.
+- `parse`: parsing a snaptime string into operations, including the validation of their units.
+- `validate`: checking the operations of a new plan, converting `Snaptime` models into operations.
+- `optimize`: simplifying the operations of a new plan.
+- `apply.epoch` / `apply.native` / `apply.pendulum`: applying a plan with the integer, `zoneinfo` or `pendulum` engine.
+- `apply.array`: snapping a NumPy array.
+- `convert`: converting a datetime of another timezone type (e.g `pytz`) to and from `pendulum`, which is also
+  counted in `apply.pendulum`.
+
+`explain` breaks a single evaluation down into its steps, whether or not instrumentation is enabled.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Callable
+
+    from python_snaptime.plans import SnapPlan
+
+__all__ = ["PhaseStats", "Step", "disable", "enable", "explain", "is_enabled", "reset", "stats"]
+
+
+class PhaseStats(NamedTuple):
+    """The number of times a phase ran and the total time spent in it."""
+
+    count: int
+    nanoseconds: int
+
+
+class Step(NamedTuple):
+    """A step of an explained evaluation."""
+
+    name: str
+    engine: str | None
+    value: Any
+    nanoseconds: int
+
+
+class _Recorder:
+    """Accumulates the statistics of each phase and forwards every measurement to a callback."""
+
+    def __init__(self, callback: Callable[[str, int], None] | None) -> None:
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._stats: dict[str, PhaseStats] = {}
+
+    def record(self, phase: str, nanoseconds: int) -> None:
+        with self._lock:
+            count, total = self._stats.get(phase, (0, 0))
+            self._stats[phase] = PhaseStats(count + 1, total + nanoseconds)
+        if self.callback is not None:
+            self.callback(phase, nanoseconds)
+
+    def stats(self) -> dict[str, PhaseStats]:
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# `None` while disabled, checked by the instrumented code paths before measuring anything
+recorder: _Recorder | None = None
+
+
+def enable(callback: Callable[[str, int], None] | None = None) -> None:
+    """Enable the instrumentation, keeping the statistics gathered so far.
+
+    Args:
+        callback (Callable[[str, int], None] | None): A function called with the name of the phase and its duration in
+            nanoseconds after each measurement, e.g to export them to a metrics system. It runs on the thread that was
+            measured, so it should be fast.
+    """
+    global recorder  # noqa: PLW0603
+    if recorder is None:
+        recorder = _Recorder(callback)
+    else:
+        recorder.callback = callback
+
+
+def disable() -> None:
+    """Disable the instrumentation and discard its statistics."""
+    global recorder  # noqa: PLW0603
+    recorder = None
+
+
+def is_enabled() -> bool:
+    """Check whether the instrumentation is enabled.
+
+    Returns:
+        bool: `True` if the phases of evaluations are being measured.
+    """
+    return recorder is not None
+
+
+def stats() -> dict[str, PhaseStats]:
+    """Get the statistics of each phase measured since the instrumentation was enabled or reset.
+
+    Returns:
+        dict[str, PhaseStats]: The number of measurements and total time of each phase, by name.
+    """
+    return {} if recorder is None else recorder.stats()
+
+
+def reset() -> None:
+    """Reset the statistics of the instrumentation."""
+    if recorder is not None:
+        recorder.reset()
+
+
+def explain(snaptime: str | SnapPlan, dtm: datetime.datetime) -> list[Step]:
+    """Evaluate a snaptime string step by step, timing each step.
+
+    The snaptime string is parsed and optimized without the plan cache, then each operation is applied on its own with
+    the engine used for the datetime, which gives the same result as applying the whole plan.
+
+    Args:
+        snaptime (str | SnapPlan): The snaptime string, or compiled plan, to evaluate.
+        dtm (pendulum.DateTime | datetime.datetime): The datetime to be transformed.
+
+    Returns:
+        list[Step]: The steps of the evaluation. Unless a plan is given, the first two are `parse`, whose value is the
+            parsed operations, and `optimize`, whose value is the compiled plan. They are followed by one step per
+            operation of the plan, e.g `@d`, whose value is the datetime after the operation.
+    """
+    from python_snaptime.parsers import _parse_raw_snaptime  # noqa: PLC0415
+    from python_snaptime.plans import SnapPlan, _engine, _format_operation, run  # noqa: PLC0415
+
+    steps: list[Step] = []
+    if isinstance(snaptime, SnapPlan):
+        plan = snaptime
+    else:
+        start = time.perf_counter_ns()
+        operations = tuple(_parse_raw_snaptime(snaptime))
+        nanoseconds = time.perf_counter_ns() - start
+        steps.append(Step("parse", None, operations, nanoseconds))
+        start = time.perf_counter_ns()
+        plan = SnapPlan(operations)
+        nanoseconds = time.perf_counter_ns() - start
+        steps.append(Step("optimize", None, plan, nanoseconds))
+
+    for operation in plan.fixed_offset_operations if _engine(dtm) == "epoch" else plan.operations:
+        # the engine can change after the first step, e.g a `pytz` datetime is snapped in the equivalent `pendulum`
+        # timezone, whose results are builtin datetimes snapped by the native engine
+        engine = _engine(dtm)
+        start = time.perf_counter_ns()
+        dtm = run((operation,), (operation,), dtm)
+        nanoseconds = time.perf_counter_ns() - start
+        steps.append(Step(_format_operation(operation), engine, dtm, nanoseconds))
+    return steps
@@ -0,0 +1,146 @@
+"""Module for snapping batches of ISO-8601 timestamp strings, e.g the timestamps of log lines.
+
+Each string is parsed with `datetime.fromisoformat`, falling back to a parser for the extended forms it does not accept
+before python 3.11 (e.g a `Z` suffix or nanoseconds), snapped and formatted. When the snaptime string starts with a
+snap, e.g `@h`, the formatted result only depends on the bucket a timestamp falls in, its offset or timezone and its
+`fold`, so it is computed once per bucket for the whole batch.
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+import zoneinfo
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from python_snaptime import parsers
+from python_snaptime._buckets import bucket, leading_snap, skipped
+from python_snaptime._epoch import DELTA_MICROSECONDS
+from python_snaptime._zones import TimezoneLike, fixed_offset
+from python_snaptime.models import Action, Unit
+from python_snaptime.plans import SnapPlan
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ["SnappedStrings", "snap_iso"]
+
+_UTC = datetime.timezone.utc
+_ISO_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?)?"
+    r"(?:(Z)|([+-])(\d{2})(?::?(\d{2}))?)?",
+    re.IGNORECASE,
+)
+
+
+class SnappedStrings(NamedTuple):
+    """The snapped timestamp strings of a batch, and which timestamps could not be parsed or snapped."""
+
+    values: list[str | None]
+    errors: list[bool]
+
+
+def _parse_extended(text: str) -> datetime.datetime:
+    match = _ISO_PATTERN.fullmatch(text)
+    if match is None:
+        msg = f"Invalid timestamp `{text}`."
+        raise ValueError(msg)
+    year, month, day, hour, minute, second, fraction, utc, sign, offset_hours, offset_minutes = match.groups()
+    tzinfo = _UTC if utc else None
+    if sign:
+        offset = datetime.timedelta(hours=int(offset_hours), minutes=int(offset_minutes or 0))
+        tzinfo = datetime.timezone(-offset if sign == "-" else offset)
+    # digits beyond microseconds are truncated, as `fromisoformat` does
+    microsecond = int(fraction[:6].ljust(6, "0")) if fraction else 0
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0), microsecond, tzinfo
+    )
+
+
+def _parse_iso(text: str) -> datetime.datetime:
+    # e.g `2024-12-30T13:45:12Z` or `2024-12-30 13:45:12.123456789+01:00`, naive without an offset
+    try:
+        return datetime.datetime.fromisoformat(text)
+    except ValueError:
+        return _parse_extended(text)
+
+
+class _IsoSnapper:
+    """Snaps parsed timestamps with a compiled plan, caching the formatted results per leading snap bucket.
+
+    In timezones without transitions the leading fixed deltas of the plan, e.g `+1d` in `+1d@d`, are added as a single
+    `timedelta` on the wall time, so the rest of the plan can be cached per bucket too.
+    """
+
+    __slots__ = ("_cache", "_fixed_plan", "_fixed_unit", "_out_format", "_plan", "_shift", "_tz", "_unit")
+
+    def __init__(self, plan: SnapPlan, tz: datetime.tzinfo | None, out_format: str) -> None:
+        self._plan = plan
+        self._tz = tz
+        self._out_format = out_format
+        self._unit = leading_snap(plan.operations)
+        self._shift = datetime.timedelta(0)
+        operations = list(plan.fixed_offset_operations)
+        while operations and operations[0].action != Action.SNAP and operations[0].unit in DELTA_MICROSECONDS:
+            operation = operations.pop(0)
+            delta = datetime.timedelta(microseconds=DELTA_MICROSECONDS[operation.unit] * (operation.time_int or 0))
+            self._shift += -delta if operation.action == Action.SUB else delta
+        self._fixed_plan = SnapPlan(operations) if operations else None
+        self._fixed_unit = None if self._fixed_plan is None else leading_snap(self._fixed_plan.operations)
+        self._cache: dict[tuple[Any, ...], str] = {}
+
+    def _format(self, dtm: datetime.datetime) -> str:
+        return dtm.isoformat() if self._out_format == "iso" else dtm.strftime(self._out_format)
+
+    def _snap(self, plan: SnapPlan | None, unit: Unit | None, dtm: datetime.datetime) -> str:
+        if plan is None:
+            return self._format(dtm)
+        if unit is None:
+            return self._format(plan.apply(dtm))
+        key = (dtm.tzinfo, dtm.fold, *bucket(unit, dtm))
+        result = self._cache.get(key)
+        if result is None:
+            result = self._cache[key] = self._format(plan.apply(dtm))
+        return result
+
+    def __call__(self, text: str) -> str:
+        dtm = _parse_iso(text)
+        if self._tz is not None:
+            # naive timestamps are taken to be in the timezone, others are converted to it
+            dtm = dtm.replace(tzinfo=self._tz) if dtm.tzinfo is None else dtm.astimezone(self._tz)
+        if fixed_offset(dtm.tzinfo) is not None:
+            return self._snap(self._fixed_plan, self._fixed_unit, dtm + self._shift)
+        # a wall time skipped by a DST transition is shifted before it is snapped, so it does not share its bucket
+        return self._snap(self._plan, None if skipped(dtm) else self._unit, dtm)
+
+    def try_snap(self, text: str) -> str | None:
+        try:
+            return self(text.strip())
+        except (ValueError, OverflowError):
+            return None
+
+
+def snap_iso(
+    strings: Iterable[str], snap: str | SnapPlan, tz: TimezoneLike = None, out_format: str = "iso"
+) -> SnappedStrings:
+    """Transform a batch of ISO-8601 timestamp strings using relative time modifiers.
+
+    The results match parsing each timestamp, applying `snap` to it and formatting the result. A timestamp which cannot
+    be parsed or snapped gives `None` and is flagged in the error mask, rather than raising.
+
+    Args:
+        strings (Iterable[str]): The ISO-8601 timestamps. Timestamps with an offset are snapped in that offset, and
+            naive timestamps as naive datetimes.
+        snap (str | SnapPlan): The snaptime string, or compiled plan, defining the relative time transformation.
+        tz (str | datetime.tzinfo | None): The timezone to snap in, e.g `Europe/London`. Naive timestamps are taken to
+            be in the timezone, and timestamps with an offset are converted to it.
+        out_format (str): `iso` for ISO-8601 timestamps, as `datetime.isoformat` formats them, or a `strftime` format,
+            e.g `%Y-%m-%d %H:%M`.
+
+    Returns:
+        SnappedStrings: The snapped timestamps, in input order, and the error mask.
+    """
+    plan = snap if isinstance(snap, SnapPlan) else parsers.compile(snap)
+    snapper = _IsoSnapper(plan, zoneinfo.ZoneInfo(tz) if isinstance(tz, str) else tz, out_format)
+    values = [snapper.try_snap(text) for text in strings]
+    return SnappedStrings(values, [value is None for value in values])
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import datetime
-from typing import overload
+from typing import TYPE_CHECKING, overload
 
-import pendulum
+from python_snaptime import parsers
 
-from python_snaptime.parsers import parse_snaptime_string
+if TYPE_CHECKING:
+  import datetime
+
+  import pendulum
 
 __all__ = ["snap"]
 
@@ -30,18 +32,4 @@ def snap(dtm: pendulum.DateTime | datetime.datetime, snap: str) -> pendulum.Date
   Returns:
       pendulum.DateTime | datetime.datetime: The resulting snapped datetime.
   """
-  if isinstance(dtm, pendulum.DateTime):
-    snap_dtm = parse_snaptime_string(snap, dtm)
-  elif isinstance(dtm, datetime.datetime):  # pyright: ignore[reportUnnecessaryIsInstance]
-    snap_dtm = parse_snaptime_string(snap, pendulum.instance(dtm))
-  else:
-    raise TypeError("Invalid datetime type. Must be pendulum.DateTime or datetime.datetime.")
-
-  if not isinstance(dtm, pendulum.DateTime):
-    if dtm.tzinfo is not None and dtm.tzinfo.utcoffset(dtm) is not None:
-      # aware
-      snap_dtm = datetime.datetime.fromtimestamp(snap_dtm.timestamp(), tz=snap_dtm.tz)
-    else:
-      # naive
-      snap_dtm = datetime.datetime.fromtimestamp(snap_dtm.naive().timestamp())  # noqa: DTZ006
-  return snap_dtm
+  return parsers.compile(snap).apply(dtm)
@@ -0,0 +1,176 @@
+"""Module for applying many snaptime strings to the same datetime, e.g the boundaries of a dashboard.
+
+The operations of the snaptime strings are organised in a prefix trie, e.g `@d`, `@d-1d` and `@d-7d` share the `@d`
+node, so each shared prefix is applied once and each remaining operation is applied to the result of its prefix. The
+datetime is converted to the engine of its timezone once, e.g to a wall time in microseconds for UTC, and each result
+is converted back once. This gives the same results as applying each snaptime string on its own.
+"""
+
+from __future__ import annotations
+
+import datetime
+import zoneinfo
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, overload
+
+from python_snaptime import _epoch, _native, parsers
+from python_snaptime._zones import fixed_offset
+from python_snaptime.cache import ThreadLocalCache
+from python_snaptime.plans import SnapPlan, _evaluate, _is_pendulum, from_pendulum, to_pendulum
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    import pendulum
+
+    from python_snaptime.models import Operation
+
+__all__ = ["snap_many"]
+
+_V = TypeVar("_V")
+_R = TypeVar("_R")
+
+
+class _Step(NamedTuple):
+    """Applies the operations of an edge of the trie to the value of its parent node, giving the value of its child."""
+
+    source: int
+    operations: tuple[Operation, ...]
+    target: int
+    indexes: tuple[int, ...]
+
+
+class _Node:
+    """A node of the trie while it is built, with the indexes of the snaptime strings ending at it."""
+
+    __slots__ = ("children", "indexes")
+
+    def __init__(self) -> None:
+        self.children: dict[Operation, _Node] = {}
+        self.indexes: list[int] = []
+
+
+class _Trie:
+    """The prefix trie of the operations of snaptime strings, flattened into steps in which parents precede children.
+
+    Chains of nodes with a single child, where no snaptime string ends, are merged into one step.
+    """
+
+    __slots__ = ("indexes", "size", "steps")
+
+    def __init__(self, chains: Iterable[tuple[Operation, ...]]) -> None:
+        root = _Node()
+        for index, chain in enumerate(chains):
+            node = root
+            for operation in chain:
+                node = node.children.setdefault(operation, _Node())
+            node.indexes.append(index)
+
+        steps: list[_Step] = []
+        stack = [(root, 0)]
+        while stack:
+            node, source = stack.pop()
+            for edge in node.children.items():
+                operations, child = [edge[0]], edge[1]
+                while not child.indexes and len(child.children) == 1:
+                    ((operation, child),) = child.children.items()
+                    operations.append(operation)
+                steps.append(_Step(source, tuple(operations), len(steps) + 1, tuple(child.indexes)))
+                stack.append((child, len(steps)))
+        self.indexes = tuple(root.indexes)
+        self.steps = tuple(steps)
+        self.size = len(steps) + 1
+
+    def evaluate(
+        self, value: _V, apply: Callable[[tuple[Operation, ...], _V], _V], convert: Callable[[_V], _R], count: int
+    ) -> list[_R]:
+        """Apply the steps to the value of the root, giving the converted result of each snaptime string."""
+        results: list[Any] = [None] * count
+        values: list[Any] = [None] * self.size
+        values[0] = value
+        if self.indexes:
+            result = convert(value)
+            for index in self.indexes:
+                results[index] = result
+        for source, operations, target, indexes in self.steps:
+            value = values[target] = apply(operations, values[source])
+            if indexes:
+                result = convert(value)
+                for index in indexes:
+                    results[index] = result
+        return results
+
+
+class _Tries:
+    """The tries of the operations of snaptime strings, and of their operations for timezones without transitions."""
+
+    __slots__ = ("count", "fixed_offset_operations", "operations")
+
+    def __init__(self, plans: list[SnapPlan]) -> None:
+        self.count = len(plans)
+        self.operations = _Trie(plan.operations for plan in plans)
+        self.fixed_offset_operations = _Trie(plan.fixed_offset_operations for plan in plans)
+
+
+_TRIES: ThreadLocalCache[tuple[str | SnapPlan, ...], _Tries] = ThreadLocalCache(256)
+
+
+def _get_tries(snaptimes: tuple[str | SnapPlan, ...]) -> _Tries:
+    tries = _TRIES.get(snaptimes)
+    if tries is None:
+        tries = _Tries(
+            [snaptime if isinstance(snaptime, SnapPlan) else parsers.compile(snaptime) for snaptime in snaptimes]
+        )
+        _TRIES.put(snaptimes, tries)
+    return tries
+
+
+def _identity(dtm: datetime.datetime) -> datetime.datetime:
+    return dtm
+
+
+@overload
+def snap_many(dtm: pendulum.DateTime, exprs: Iterable[str | SnapPlan]) -> list[pendulum.DateTime]: ...
+
+
+@overload
+def snap_many(dtm: datetime.datetime, exprs: Iterable[str | SnapPlan]) -> list[datetime.datetime]: ...
+
+
+def snap_many(
+    dtm: pendulum.DateTime | datetime.datetime, exprs: Iterable[str | SnapPlan]
+) -> list[pendulum.DateTime] | list[datetime.datetime]:
+    """Transform the same datetime with many snaptime strings, e.g `@d`, `@d-1d`, `@w` and `@w-1w`.
+
+    The results match `[snap(dtm, expr) for expr in exprs]`. The trie of a sequence of snaptime strings is cached, so
+    evaluating the same snaptime strings again, e.g against the current time, only applies their operations.
+
+    Args:
+        dtm (pendulum.DateTime | datetime.datetime): The datetime to be transformed.
+        exprs (Iterable[str | SnapPlan]): The snaptime strings, or compiled plans, defining the relative time
+            transformations.
+
+    Raises:
+        TypeError: If the datetime is not a datetime.
+
+    Returns:
+        list[pendulum.DateTime] | list[datetime.datetime]: The resulting snapped datetimes, in input order, of the same
+            type and timezone as the datetime.
+    """
+    if not isinstance(dtm, datetime.datetime):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError("Invalid datetime type. Must be pendulum.DateTime or datetime.datetime.")
+    tries = _get_tries(tuple(exprs))
+    if fixed_offset(dtm.tzinfo) is not None:
+        # wall times in microseconds, converted back to datetimes of the type and timezone of the input
+        return tries.fixed_offset_operations.evaluate(
+            _epoch.to_microseconds(dtm),
+            _epoch.run,
+            lambda microseconds: _epoch.from_microseconds(microseconds, dtm),
+            tries.count,
+        )
+    if _is_pendulum(dtm):
+        return tries.operations.evaluate(dtm, _evaluate, _identity, tries.count)
+    if isinstance(dtm.tzinfo, zoneinfo.ZoneInfo):
+        # a skipped wall time is shifted once, as applying the operations of each snaptime string would
+        return tries.operations.evaluate(_native.run((), dtm), _native.run, _identity, tries.count)
+
+    return tries.operations.evaluate(to_pendulum(dtm), _evaluate, from_pendulum, tries.count)
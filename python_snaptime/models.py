@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import TypedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from pydantic import BaseModel, model_validator
+if TYPE_CHECKING:
+    from python_snaptime._snaptime import Snaptime, SnaptimeDict
+
+__all__ = ["Action", "Operation", "Snaptime", "SnaptimeDict", "Unit"]
 
 
 class Action(str, Enum):
@@ -32,49 +35,80 @@ class Unit(Enum):
 
     @classmethod
     def _missing_(cls, value: object):  # noqa: ANN206
-        for member in cls:
-            if value in member.value:
-                return member
+        if isinstance(value, str):
+            return _UNIT_ALIASES.get(value)
         return None  # pragma: no cover
 
 
-class SnaptimeDict(TypedDict, total=False):
-    """Dictionary representing a snaptime configuration."""
+_ACTIONS: dict[str, Action] = {action.value: action for action in Action}
+_UNIT_ALIASES: dict[str, Unit] = {alias: unit for unit in Unit for alias in unit.value}
 
-    action: str | None
-    unit: str | None
-    time_int: int | None
 
+def _resolve_action(action: Action | str | None) -> Action:
+    if action is None:
+        raise ValueError("Snaptime string is invalid: must provide either a snap `@` or time delta `+-`.")
+    _action = action if isinstance(action, Action) else _ACTIONS.get(action)
+    if _action is None:
+        msg = f"Snaptime string is invalid: unknown action `{action}`."
+        raise ValueError(msg)
+    return _action
 
-class Snaptime(BaseModel):
-    """Model representing a snaptime configuration."""
 
-    action: Action | None = None
-    unit: Unit | None = None
-    time_int: int | None = None
+def _resolve_unit(unit: Unit | str) -> Unit:
+    _unit = unit if isinstance(unit, Unit) else _UNIT_ALIASES.get(unit)
+    if _unit is None:
+        msg = f"Snaptime string is invalid: unknown time unit `{unit}`."
+        raise ValueError(msg)
+    return _unit
 
-    @model_validator(mode="before")
-    @classmethod
-    def _verify_model(cls, values: SnaptimeDict) -> SnaptimeDict:
-        action = values.get("action")
-        unit = values.get("unit")
-        time_int = values.get("time_int")
 
-        if action is None:
-            raise ValueError("Snaptime string is invalid: must provide either a snap `@` or time delta `+-`.")
+class Operation(NamedTuple):
+    """A validated, immutable snaptime operation.
+
+    Lightweight counterpart of `Snaptime` used internally when evaluating snaptime strings.
+    """
+
+    action: Action
+    unit: Unit
+    time_int: int | None = None
 
-        if action == Action.SNAP:
+    @classmethod
+    def create(cls, action: Action | str | None, unit: Unit | str | None, time_int: int | None = None) -> Operation:
+        """Create a validated operation.
+
+        Args:
+            action (Action | str | None): The snaptime action, e.g `Action.SNAP` or `@`.
+            unit (Unit | str | None): The time unit, e.g `Unit.DAY` or `d`.
+            time_int (int | None): The time integer for time addition or subtraction.
+
+        Returns:
+            Operation: The validated operation.
+        """
+        _action = _resolve_action(action)
+        if _action == Action.SNAP:
             if time_int is not None:
                 raise ValueError("Snaptime string is invalid: cannot use a time integer when snapping.")
             if unit is None:
                 raise ValueError("Snaptime string is invalid: missing time unit when snapping.")
-            if unit in Unit.MILLISECOND.value:
+            _unit = _resolve_unit(unit)
+            if _unit == Unit.MILLISECOND:
                 raise ValueError("Snaptime string is invalid: cannot snap to nearest millisecond.")
-            if unit in Unit.MICROSECOND.value:
+            if _unit == Unit.MICROSECOND:
                 raise ValueError("Snaptime string is invalid: cannot snap to nearest microsecond.")
-        elif action in (Action.ADD, Action.SUB):
+        else:
             if time_int is None:
                 raise ValueError("Snaptime string is invalid: missing time integer for time addition or subtraction.")
             if unit is None:
                 raise ValueError("Snaptime string is invalid: missing time unit for time addition or subtraction.")
-        return values
+            _unit = _resolve_unit(unit)
+        return cls(_action, _unit, time_int)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # the pydantic models are only imported when used, as importing pydantic is slow
+    if name in ("Snaptime", "SnaptimeDict"):
+        from python_snaptime import _snaptime  # noqa: PLC0415
+
+        return getattr(_snaptime, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,165 @@
+"""Module for simplifying chains of snaptime operations.
+
+Rewrites only ever produce a chain that gives exactly the same results as the original, including around DST
+transitions. As `pendulum` resolves skipped wall times by shifting them by the size of the gap, most snaps are not
+idempotent in timezones with transitions (e.g `@d@d` is not the same as `@d` when midnight is skipped), so the
+simplifications that hold in any timezone are limited to:
+
+- merging adjacent fixed-duration deltas, e.g `-2h+30m` into `-90m`.
+- removing a zero delta before a calendar delta.
+- removing snaps to the second that have no effect.
+
+Timezones without transitions (e.g UTC or a fixed offset) also allow:
+
+- merging day and week deltas with the fixed-duration deltas, e.g `+1d-2h` into `+22h`.
+- removing a snap made redundant by a coarser one, e.g `@d@h` into `@d` and `@h@d` into `@d`.
+- merging month, quarter and year deltas applied to the start of a month, e.g `@q+1y-1q` into `@q+3q`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from python_snaptime.models import Action, Operation, Unit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ["optimize"]
+
+# deltas added to the UTC time, in microseconds, coarsest first
+_FIXED_DURATIONS: dict[Unit, int] = {
+    Unit.HOUR: 3_600_000_000,
+    Unit.MINUTE: 60_000_000,
+    Unit.SECOND: 1_000_000,
+    Unit.MILLISECOND: 1_000,
+    Unit.MICROSECOND: 1,
+}
+# without transitions days and weeks are fixed durations too
+_FIXED_OFFSET_DURATIONS: dict[Unit, int] = {
+    Unit.WEEK: 604_800_000_000,
+    Unit.DAY: 86_400_000_000,
+    **_FIXED_DURATIONS,
+}
+_MONTHS: dict[Unit, int] = {Unit.YEAR: 12, Unit.QUARTER: 3, Unit.MONTH: 1}
+
+# the snaps which have no effect after snapping to a unit
+_SNAP_ALIGNMENT: dict[Unit, frozenset[Unit]] = {
+    Unit.SECOND: frozenset((Unit.SECOND,)),
+    Unit.MINUTE: frozenset((Unit.SECOND, Unit.MINUTE)),
+    Unit.HOUR: frozenset((Unit.SECOND, Unit.MINUTE, Unit.HOUR)),
+    Unit.DAY: frozenset((Unit.SECOND, Unit.MINUTE, Unit.HOUR, Unit.DAY)),
+    Unit.WEEK: frozenset((Unit.SECOND, Unit.MINUTE, Unit.HOUR, Unit.DAY, Unit.WEEK)),
+    Unit.MONTH: frozenset((Unit.SECOND, Unit.MINUTE, Unit.HOUR, Unit.DAY, Unit.MONTH)),
+    Unit.QUARTER: frozenset((Unit.SECOND, Unit.MINUTE, Unit.HOUR, Unit.DAY, Unit.MONTH, Unit.QUARTER)),
+    Unit.YEAR: frozenset((Unit.SECOND, Unit.MINUTE, Unit.HOUR, Unit.DAY, Unit.MONTH, Unit.QUARTER, Unit.YEAR)),
+}
+_TIME_OF_DAY = frozenset((Unit.SECOND, Unit.MINUTE, Unit.HOUR, Unit.DAY))
+
+_Step = tuple[Operation, frozenset[Unit]]
+
+
+def _signed(operation: Operation) -> int:
+    time_int = operation.time_int or 0
+    return -time_int if operation.action == Action.SUB else time_int
+
+
+def _delta(total: int, units: dict[Unit, int]) -> Operation:
+    # use the coarsest unit that represents the total exactly
+    unit, size = next((unit, size) for unit, size in units.items() if total % size == 0)
+    return Operation(Action.SUB if total < 0 else Action.ADD, unit, abs(total) // size)
+
+
+def _duration_alignment(aligned: frozenset[Unit], total: int) -> frozenset[Unit]:
+    return frozenset(
+        unit for unit in aligned if unit in _FIXED_OFFSET_DURATIONS and total % _FIXED_OFFSET_DURATIONS[unit] == 0
+    )
+
+
+def _month_alignment(aligned: frozenset[Unit], total: int) -> frozenset[Unit]:
+    if Unit.MONTH not in aligned:
+        return aligned & _TIME_OF_DAY
+    return frozenset(unit for unit in aligned if unit != Unit.WEEK and total % _MONTHS.get(unit, 1) == 0)
+
+
+class _Optimizer:
+    def __init__(self, *, fixed_offset: bool) -> None:
+        self.fixed_offset = fixed_offset
+        self.durations = _FIXED_OFFSET_DURATIONS if fixed_offset else _FIXED_DURATIONS
+        # with transitions, only alignment to the second survives snaps and deltas
+        self.trackable = frozenset(Unit) if fixed_offset else frozenset((Unit.SECOND,))
+        self.steps: list[_Step] = []
+
+    @property
+    def aligned(self) -> frozenset[Unit]:
+        return self.steps[-1][1] if self.steps else frozenset()
+
+    def _last(self, units: dict[Unit, int]) -> Operation | None:
+        if self.steps and self.steps[-1][0].action != Action.SNAP and self.steps[-1][0].unit in units:
+            return self.steps[-1][0]
+        return None
+
+    def _snap(self, operation: Operation) -> None:
+        if operation.unit in self.aligned:
+            return
+        # a snap made redundant by this coarser snap; with transitions only snaps to the second are
+        while self.steps and self.steps[-1][0].action == Action.SNAP:
+            previous = self.steps[-1][0].unit
+            if previous not in _SNAP_ALIGNMENT[operation.unit] or not (self.fixed_offset or previous == Unit.SECOND):
+                break
+            self.steps.pop()
+        self.steps.append((operation, _SNAP_ALIGNMENT[operation.unit] & self.trackable))
+
+    def _duration(self, operation: Operation) -> None:
+        total = _signed(operation) * self.durations.get(operation.unit, 0)
+        previous = self._last(self.durations)
+        if previous is not None:
+            self.steps.pop()
+            total += _signed(previous) * self.durations[previous.unit]
+        if total == 0 and self.fixed_offset:
+            return
+        self.steps.append((_delta(total, self.durations), _duration_alignment(self.aligned, total)))
+
+    def _calendar(self, operation: Operation) -> None:
+        # the fold normalised by a zero duration is ignored by calendar deltas
+        previous = self._last(_FIXED_DURATIONS)
+        if previous is not None and previous.time_int == 0:
+            self.steps.pop()
+        if operation.unit not in _MONTHS:
+            self.steps.append((operation, self.aligned & _TIME_OF_DAY))
+            return
+        total = _signed(operation) * _MONTHS[operation.unit]
+        previous = self._last(_MONTHS)
+        # without transitions, months can be merged when the day of the month cannot be clamped
+        if self.fixed_offset and previous is not None and Unit.MONTH in self.aligned:
+            self.steps.pop()
+            total += _signed(previous) * _MONTHS[previous.unit]
+        if total == 0 and self.fixed_offset:
+            return
+        self.steps.append((_delta(total, _MONTHS), _month_alignment(self.aligned, total) & self.trackable))
+
+    def add(self, operation: Operation) -> None:
+        if operation.action == Action.SNAP:
+            self._snap(operation)
+        elif operation.unit in self.durations or not operation.time_int:
+            # `pendulum` adds zero calendar deltas to the UTC time too
+            self._duration(operation)
+        else:
+            self._calendar(operation)
+
+
+def optimize(operations: Iterable[Operation], *, fixed_offset: bool = False) -> tuple[Operation, ...]:
+    """Simplify a chain of snaptime operations into an equivalent, shorter chain.
+
+    Args:
+        operations (Iterable[Operation]): The snaptime operations, in order.
+        fixed_offset (bool): Whether the chain is only applied to datetimes in timezones without transitions, e.g
+            UTC. This allows further simplification.
+
+    Returns:
+        tuple[Operation, ...]: The simplified snaptime operations.
+    """
+    optimizer = _Optimizer(fixed_offset=fixed_offset)
+    for operation in operations:
+        optimizer.add(operation)
+    return tuple(operation for operation, _ in optimizer.steps)
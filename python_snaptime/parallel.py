@@ -0,0 +1,205 @@
+"""Module for snapping large batches of datetimes on multiple cores.
+
+The compiled plan is sent to each worker process once, when the pool starts. The input is split into chunks that are
+sent as compact `int64` buffers rather than pickled datetime objects, and the results are reassembled in input order.
+The results are identical to applying the plan to each datetime in the calling process.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import datetime
+import itertools
+import os
+import sys
+import zoneinfo
+from array import array
+from typing import TYPE_CHECKING, Any, TypeVar, Union
+
+from python_snaptime import _epoch, parsers
+from python_snaptime._batching import batches
+from python_snaptime._zones import TimezoneLike, fixed_offset
+from python_snaptime.plans import SnapPlan
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from numpy.typing import NDArray
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "snap_parallel"]
+
+DEFAULT_CHUNK_SIZE = 65_536
+
+# a chunk of datetimes: the distinct timezones, each element's index into them, and its wall time and fold
+_Chunk = tuple[list[Union[datetime.tzinfo, None]], array, array]
+
+_C = TypeVar("_C")
+_P = TypeVar("_P")
+_R = TypeVar("_R")
+
+_NAIVE = datetime.datetime(1970, 1, 1)  # noqa: DTZ001
+
+# the state of a worker process, set once when the pool starts
+_plan: SnapPlan | None = None
+_tz: TimezoneLike = None
+_dtype: str | None = None
+
+
+def _is_array(values: object) -> bool:
+    # `numpy` is an optional dependency, and a `numpy.ndarray` cannot exist before it is imported
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _initialize(plan: SnapPlan, tz: TimezoneLike = None, dtype: str | None = None) -> None:
+    global _plan, _tz, _dtype
+    _plan, _tz, _dtype = plan, tz, dtype
+
+
+def _snap_chunk(plan: SnapPlan, chunk: _Chunk) -> array:
+    tzinfos, indices, walls = chunk
+    results = array("q")
+    for index, wall in zip(indices, walls):
+        dtm = _epoch.from_microseconds(wall >> 1, _NAIVE).replace(tzinfo=tzinfos[index], fold=wall & 1)
+        result = plan.apply(dtm)
+        results.append(_epoch.to_microseconds(result) << 1 | result.fold)
+    return results
+
+
+def _snap_chunk_in_worker(chunk: _Chunk) -> array:
+    return _snap_chunk(_plan, chunk)  # type: ignore[arg-type]
+
+
+def _snap_ticks_in_worker(ticks: NDArray[Any]) -> NDArray[Any]:
+    from python_snaptime.arrays import snap_array  # noqa: PLC0415
+
+    return snap_array(ticks.view(_dtype), _plan, tz=_tz).view("int64")  # type: ignore[arg-type]
+
+
+def _encode(plan: SnapPlan, batch: list[datetime.datetime]) -> tuple[_Chunk, dict[int, datetime.datetime]]:
+    tzinfos: list[datetime.tzinfo | None] = []
+    positions: dict[datetime.tzinfo | None, int] = {}
+    indices, walls = array("I"), array("q")
+    local: dict[int, datetime.datetime] = {}
+    for position, dtm in enumerate(batch):
+        if not isinstance(dtm, datetime.datetime):
+            raise TypeError("Invalid datetime type. Must be pendulum.DateTime or datetime.datetime.")
+        tz = dtm.tzinfo
+        if tz is not None and not isinstance(tz, zoneinfo.ZoneInfo) and fixed_offset(tz) is None:
+            # other timezones (e.g `pytz`) are converted to `pendulum`, so these are snapped locally
+            local[position] = plan.apply(dtm)
+            tz = None
+        if tz not in positions:
+            positions[tz] = len(tzinfos)
+            tzinfos.append(tz)
+        indices.append(positions[tz])
+        # the fold is kept in the lowest bit of the wall time
+        walls.append(_epoch.to_microseconds(dtm) << 1 | dtm.fold)
+    return (tzinfos, indices, walls), local
+
+
+def _decode(
+    batch: list[datetime.datetime], walls: array, local: dict[int, datetime.datetime]
+) -> list[datetime.datetime]:
+    results = []
+    for position, (dtm, wall) in enumerate(zip(batch, walls)):
+        if position in local:
+            results.append(local[position])
+            continue
+        # the type and timezone of the input are kept
+        result = _epoch.from_microseconds(wall >> 1, dtm)
+        results.append(result.replace(fold=1) if wall & 1 else result)
+    return results
+
+
+def _ordered(
+    executor: concurrent.futures.Executor, function: Callable[[_P], _R], items: Iterable[tuple[_C, _P]], workers: int
+) -> Iterator[tuple[_C, _R]]:
+    # a bounded number of chunks are in flight, so arbitrarily large inputs are not read into memory up front
+    pending: collections.deque[tuple[_C, concurrent.futures.Future[_R]]] = collections.deque()
+    for context, payload in items:
+        pending.append((context, executor.submit(function, payload)))
+        if len(pending) >= 2 * workers:
+            done, future = pending.popleft()
+            yield done, future.result()
+    while pending:
+        done, future = pending.popleft()
+        yield done, future.result()
+
+
+def _snap_array(plan: SnapPlan, values: NDArray[Any], tz: TimezoneLike, workers: int, chunk_size: int) -> NDArray[Any]:
+    import numpy as np  # noqa: PLC0415
+
+    from python_snaptime.arrays import snap_array  # noqa: PLC0415
+
+    if workers == 1 or values.size <= chunk_size:
+        return snap_array(values, plan, tz=tz)
+    # validate the dtype and timezone before starting the pool
+    snap_array(values[:0], plan, tz=tz)
+    ticks = values.reshape(-1).view("int64")
+    result = np.empty_like(ticks)
+    chunks = ((start, ticks[start : start + chunk_size]) for start in range(0, len(ticks), chunk_size))
+    with concurrent.futures.ProcessPoolExecutor(
+        workers, initializer=_initialize, initargs=(plan, tz, values.dtype.str)
+    ) as executor:
+        for start, snapped in _ordered(executor, _snap_ticks_in_worker, chunks, workers):
+            result[start : start + len(snapped)] = snapped
+    return result.view(values.dtype).reshape(values.shape)
+
+
+def _snap_datetimes(
+    plan: SnapPlan, values: Iterable[datetime.datetime], workers: int, chunk_size: int
+) -> list[datetime.datetime]:
+    iterator = iter(values)
+    head = list(itertools.islice(iterator, chunk_size + 1))
+    if workers == 1 or len(head) <= chunk_size:
+        return [plan.apply(dtm) for dtm in itertools.chain(head, iterator)]
+
+    def items() -> Iterator[tuple[tuple[list[datetime.datetime], dict[int, datetime.datetime]], _Chunk]]:
+        for batch in batches(itertools.chain(head, iterator), chunk_size):
+            chunk, local = _encode(plan, batch)
+            yield (batch, local), chunk
+
+    results: list[datetime.datetime] = []
+    with concurrent.futures.ProcessPoolExecutor(workers, initializer=_initialize, initargs=(plan,)) as executor:
+        for (batch, local), walls in _ordered(executor, _snap_chunk_in_worker, items(), workers):
+            results.extend(_decode(batch, walls, local))
+    return results
+
+
+def snap_parallel(
+    values: Iterable[datetime.datetime] | NDArray[Any],
+    snap: str | SnapPlan,
+    tz: TimezoneLike = None,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[datetime.datetime] | NDArray[Any]:
+    """Transform a large batch of datetimes using relative time modifiers, on multiple cores.
+
+    Inputs no larger than one chunk, or with a single worker, are transformed in the calling process.
+
+    Args:
+        values (Iterable[datetime.datetime] | NDArray[Any]): The datetimes to be transformed, or a `datetime64[us]` or
+            `datetime64[ns]` array as accepted by `python_snaptime.arrays.snap_array`.
+        snap (str | SnapPlan): The snaptime string, or compiled plan, defining the relative time transformation.
+        tz (str | datetime.tzinfo | None): For arrays, the timezone to snap in, e.g `Europe/London`.
+        workers (int | None): The number of worker processes, defaults to the number of CPUs.
+        chunk_size (int): The number of datetimes sent to a worker at a time.
+
+    Returns:
+        list[datetime.datetime] | NDArray[Any]: The resulting snapped datetimes, in input order. Arrays give an array
+            of the same shape and dtype.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+    _workers = os.cpu_count() or 1 if workers is None else workers
+    if _workers < 1:
+        raise ValueError("Number of workers must be a positive integer.")
+    plan = snap if isinstance(snap, SnapPlan) else parsers.compile(snap)
+    if _is_array(values):
+        return _snap_array(plan, values, tz, _workers, chunk_size)  # type: ignore[arg-type]
+    if tz is not None:
+        raise ValueError("A timezone can only be given for arrays, datetimes keep their own.")
+    return _snap_datetimes(plan, values, _workers, chunk_size)  # type: ignore[arg-type]
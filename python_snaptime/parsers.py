@@ -2,39 +2,167 @@
 
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING
+import string
+import time
+from typing import TYPE_CHECKING, NoReturn
 
+from python_snaptime import instrumentation
+from python_snaptime.cache import ThreadLocalCache
 from python_snaptime.handlers import handle_timesnapping
-from python_snaptime.models import Snaptime
+from python_snaptime.models import _ACTIONS, _UNIT_ALIASES, Action, Operation, Unit
+from python_snaptime.plans import SnapPlan
 
 if TYPE_CHECKING:
     import pendulum
 
+    from python_snaptime.cache import CacheInfo
 
-def _parse_raw_snaptime(snaptime: str) -> list[Snaptime]:
-    pattern = r"(([@+-]*)(\d*)(\w*))"
-    matches = re.findall(pattern, snaptime)
+DEFAULT_CACHE_SIZE = 1024
 
-    results: list[Snaptime] = []
-    for match in matches:
-        action, integer, unit = match[1] or None, match[2] or None, match[3] or None
-        if action is None and integer is None and unit is None:
-            pass
-        else:
-            results.append(
-                Snaptime(
-                    action=action,
-                    unit=unit,
-                    time_int=int(integer) if integer is not None else None,
-                )
-            )
-
-    if not results:
+_PLAN_CACHE: ThreadLocalCache[str, SnapPlan] = ThreadLocalCache(DEFAULT_CACHE_SIZE)
+
+
+class SnaptimeSyntaxError(ValueError):
+    """Raised when a snaptime string has a malformed token.
+
+    Attributes:
+        snaptime (str): The snaptime string.
+        position (int): The offset of the first character of the malformed token.
+    """
+
+    def __init__(self, message: str, snaptime: str, position: int) -> None:
+        """Initialise the error.
+
+        Args:
+            message (str): The validation error of the token.
+            snaptime (str): The snaptime string.
+            position (int): The offset of the first character of the malformed token.
+        """
+        super().__init__(f"{message.removesuffix('.')} at position {position}.")
+        self.snaptime = snaptime
+        self.position = position
+
+
+# a token is an action followed by an optional time integer and an optional unit, each validated as it is scanned
+_DIGITS = frozenset("0123456789")
+_LETTERS = frozenset(string.ascii_letters)
+_SNAPS: dict[str, Operation] = {
+    alias: Operation(Action.SNAP, unit)
+    for alias, unit in _UNIT_ALIASES.items()
+    if unit not in (Unit.MILLISECOND, Unit.MICROSECOND)
+}
+_DELTAS: dict[str, Action] = {"+": Action.ADD, "-": Action.SUB}
+
+
+def _parse_raw_snaptime(snaptime: str) -> list[Operation]:
+    if not snaptime:
         raise ValueError("Snaptime string is invalid")
+
+    results: list[Operation] = []
+    position, end = 0, len(snaptime)
+    while position < end:
+        action = snaptime[position]
+        if action != "@" and action not in _DELTAS:
+            msg = f"Snaptime string is invalid: expected a snap `@` or time delta `+-`, found `{action}`."
+            raise SnaptimeSyntaxError(msg, snaptime, position)
+        digits = position + 1
+        while digits < end and snaptime[digits] in _DIGITS:
+            digits += 1
+        letters = digits
+        while letters < end and snaptime[letters] in _LETTERS:
+            letters += 1
+        integer, unit = snaptime[position + 1 : digits], snaptime[digits:letters]
+        if action == "@" and not integer:
+            operation = _SNAPS.get(unit)
+        elif action != "@" and integer and unit in _UNIT_ALIASES:
+            operation = Operation(_DELTAS[action], _UNIT_ALIASES[unit], int(integer))
+        else:
+            operation = None
+        if operation is None:
+            _raise_invalid(snaptime, position, letters)
+        results.append(operation)
+        position = letters
     return results
 
 
+def _raise_invalid(snaptime: str, start: int, end: int) -> NoReturn:
+    # malformed tokens are validated as operations, to raise the same errors at the offset of the token
+    action, token = snaptime[start], snaptime[start + 1 : end]
+    integer = token.rstrip(string.ascii_letters)
+    unit = token[len(integer) :]
+    if not token and snaptime[end : end + 1] in _ACTIONS:
+        msg = f"Snaptime string is invalid: unknown action `{action}{snaptime[end]}`."
+        raise SnaptimeSyntaxError(msg, snaptime, start)
+    try:
+        Operation.create(action, unit or None, int(integer) if integer else None)
+    except ValueError as e:
+        raise SnaptimeSyntaxError(str(e), snaptime, start) from None
+    raise AssertionError  # pragma: no cover
+
+
+def compile(snaptime: str) -> SnapPlan:  # noqa: A001
+    """Compile a snaptime string into a reusable plan.
+
+    Compiled plans are held in a bounded LRU cache, so parsing and validation only happen the first time a snaptime
+    string is seen. Equivalent snaptime strings share the plan of their canonical form, e.g `@d-2h+30m` and `@d-90m`.
+
+    Args:
+        snaptime (str): The snaptime string defining the relative time transformation.
+
+    Returns:
+        SnapPlan: The compiled plan.
+    """
+    recorder = instrumentation.recorder
+    if recorder is not None:
+        return _compile_instrumented(snaptime, recorder)
+    plan = _PLAN_CACHE.get(snaptime)
+    if plan is None:
+        plan = _cache_plan(snaptime, SnapPlan(_parse_raw_snaptime(snaptime)))
+    return plan
+
+
+def _cache_plan(snaptime: str, plan: SnapPlan) -> SnapPlan:
+    # equivalent snaptime strings share the plan of their canonical form
+    plan = _PLAN_CACHE.setdefault(plan.expression, plan)
+    _PLAN_CACHE.put(snaptime, plan)
+    return plan
+
+
+def _compile_instrumented(snaptime: str, recorder: instrumentation._Recorder) -> SnapPlan:
+    start = time.perf_counter_ns()
+    plan = _PLAN_CACHE.get(snaptime)
+    recorder.record("cache.miss" if plan is None else "cache.hit", time.perf_counter_ns() - start)
+    if plan is None:
+        start = time.perf_counter_ns()
+        operations = _parse_raw_snaptime(snaptime)
+        recorder.record("parse", time.perf_counter_ns() - start)
+        plan = _cache_plan(snaptime, SnapPlan(operations))
+    return plan
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Set the maximum number of compiled plans held in the cache.
+
+    Args:
+        maxsize (int): The maximum number of plans to cache. `0` disables caching.
+    """
+    _PLAN_CACHE.maxsize = maxsize
+
+
+def cache_info() -> CacheInfo:
+    """Get the statistics of the compiled plan cache.
+
+    Returns:
+        CacheInfo: The hits, misses, evictions, maximum size and current size of the cache.
+    """
+    return _PLAN_CACHE.info()
+
+
+def cache_clear() -> None:
+    """Clear the compiled plan cache and reset its statistics."""
+    _PLAN_CACHE.clear()
+
+
 def parse_snaptime_string(snaptime: str, datetime: pendulum.DateTime) -> pendulum.DateTime:
     """Parse a datetime using a snaptime string.
 
@@ -45,7 +173,6 @@ def parse_snaptime_string(snaptime: str, datetime: pendulum.DateTime) -> pendulu
     Returns:
         pendulum.DateTime: The resulting snapped datetime.
     """
-    parsed_snaptimes = _parse_raw_snaptime(snaptime)
-    for _snaptime in parsed_snaptimes:
+    for _snaptime in compile(snaptime).operations:
         datetime = handle_timesnapping(_snaptime, datetime)
     return datetime
@@ -0,0 +1,307 @@
+"""Module defining compiled snaptime plans."""
+
+from __future__ import annotations
+
+import datetime
+import sys
+import time
+import zoneinfo
+from typing import TYPE_CHECKING, Any, overload
+
+from python_snaptime import _epoch, _native, instrumentation
+from python_snaptime._buckets import bucket, leading_snap, skipped
+from python_snaptime._zones import fixed_offset
+from python_snaptime.cache import LRUCache
+from python_snaptime.handlers import handle_timesnapping
+from python_snaptime.models import Operation
+from python_snaptime.optimizer import optimize
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pendulum
+
+    from python_snaptime.cache import CacheInfo
+    from python_snaptime.models import Snaptime
+
+DEFAULT_MEMO_SIZE = 4096
+
+
+def _is_pendulum(dtm: datetime.datetime) -> bool:
+    # `pendulum` is only imported when needed, and a `pendulum.DateTime` cannot exist before it is imported
+    pendulum = sys.modules.get("pendulum")
+    return pendulum is not None and isinstance(dtm, pendulum.DateTime)
+
+
+def _evaluate(operations: Iterable[Operation], dtm: pendulum.DateTime) -> pendulum.DateTime:
+    for operation in operations:
+        dtm = handle_timesnapping(operation, dtm)
+    return dtm
+
+
+def _engine(dtm: datetime.datetime) -> str:
+    if fixed_offset(dtm.tzinfo) is not None:
+        return "epoch"
+    if isinstance(dtm.tzinfo, zoneinfo.ZoneInfo) and not _is_pendulum(dtm):
+        return "native"
+    return "pendulum"
+
+
+def to_pendulum(dtm: datetime.datetime) -> pendulum.DateTime:
+    """Convert a builtin datetime to the equivalent `pendulum` datetime.
+
+    Datetimes in timezones without an engine of their own (e.g `pytz`) are converted to the equivalent `pendulum`
+    timezone to be snapped, and converted back with `from_pendulum`.
+    """
+    import pendulum  # noqa: PLC0415
+
+    return pendulum.instance(dtm)
+
+
+def from_pendulum(dtm: pendulum.DateTime) -> datetime.datetime:
+    """Convert a `pendulum` datetime back to a builtin datetime in its timezone."""
+    return datetime.datetime.fromtimestamp(dtm.timestamp(), tz=dtm.tzinfo)
+
+
+def _run(
+    operations: tuple[Operation, ...],
+    fixed_offset_operations: tuple[Operation, ...],
+    dtm: pendulum.DateTime | datetime.datetime,
+) -> pendulum.DateTime | datetime.datetime:
+    if fixed_offset(dtm.tzinfo) is not None:
+        return _epoch.from_microseconds(_epoch.run(fixed_offset_operations, _epoch.to_microseconds(dtm)), dtm)
+    if _is_pendulum(dtm):
+        return _evaluate(operations, dtm)  # type: ignore[arg-type]
+    if isinstance(dtm.tzinfo, zoneinfo.ZoneInfo):
+        return _native.run(operations, dtm)
+
+    recorder = instrumentation.recorder
+    if recorder is None:
+        return from_pendulum(_evaluate(operations, to_pendulum(dtm)))
+    start = time.perf_counter_ns()
+    pendulum_dtm = to_pendulum(dtm)
+    converted = time.perf_counter_ns()
+    snap_dtm = _evaluate(operations, pendulum_dtm)
+    evaluated = time.perf_counter_ns()
+    result = from_pendulum(snap_dtm)
+    recorder.record("convert", converted - start + time.perf_counter_ns() - evaluated)
+    return result
+
+
+@overload
+def run(
+    operations: tuple[Operation, ...], fixed_offset_operations: tuple[Operation, ...], dtm: pendulum.DateTime
+) -> pendulum.DateTime: ...
+
+
+@overload
+def run(
+    operations: tuple[Operation, ...], fixed_offset_operations: tuple[Operation, ...], dtm: datetime.datetime
+) -> datetime.datetime: ...
+
+
+def run(
+    operations: tuple[Operation, ...],
+    fixed_offset_operations: tuple[Operation, ...],
+    dtm: pendulum.DateTime | datetime.datetime,
+) -> pendulum.DateTime | datetime.datetime:
+    """Apply snaptime operations to a datetime with the fastest engine for its type and timezone.
+
+    Args:
+        operations (tuple[Operation, ...]): The snaptime operations to apply, in order.
+        fixed_offset_operations (tuple[Operation, ...]): The equivalent operations for timezones without transitions.
+        dtm (pendulum.DateTime | datetime.datetime): The datetime to be transformed.
+
+    Returns:
+        pendulum.DateTime | datetime.datetime: The resulting datetime, of the same type and timezone.
+    """
+    recorder = instrumentation.recorder
+    if recorder is None:
+        return _run(operations, fixed_offset_operations, dtm)
+    start = time.perf_counter_ns()
+    result = _run(operations, fixed_offset_operations, dtm)
+    recorder.record(f"apply.{_engine(dtm)}", time.perf_counter_ns() - start)
+    return result
+
+
+def _format_operation(operation: Operation) -> str:
+    time_int = str(operation.time_int) if operation.time_int is not None else ""
+    return f"{operation.action.value}{time_int}{operation.unit.value[0]}"
+
+
+class SnapPlan:
+    """An immutable, parsed and validated chain of snaptime operations.
+
+    Plans are created with `python_snaptime.compile` and can be applied to any number of datetimes without
+    re-parsing the snaptime string. The operations are simplified into an equivalent, shorter chain when the plan is
+    created, e.g `@d-2h+30m` is applied as `@d-90m`.
+    """
+
+    __slots__ = ("_expression", "_fixed_offset_operations", "_operations")
+
+    _expression: str
+    _fixed_offset_operations: tuple[Operation, ...]
+    _operations: tuple[Operation, ...]
+
+    def __init__(self, operations: Iterable[Operation | Snaptime]) -> None:
+        """Initialise the plan.
+
+        Args:
+            operations (Iterable[Operation | Snaptime]): The snaptime operations to apply, in order. `Snaptime`
+                models are validated and converted to `Operation` records.
+        """
+        recorder = instrumentation.recorder
+        start = 0 if recorder is None else time.perf_counter_ns()
+        _operations = tuple(
+            operation if isinstance(operation, Operation) else operation.to_operation() for operation in operations
+        )
+        if not _operations:
+            raise ValueError("Snaptime string is invalid")
+        validated = 0 if recorder is None else time.perf_counter_ns()
+        object.__setattr__(self, "_operations", optimize(_operations))
+        object.__setattr__(self, "_fixed_offset_operations", optimize(_operations, fixed_offset=True))
+        if recorder is not None:
+            recorder.record("validate", validated - start)
+            recorder.record("optimize", time.perf_counter_ns() - validated)
+        object.__setattr__(self, "_expression", "".join(_format_operation(operation) for operation in self._operations))
+
+    @property
+    def expression(self) -> str:
+        """str: The canonical snaptime string of the plan, e.g `@d-2h`."""
+        return self._expression
+
+    @property
+    def operations(self) -> tuple[Operation, ...]:
+        """tuple[Operation, ...]: The simplified snaptime operations of the plan, in order."""
+        return self._operations
+
+    @property
+    def fixed_offset_operations(self) -> tuple[Operation, ...]:
+        """tuple[Operation, ...]: The snaptime operations simplified further for timezones without transitions."""
+        return self._fixed_offset_operations
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401, D105
+        raise AttributeError("SnapPlan is immutable.")
+
+    def __delattr__(self, name: str) -> None:  # noqa: D105
+        raise AttributeError("SnapPlan is immutable.")
+
+    def __eq__(self, other: object) -> bool:  # noqa: D105
+        if not isinstance(other, SnapPlan):
+            return NotImplemented
+        return self._expression == other._expression
+
+    def __hash__(self) -> int:  # noqa: D105
+        return hash(self._expression)
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{type(self).__name__}({self._expression!r})"
+
+    def __reduce__(self) -> tuple[type[SnapPlan], tuple[tuple[Operation, ...]]]:  # noqa: D105
+        # the simplified operations give an equivalent plan, e.g when sent to another process
+        return type(self), (self._operations,)
+
+    def memoize(self, maxsize: int = DEFAULT_MEMO_SIZE) -> MemoizedPlan:
+        """Wrap the plan with a cache of its results per timezone and leading snap bucket.
+
+        Args:
+            maxsize (int): The maximum number of results to cache, least recently used results are evicted first.
+
+        Returns:
+            MemoizedPlan: The memoized plan.
+        """
+        return MemoizedPlan(self, maxsize)
+
+    @overload
+    def apply(self, dtm: pendulum.DateTime) -> pendulum.DateTime: ...
+
+    @overload
+    def apply(self, dtm: datetime.datetime) -> datetime.datetime: ...
+
+    def apply(self, dtm: pendulum.DateTime | datetime.datetime) -> pendulum.DateTime | datetime.datetime:
+        """Transform a datetime using the plan.
+
+        Naive datetimes and datetimes in timezones without transitions (e.g UTC or a fixed offset) are transformed with
+        integer arithmetic, and builtin datetimes with `zoneinfo` timezones without converting them to `pendulum`. The
+        type and timezone of the input are kept.
+
+        Args:
+            dtm (pendulum.DateTime | datetime.datetime): The datetime to be transformed.
+
+        Returns:
+            pendulum.DateTime | datetime.datetime: The resulting snapped datetime.
+        """
+        if not isinstance(dtm, datetime.datetime):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("Invalid datetime type. Must be pendulum.DateTime or datetime.datetime.")
+        return run(self._operations, self._fixed_offset_operations, dtm)
+
+
+class MemoizedPlan:
+    """A compiled plan caching its results per timezone and leading snap bucket.
+
+    When a plan starts with a snap, e.g `@d-2h`, its result only depends on the bucket the datetime falls in (e.g its
+    day), its timezone and its `fold`, so all the datetimes of a bucket share one computation. Plans starting with a
+    delta are applied without the cache. Memoized plans are created with `SnapPlan.memoize`.
+    """
+
+    __slots__ = ("_cache", "_plan", "_unit")
+
+    def __init__(self, plan: SnapPlan, maxsize: int = DEFAULT_MEMO_SIZE) -> None:
+        """Initialise the memoized plan.
+
+        Args:
+            plan (SnapPlan): The plan to apply.
+            maxsize (int): The maximum number of results to cache, least recently used results are evicted first.
+        """
+        self._plan = plan
+        self._unit = leading_snap(plan.operations)
+        self._cache: LRUCache[tuple[Any, ...], datetime.datetime] = LRUCache(maxsize)
+
+    @property
+    def plan(self) -> SnapPlan:
+        """SnapPlan: The memoized plan."""
+        return self._plan
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{type(self).__name__}({self._plan.expression!r})"
+
+    def cache_info(self) -> CacheInfo:
+        """Get the statistics of the result cache.
+
+        Returns:
+            CacheInfo: The hits, misses, evictions, maximum size and current size of the cache.
+        """
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Clear the result cache and reset its statistics."""
+        self._cache.clear()
+
+    @overload
+    def apply(self, dtm: pendulum.DateTime) -> pendulum.DateTime: ...
+
+    @overload
+    def apply(self, dtm: datetime.datetime) -> datetime.datetime: ...
+
+    def apply(self, dtm: pendulum.DateTime | datetime.datetime) -> pendulum.DateTime | datetime.datetime:
+        """Transform a datetime using the plan, reusing the result of an earlier datetime of the same bucket.
+
+        Args:
+            dtm (pendulum.DateTime | datetime.datetime): The datetime to be transformed.
+
+        Returns:
+            pendulum.DateTime | datetime.datetime: The resulting snapped datetime.
+        """
+        if self._unit is None:
+            return self._plan.apply(dtm)
+        if not isinstance(dtm, datetime.datetime):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("Invalid datetime type. Must be pendulum.DateTime or datetime.datetime.")
+        # `pendulum` datetimes are shifted out of skipped wall times when they are created
+        if not _is_pendulum(dtm) and skipped(dtm):
+            return self._plan.apply(dtm)
+        key = (type(dtm), dtm.tzinfo, dtm.fold, *bucket(self._unit, dtm))
+        result = self._cache.get(key)
+        if result is None:
+            result = self._plan.apply(dtm)
+            self._cache.put(key, result)
+        return result
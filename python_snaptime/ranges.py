@@ -0,0 +1,74 @@
+"""Module for generating ranges of snapped boundaries, e.g the axis of a time series.
+
+The start of a range is aligned with a snaptime string, e.g `@h`, and boundary `k` is the aligned start plus `k` steps,
+e.g `+15m`, added as a single delta. Month steps are therefore clamped to the end of the month without drifting, e.g a
+range from January 31st with a `+1mon` step gives February 29th, then March 31st, and day steps keep the wall time
+across DST transitions, exactly as `snap(start, "@h+{k * 15}m")` would.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+from python_snaptime import parsers
+from python_snaptime.models import Action, Operation
+from python_snaptime.optimizer import _signed
+from python_snaptime.plans import SnapPlan, run
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Iterator
+
+__all__ = ["snap_range"]
+
+_D = TypeVar("_D", bound="datetime.datetime")
+
+
+def _parse_step(step: str | SnapPlan) -> Operation:
+    plan = step if isinstance(step, SnapPlan) else parsers.compile(step if step[:1] in {"+", "-", "@"} else f"+{step}")
+    if len(plan.operations) != 1 or plan.operations[0].action == Action.SNAP or not plan.operations[0].time_int:
+        msg = f"Invalid range step `{plan.expression}`: must be a single non-zero time delta, e.g `+15m`."
+        raise ValueError(msg)
+    return plan.operations[0]
+
+
+def _shift(start: _D, step: Operation, steps: int) -> _D:
+    time_int = _signed(step) * steps
+    delta = (Operation(Action.SUB if time_int < 0 else Action.ADD, step.unit, abs(time_int)),)
+    return run(delta, delta, start)  # type: ignore[return-value]
+
+
+def _align(start: _D, align: str | SnapPlan | None) -> _D:
+    if align is None:
+        return start
+    plan = align if isinstance(align, SnapPlan) else parsers.compile(align)
+    return plan.apply(start)  # type: ignore[return-value]
+
+
+def _boundaries(first: _D, end: datetime.datetime, step: Operation) -> Iterator[_D]:
+    descending = _signed(step) < 0
+    steps = 0
+    boundary = first
+    while boundary > end if descending else boundary < end:
+        yield boundary
+        steps += 1
+        boundary = _shift(first, step, steps)
+
+
+def snap_range(
+    start: _D, end: datetime.datetime, step: str | SnapPlan, align: str | SnapPlan | None = None
+) -> Iterator[_D]:
+    """Lazily generate the boundaries from an aligned start up to an end.
+
+    Args:
+        start (pendulum.DateTime | datetime.datetime): The start of the range, the first boundary once aligned.
+        end (pendulum.DateTime | datetime.datetime): The end of the range, exclusive.
+        step (str | SnapPlan): The time delta between boundaries, e.g `+15m` or `15m`. A negative step, e.g `-1d`,
+            gives a descending range.
+        align (str | SnapPlan | None): A snaptime string, or compiled plan, to align the start with, e.g `@h`.
+
+    Returns:
+        Iterator[pendulum.DateTime | datetime.datetime]: The boundaries, of the same type and timezone as `start`.
+    """
+    # the arguments are validated before the first boundary is requested
+    return _boundaries(_align(start, align), end, _parse_step(step))
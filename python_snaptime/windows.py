@@ -0,0 +1,146 @@
+"""Module for evaluating time windows, i.e pairs of earliest and latest snaptime strings like `-24h@h` and `@h`.
+
+Both snaptime strings are applied to the same `now`, which is converted to the engine of its timezone once. The longest
+common prefix of their operations, e.g `@d` in `@d-7d` and `@d`, is applied once and each remaining suffix is applied
+to its result, which gives the same results as applying the whole chains.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, NamedTuple
+
+from python_snaptime import parsers
+from python_snaptime.cache import ThreadLocalCache
+from python_snaptime.plans import SnapPlan, _engine, _is_pendulum, from_pendulum, run, to_pendulum
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from python_snaptime.models import Operation
+
+__all__ = ["TimeWindow", "time_window", "time_windows"]
+
+_Chain = tuple["tuple[Operation, ...]", "tuple[Operation, ...]"]
+
+
+class TimeWindow(NamedTuple):
+    """The half-open interval `[earliest, latest)` of a time window."""
+
+    earliest: datetime.datetime
+    latest: datetime.datetime
+
+    def __contains__(self, dtm: object) -> bool:
+        """Check whether a datetime is within the window, i.e not before `earliest` and before `latest`."""
+        return isinstance(dtm, datetime.datetime) and self.earliest <= dtm < self.latest
+
+    @property
+    def duration(self) -> datetime.timedelta:
+        """datetime.timedelta: The time elapsed between the earliest and latest datetimes of the window."""
+        return self.latest - self.earliest
+
+
+def _common_prefix(a: tuple[Operation, ...], b: tuple[Operation, ...]) -> int:
+    length = 0
+    for operation_a, operation_b in zip(a, b):
+        if operation_a != operation_b:
+            break
+        length += 1
+    return length
+
+
+class _WindowPlan:
+    """The compiled earliest and latest plans of a window, split after their common prefix."""
+
+    __slots__ = ("earliest", "latest", "prefix")
+
+    def __init__(self, earliest: SnapPlan, latest: SnapPlan) -> None:
+        # the operations and the operations for timezones without transitions have different prefixes
+        common = _common_prefix(earliest.operations, latest.operations)
+        fixed_common = _common_prefix(earliest.fixed_offset_operations, latest.fixed_offset_operations)
+        self.prefix: _Chain = (earliest.operations[:common], earliest.fixed_offset_operations[:fixed_common])
+        self.earliest: _Chain = (earliest.operations[common:], earliest.fixed_offset_operations[fixed_common:])
+        self.latest: _Chain = (latest.operations[common:], latest.fixed_offset_operations[fixed_common:])
+
+
+_WINDOW_PLANS: ThreadLocalCache[tuple[str | SnapPlan, str | SnapPlan], _WindowPlan] = ThreadLocalCache(1024)
+
+
+def _get_window_plan(earliest: str | SnapPlan, latest: str | SnapPlan) -> _WindowPlan:
+    key = (earliest, latest)
+    window_plan = _WINDOW_PLANS.get(key)
+    if window_plan is None:
+        window_plan = _WindowPlan(
+            earliest if isinstance(earliest, SnapPlan) else parsers.compile(earliest),
+            latest if isinstance(latest, SnapPlan) else parsers.compile(latest),
+        )
+        _WINDOW_PLANS.put(key, window_plan)
+    return window_plan
+
+
+class _Evaluator:
+    """Applies chains of operations to a `now` converted once, caching the result of each prefix and chain."""
+
+    def __init__(self, now: datetime.datetime | None) -> None:
+        self.now = datetime.datetime.now(datetime.timezone.utc) if now is None else now
+        # a datetime converted to `pendulum` to be snapped is converted once, rather than per chain
+        self.converted = _engine(self.now) == "pendulum" and not _is_pendulum(self.now)
+        self.start = to_pendulum(self.now) if self.converted else self.now
+        self.prefixes: dict[_Chain, datetime.datetime] = {}
+        self.results: dict[tuple[_Chain, _Chain], datetime.datetime] = {}
+
+    def _apply(self, chain: _Chain, dtm: datetime.datetime) -> datetime.datetime:
+        return run(chain[0], chain[1], dtm) if chain[0] or chain[1] else dtm
+
+    def _convert(self, dtm: datetime.datetime) -> datetime.datetime:
+        return from_pendulum(dtm) if self.converted else dtm  # type: ignore[arg-type]
+
+    def window(self, window_plan: _WindowPlan) -> TimeWindow:
+        prefix = self.prefixes.get(window_plan.prefix)
+        if prefix is None:
+            prefix = self.prefixes[window_plan.prefix] = self._apply(window_plan.prefix, self.start)
+        bounds = []
+        for suffix in (window_plan.earliest, window_plan.latest):
+            result = self.results.get((window_plan.prefix, suffix))
+            if result is None:
+                result = self.results[window_plan.prefix, suffix] = self._convert(self._apply(suffix, prefix))
+            bounds.append(result)
+        return TimeWindow(*bounds)
+
+
+def time_window(earliest: str | SnapPlan, latest: str | SnapPlan, now: datetime.datetime | None = None) -> TimeWindow:
+    """Evaluate a time window, e.g `earliest="-24h@h"` and `latest="@h"`.
+
+    The results match `snap(now, earliest)` and `snap(now, latest)`.
+
+    Args:
+        earliest (str | SnapPlan): The snaptime string, or compiled plan, of the start of the window.
+        latest (str | SnapPlan): The snaptime string, or compiled plan, of the end of the window, exclusive.
+        now (pendulum.DateTime | datetime.datetime | None): The datetime both snaptime strings are applied to. The
+            current UTC time by default.
+
+    Returns:
+        TimeWindow: The window, whose datetimes are of the same type and timezone as `now`.
+    """
+    return _Evaluator(now).window(_get_window_plan(earliest, latest))
+
+
+def time_windows(
+    windows: Iterable[tuple[str | SnapPlan, str | SnapPlan]], now: datetime.datetime | None = None
+) -> list[TimeWindow]:
+    """Evaluate many time windows with the same `now`.
+
+    Each distinct prefix and snaptime string is applied once for the whole batch, e.g the `-24h@h` of
+    `("-24h@h", "@h")` and `("-24h@h", "-1h@h")`.
+
+    Args:
+        windows (Iterable[tuple[str | SnapPlan, str | SnapPlan]]): The earliest and latest snaptime strings, or
+            compiled plans, of each window.
+        now (pendulum.DateTime | datetime.datetime | None): The datetime the snaptime strings are applied to. The
+            current UTC time by default.
+
+    Returns:
+        list[TimeWindow]: The windows, in input order.
+    """
+    evaluator = _Evaluator(now)
+    return [evaluator.window(_get_window_plan(earliest, latest)) for earliest, latest in windows]
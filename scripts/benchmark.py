@@ -0,0 +1,120 @@
+"""Benchmark parsing and applying snaptime strings with `pytest-benchmark`.
+
+Usage:
+    make benchmark
+    poetry run pytest scripts/benchmark.py --benchmark-only [-k apply] [--benchmark-autosave]
+    poetry run pytest scripts/benchmark.py --benchmark-only --benchmark-compare [--benchmark-compare-fail=min:20%]
+
+Each benchmark runs over the snaptime strings of `scripts/snaptimes.py`: `short` chains are the first 10 strings (one to
+three operations), `long` chains the last 10 (six to fourteen operations). A round snaps or parses every string of the
+chain, and the time and the memory allocated per operation (one datetime snapped, or one snaptime string parsed) are
+saved in the `extra_info` of each benchmark as `ns_per_op` and `bytes_per_op`, the memory being the peak traced by
+`tracemalloc`. Runs saved with `--benchmark-autosave` are compared with `--benchmark-compare`, and
+`--benchmark-compare-fail` fails the run when a benchmark is slower than the saved run by more than a threshold.
+"""
+
+from __future__ import annotations
+
+import datetime
+import tracemalloc
+import zoneinfo
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import pendulum
+import pytest
+from snaptimes import SNAPTIMES
+
+from python_snaptime import parsers, snap
+from python_snaptime.parsers import _parse_raw_snaptime
+from python_snaptime.plans import SnapPlan
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+CHAINS = {"short": SNAPTIMES[:10], "long": SNAPTIMES[-10:]}
+INPUTS = {
+    "pendulum UTC": pendulum.datetime(2024, 12, 30, 13, 1, 10, 999999, tz="UTC"),
+    "pendulum America/New_York": pendulum.datetime(2024, 12, 30, 13, 1, 10, 999999, tz="America/New_York"),
+    "datetime naive": datetime.datetime(2024, 12, 30, 13, 1, 10, 999999),  # noqa: DTZ001
+    "datetime UTC": datetime.datetime(2024, 12, 30, 13, 1, 10, 999999, tzinfo=datetime.timezone.utc),
+    "datetime America/New_York": datetime.datetime(
+        2024, 12, 30, 13, 1, 10, 999999, tzinfo=zoneinfo.ZoneInfo("America/New_York")
+    ),
+}
+ARRAY_SIZE = 100_000
+
+
+class Benchmark(NamedTuple):
+    """A named list of calls, each snapping or parsing `size` datetimes or snaptime strings."""
+
+    name: str
+    calls: list[Callable[[], Any]]
+    size: int = 1
+
+
+def _benchmarks() -> Iterator[Benchmark]:
+    for chain, snaptimes in CHAINS.items():
+        yield Benchmark(f"parse {chain}", [lambda s=s: SnapPlan(_parse_raw_snaptime(s)) for s in snaptimes])
+    yield Benchmark("compile cached", [lambda s=s: parsers.compile(s) for s in SNAPTIMES])
+
+    for chain, snaptimes in CHAINS.items():
+        plans = [parsers.compile(snaptime) for snaptime in snaptimes]
+        for name, dtm in INPUTS.items():
+            yield Benchmark(f"apply {name} {chain}", [lambda p=p, d=dtm: p.apply(d) for p in plans])
+        for name, dtm in INPUTS.items():
+            yield Benchmark(f"snap {name} {chain}", [lambda s=s, d=dtm: snap(d, s) for s in snaptimes])
+
+    # a stream of events over a day, in buckets of an hour
+    events = [INPUTS["pendulum America/New_York"].add(seconds=i) for i in range(0, 86400, 97)]
+    memoized = parsers.compile("@h+10m").memoize()
+    yield Benchmark("memoized @h+10m", [lambda d=d: memoized.apply(d) for d in events])
+
+    try:
+        import numpy as np  # noqa: PLC0415
+
+        from python_snaptime.arrays import snap_array  # noqa: PLC0415
+        from python_snaptime.calendars import CalendarIndex  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        return
+    # about five years of timestamps, crossing ten DST transitions
+    arr = np.datetime64("2020-01-01", "us") + np.arange(ARRAY_SIZE) * np.timedelta64(1577, "s")
+    for chain, snaptimes in CHAINS.items():
+        for tz in ("UTC", "America/New_York"):
+            calls = [lambda s=s, tz=tz: snap_array(arr, s, tz=tz) for s in snaptimes]
+            yield Benchmark(f"snap_array {tz} {chain}", calls, ARRAY_SIZE)
+    index = CalendarIndex("America/New_York", arr[0], arr[-1])
+    yield Benchmark("CalendarIndex America/New_York @mon", [lambda: index.snap(arr, "mon")], ARRAY_SIZE)
+
+
+def _allocated(benchmark: Benchmark) -> float:
+    total = 0
+    tracemalloc.start()
+    try:
+        for call in benchmark.calls:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - before
+    finally:
+        tracemalloc.stop()
+    return total / (len(benchmark.calls) * benchmark.size)
+
+
+@pytest.mark.parametrize("case", list(_benchmarks()), ids=lambda case: case.name)
+def test_benchmark(benchmark: BenchmarkFixture, case: Benchmark) -> None:
+    """Time a benchmark, and record its time and memory allocated per operation."""
+
+    def run() -> None:
+        for call in case.calls:
+            call()
+
+    # caches are warmed before anything is measured
+    run()
+    benchmark.extra_info["bytes_per_op"] = _allocated(case)
+    benchmark(run)
+    benchmark.extra_info["ns_per_op"] = benchmark.stats.stats.min * 1e9 / (len(case.calls) * case.size)
@@ -0,0 +1,59 @@
+"""Benchmark the import time of python-snaptime using `python -X importtime`.
+
+Usage:
+    python scripts/importtime.py [--repeat 5] [--budget-ms 50]
+
+Each statement is run in a fresh interpreter, and the fastest cumulative import time of the `python_snaptime`
+modules is reported. With `--budget-ms`, the script exits with an error when a statement exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import python_snaptime": "import python_snaptime",
+    "from python_snaptime import snap": "from python_snaptime import snap",
+    "snap a builtin datetime": (
+        "import datetime; from python_snaptime import snap; snap(datetime.datetime(2024, 12, 30, 13), '@d-2h')"
+    ),
+}
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+
+def importtime(statement: str) -> int:
+    """Get the cumulative import time of the top-level `python_snaptime` imports of a statement, in microseconds."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        # only count the outermost python_snaptime imports, their dependencies are included in the cumulative time
+        if match and match.group(4).startswith("python_snaptime") and len(match.group(3)) == 1:
+            total += int(match.group(2))
+    return total
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters per statement")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail when a statement exceeds this budget")
+    args = parser.parse_args()
+
+    exceeded = False
+    for name, statement in STATEMENTS.items():
+        best = min(importtime(statement) for _ in range(args.repeat)) / 1000
+        over = args.budget_ms is not None and best > args.budget_ms
+        exceeded |= over
+        print(f"{name:<48} {best:8.1f} ms{'  (over budget)' if over else ''}")  # noqa: T201
+    return 1 if exceeded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Benchmark the scaling of `snap` with the number of threads calling it concurrently.
+
+Usage:
+    python scripts/threads.py [--threads 1 2 4 8] [--calls 20000] [--repeat 3] [--min-efficiency 0.8]
+
+Each thread snaps `--calls` datetimes with the snaptime strings of `scripts/snaptimes.py`, so the total work grows with
+the number of threads, and the throughput is the fastest of `--repeat` runs. The speedup is the throughput relative to
+one thread, and the efficiency the speedup per thread: near 1 when `snap` scales linearly. With the GIL, threads run
+one at a time and the efficiency is about `1 / threads`; on a free-threaded build (e.g `python3.13t`) it should stay
+near 1 up to the number of cores. With `--min-efficiency`, the script exits with an error when the efficiency of a
+thread count up to the number of cores is lower, e.g to check a free-threaded build in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import os
+import sys
+import sysconfig
+import threading
+import time
+import zoneinfo
+
+from snaptimes import SNAPTIMES
+
+from python_snaptime import snap
+
+INPUTS = [
+    datetime.datetime(2024, 12, 30, 13, 1, 10, 999999),  # noqa: DTZ001
+    datetime.datetime(2024, 12, 30, 13, 1, 10, 999999, tzinfo=datetime.timezone.utc),
+    datetime.datetime(2024, 12, 30, 13, 1, 10, 999999, tzinfo=zoneinfo.ZoneInfo("America/New_York")),
+]
+
+
+def _work(calls: int) -> None:
+    for i in range(calls):
+        snap(INPUTS[i % len(INPUTS)], SNAPTIMES[i % len(SNAPTIMES)])
+
+
+def throughput(threads: int, calls: int) -> float:
+    """Get the number of `snap` calls per second of a number of threads each making a number of calls."""
+    barrier = threading.Barrier(threads + 1)
+
+    def run() -> None:
+        barrier.wait()
+        _work(calls)
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * calls / (time.perf_counter() - start)
+
+
+def _build() -> str:
+    build = "free-threaded" if sysconfig.get_config_var("Py_GIL_DISABLED") else "default"
+    gil = "enabled" if getattr(sys, "_is_gil_enabled", lambda: True)() else "disabled"
+    return f"python {sys.version.split()[0]}, {build} build, GIL {gil}"
+
+
+def main() -> int:
+    """Run the benchmark."""
+    cores = os.cpu_count() or 1
+    default_threads = sorted({1, *(2**i for i in range(1, cores.bit_length())), cores})
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=default_threads, help="numbers of threads to run")
+    parser.add_argument("--calls", type=int, default=20_000, help="number of snap calls per thread")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs per number of threads")
+    parser.add_argument("--min-efficiency", type=float, default=None, help="fail when the efficiency is lower")
+    args = parser.parse_args()
+
+    print(f"{_build()}, {cores} cores")  # noqa: T201
+    print(f"{'threads':>8} {'calls/s':>12} {'speedup':>8} {'efficiency':>11}")  # noqa: T201
+    # the caches are warmed before anything is measured
+    _work(len(SNAPTIMES) * len(INPUTS))
+    single = max(throughput(1, args.calls) for _ in range(args.repeat))
+    below = False
+    for threads in args.threads:
+        result = single if threads == 1 else max(throughput(threads, args.calls) for _ in range(args.repeat))
+        speedup = result / single
+        efficiency = speedup / threads
+        over = args.min_efficiency is not None and threads <= cores and efficiency < args.min_efficiency
+        below |= over
+        print(f"{threads:>8} {result:12.0f} {speedup:8.2f} {efficiency:11.2f}{'  (below)' if over else ''}")  # noqa: T201
+    return 1 if below else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+from datetime import timedelta, tzinfo
+
+
+class CentralEuropeanTime(tzinfo):
+    # a timezone which is not a `zoneinfo` timezone, whose datetimes are converted to `pendulum` to be snapped
+    def utcoffset(self, dtm):
+        return None if dtm is None else timedelta(hours=1)
+
+    def dst(self, dtm):
+        return timedelta(0)
+
+    def tzname(self, dtm):
+        return "CET"
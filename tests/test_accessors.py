@@ -0,0 +1,72 @@
+import pendulum
+import pytest
+
+from python_snaptime import snap
+
+pd = pytest.importorskip("pandas")
+
+import python_snaptime.accessors  # noqa: E402, F401
+
+
+@pytest.fixture()
+def series():
+    values = pd.Series(pd.date_range("2024-03-09", periods=8, freq="7h", tz="America/New_York"), name="timestamp")
+    values[3] = pd.NaT
+    return values
+
+
+class TestSnaptimeAccessor:
+    def test_snaptime_series(self, series):
+        # act
+        result = series.snaptime("@d-2h")
+
+        # assert
+        assert result.dtype == series.dtype
+        assert result.name == "timestamp"
+        assert result.index.equals(series.index)
+        assert result.isna().tolist() == series.isna().tolist()
+        for value, snapped in zip(series.dropna(), result.dropna()):
+            assert snapped == snap(pendulum.instance(value.to_pydatetime()), "@d-2h")
+
+    def test_snaptime_naive_series(self):
+        # arrange
+        series = pd.Series(pd.to_datetime(["2024-12-30 13:01:10", None]))
+
+        # act
+        result = series.snaptime("@h-30m")
+
+        # assert
+        assert result.dtype == series.dtype
+        assert result.tolist()[0] == pd.Timestamp("2024-12-30 12:30:00")
+        assert pd.isna(result.tolist()[1])
+
+    def test_snaptime_datetime_index(self, series):
+        # arrange
+        index = pd.DatetimeIndex(series)
+
+        # act
+        result = index.snaptime("@w")
+
+        # assert
+        assert isinstance(result, pd.DatetimeIndex)
+        assert result.dtype == index.dtype
+        assert result.name == "timestamp"
+        assert result[0] == pd.Timestamp("2024-03-04", tz="America/New_York")
+
+    def test_snaptime_second_resolution(self):
+        # arrange
+        series = pd.Series(pd.to_datetime(["2024-12-30 13:01:10"]).as_unit("s"))
+
+        # act
+        result = series.snaptime("@h")
+
+        # assert
+        assert result.dtype == series.dtype
+        assert result[0] == pd.Timestamp("2024-12-30 13:00:00")
+        with pytest.raises(ValueError, match="cannot be represented with the `s` resolution"):
+            series.snaptime("+1ms")
+
+    def test_snaptime_invalid_dtype(self):
+        # act/assert
+        with pytest.raises(AttributeError, match="Can only use the .snaptime accessor with datetime values."):
+            pd.Series([1, 2]).snaptime("@d")
@@ -0,0 +1,125 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime.aio import asnap_batch, asnap_iter
+from python_snaptime.parsers import compile
+
+DATETIMES = [
+    datetime(2024, 3, 30, tzinfo=ZoneInfo("Europe/London")) + timedelta(minutes=37 * i) for i in range(200)
+] + [pendulum.datetime(2024, 11, 3, 1, 30, tz="America/New_York"), datetime(2024, 1, 1, tzinfo=timezone.utc)]
+
+
+async def _aiter(values):
+    for value in values:
+        yield value
+
+
+async def _collect(values):
+    return [value async for value in values]
+
+
+async def _count_switches(coroutine):
+    # counts how often the event loop runs another task while the coroutine is running
+    switches = 0
+    done = False
+
+    async def ticker():
+        nonlocal switches
+        while not done:
+            switches += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    switches = 0
+    result = await coroutine
+    done = True
+    await task
+    return result, switches
+
+
+class TestAsnapBatch:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 512])
+    def test_matches_serial(self, chunk_size):
+        # arrange
+        expected = [compile("@w-2h").apply(dtm) for dtm in DATETIMES]
+
+        # act
+        result = asyncio.run(asnap_batch(DATETIMES, "@w-2h", chunk_size=chunk_size))
+
+        # assert
+        assert result == expected
+        assert [type(dtm) for dtm in result] == [type(dtm) for dtm in expected]
+
+    def test_yields_between_chunks(self):
+        # act
+        result, switches = asyncio.run(_count_switches(asnap_batch(DATETIMES, "@d", chunk_size=10)))
+
+        # assert
+        assert len(result) == len(DATETIMES)
+        assert switches >= len(DATETIMES) // 10
+
+    def test_small_input_inline(self):
+        # act
+        result, switches = asyncio.run(_count_switches(asnap_batch(DATETIMES, "@d", chunk_size=1_000)))
+
+        # assert
+        assert len(result) == len(DATETIMES)
+        assert switches == 0
+
+    def test_executor(self):
+        # arrange
+        expected = [compile("@mon+1d").apply(dtm) for dtm in DATETIMES]
+
+        # act
+        with ThreadPoolExecutor(2) as executor:
+            result = asyncio.run(asnap_batch(iter(DATETIMES), "@mon+1d", chunk_size=16, executor=executor))
+
+        # assert
+        assert result == expected
+
+    def test_async_iterable(self):
+        # act
+        result = asyncio.run(asnap_batch(_aiter(DATETIMES), compile("@h"), chunk_size=16))
+
+        # assert
+        assert result == [compile("@h").apply(dtm) for dtm in DATETIMES]
+
+    def test_invalid_chunk_size(self):
+        # act/assert
+        with pytest.raises(ValueError, match="Chunk size must be a positive integer."):
+            asyncio.run(asnap_batch(DATETIMES, "@d", chunk_size=0))
+
+
+class TestAsnapIter:
+    @pytest.mark.parametrize("values", [DATETIMES, _aiter])
+    def test_matches_serial(self, values):
+        # arrange
+        _values = DATETIMES if isinstance(values, list) else values(DATETIMES)
+
+        # act
+        result = asyncio.run(_collect(asnap_iter(_values, "@q-1s", chunk_size=9)))
+
+        # assert
+        assert result == [compile("@q-1s").apply(dtm) for dtm in DATETIMES]
+
+    def test_executor(self):
+        # act
+        with ThreadPoolExecutor(1) as executor:
+            result = asyncio.run(_collect(asnap_iter(DATETIMES, "@d", chunk_size=50, executor=executor)))
+
+        # assert
+        assert result == [compile("@d").apply(dtm) for dtm in DATETIMES]
+
+    def test_yields_between_chunks(self):
+        # act
+        result, switches = asyncio.run(_count_switches(_collect(asnap_iter(DATETIMES, "@d", chunk_size=10))))
+
+        # assert
+        assert len(result) == len(DATETIMES)
+        assert switches >= len(DATETIMES) // 10
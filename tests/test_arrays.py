@@ -0,0 +1,247 @@
+import re
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime.parsers import compile, parse_snaptime_string
+from python_snaptime.ranges import snap_range
+
+np = pytest.importorskip("numpy")
+
+from python_snaptime.arrays import _TRANSITIONS, snap_array, snap_range_array  # noqa: E402
+
+SNAPTIMES = [
+    "@d",
+    "@h-2h",
+    "@w@d+1000us",
+    "@mon-1w+250ms",
+    "@q+1mon-750us",
+    "@y+3mon@q-750ms",
+    "@w+3d@d-12h+350ms",
+    "@y-1q@q+1mon-900ms",
+    "@d@h@m@s-45s@m+15m+500ms",
+    "@y-2y@q+3q@mon-9mon@w+26w@d-150d@h+1800h@m-54000m@s+3240000s-1500ms+2000us",
+    "+1d",
+    "-1mon",
+]
+
+
+def _reference(values, snaptime, tz):
+    results = []
+    for value in values.astype("datetime64[us]").tolist():
+        if tz is None:
+            dtm = pendulum.instance(value)
+        else:
+            dtm = pendulum.instance(value.replace(tzinfo=timezone.utc)).in_timezone(tz)
+        result = parse_snaptime_string(snaptime, dtm).in_timezone("UTC")
+        results.append(result.naive())
+    return np.array(results, dtype="datetime64[us]")
+
+
+@pytest.fixture()
+def dst_values():
+    # every 20 minutes across the DST transitions of America/New_York and Europe/London in 2024
+    return np.concatenate(
+        [
+            np.arange("2024-03-09T12:00", "2024-03-11T12:00", np.timedelta64(20, "m"), dtype="datetime64[us]"),
+            np.arange("2024-03-30T12:00", "2024-04-01T12:00", np.timedelta64(20, "m"), dtype="datetime64[us]"),
+            np.arange("2024-10-26T12:00", "2024-10-28T12:00", np.timedelta64(20, "m"), dtype="datetime64[us]"),
+            np.arange("2024-11-02T12:00", "2024-11-04T12:00", np.timedelta64(20, "m"), dtype="datetime64[us]"),
+        ]
+    ) + np.timedelta64(1234567, "us")
+
+
+class TestSnapArray:
+    @pytest.mark.parametrize("snaptime", SNAPTIMES)
+    @pytest.mark.parametrize(
+        "tz", [None, "UTC", "America/New_York", "Europe/London", timezone(timedelta(hours=5, minutes=30))]
+    )
+    def test_snap_array_matches_handlers(self, snaptime, tz, dst_values):
+        # act
+        result = snap_array(dst_values, snaptime, tz=tz)
+
+        # assert
+        np.testing.assert_array_equal(result, _reference(dst_values, snaptime, tz))
+
+    def test_snap_array_nanoseconds(self):
+        # arrange
+        arr = np.array(["2024-12-30T13:01:10.999999999", "2024-03-10T06:59:59.000000001"], dtype="datetime64[ns]")
+
+        # act
+        result = snap_array(arr, "@h-2h+1us", tz="America/New_York")
+
+        # assert
+        assert result.dtype == np.dtype("datetime64[ns]")
+        np.testing.assert_array_equal(
+            result,
+            np.array(["2024-12-30T11:00:00.000001", "2024-03-10T04:00:00.000001"], dtype="datetime64[ns]"),
+        )
+
+    def test_snap_array_nat(self):
+        # arrange
+        arr = np.array(["2024-12-30T13:01:10", "NaT"], dtype="datetime64[us]")
+
+        # act
+        result = snap_array(arr, "@d")
+
+        # assert
+        np.testing.assert_array_equal(result, np.array(["2024-12-30", "NaT"], dtype="datetime64[us]"))
+
+    def test_snap_array_out(self):
+        # arrange
+        arr = np.array([["2024-12-30T13:01:10"], ["2024-12-31T13:01:10"]], dtype="datetime64[us]")
+        out = np.empty_like(arr)
+
+        # act
+        result = snap_array(arr, compile("@d"), out=out)
+
+        # assert
+        assert result is out
+        np.testing.assert_array_equal(out, np.array([["2024-12-30"], ["2024-12-31"]], dtype="datetime64[us]"))
+
+    def test_snap_array_out_invalid(self):
+        # arrange
+        arr = np.array(["2024-12-30T13:01:10"], dtype="datetime64[us]")
+
+        # act/assert
+        with pytest.raises(
+            ValueError, match=re.escape("Output array must have the same shape and dtype as the input array.")
+        ):
+            snap_array(arr, "@d", out=np.empty(1, dtype="datetime64[ns]"))
+
+    def test_snap_array_week_skipped_day(self):
+        # arrange
+        arr = np.array(["2011-12-30T12:26:00", "2011-12-31T12:26:00"], dtype="datetime64[us]")  # 2011-12-31 in Apia
+
+        # act
+        result = snap_array(arr, "@w", tz="Pacific/Apia")
+
+        # assert
+        np.testing.assert_array_equal(
+            result, np.array(["2011-12-26T10:00", "2011-12-26T10:00"], dtype="datetime64[us]")
+        )
+
+    @pytest.mark.parametrize("arr", [np.array([1, 2]), np.array(["2024-12-30"], dtype="datetime64[s]")])
+    def test_snap_array_invalid_dtype(self, arr):
+        # act/assert
+        with pytest.raises(TypeError, match=re.escape("Invalid array type. Must be datetime64[us] or datetime64[ns].")):
+            snap_array(arr, "@d")
+
+
+def _transition_values(tz, years):
+    # UTC instants on both sides of every transition of a timezone in the given years, found hour by hour
+    values = []
+    for year in years:
+        dtm = datetime(year, 1, 1, tzinfo=timezone.utc)
+        offset = dtm.astimezone(ZoneInfo(tz)).utcoffset()
+        while dtm.year == year:
+            dtm += timedelta(hours=1)
+            if dtm.astimezone(ZoneInfo(tz)).utcoffset() != offset:
+                offset = dtm.astimezone(ZoneInfo(tz)).utcoffset()
+                for seconds in (-7200, -3600, -1800, -1, 0, 1, 1800, 3600, 7200):
+                    values.append(dtm.replace(tzinfo=None) + timedelta(seconds=seconds, microseconds=123))
+    return np.array(values, dtype="datetime64[us]")
+
+
+class TestTransitions:
+    @pytest.mark.parametrize("snaptime", ["@d", "@h", "@w", "@h+30m", "+1d", "-1mon", "@d-1h"])
+    @pytest.mark.parametrize(
+        ("tz", "years"),
+        [
+            ("Europe/London", [1847, 1941, 1968, 2024, 2150]),
+            ("America/New_York", [1918, 1974, 2024]),
+            ("Australia/Lord_Howe", [2024]),
+            ("Pacific/Apia", [2011]),
+        ],
+    )
+    def test_matches_handlers(self, snaptime, tz, years):
+        # arrange
+        if tz == "Pacific/Apia" and snaptime == "@w":
+            pytest.skip("pendulum does not terminate when snapping the skipped day to the week")
+        values = _transition_values(tz, years)
+
+        # act
+        result = snap_array(values, snaptime, tz=tz)
+
+        # assert
+        np.testing.assert_array_equal(result, _reference(values, snaptime, tz))
+
+    def test_table_cached_and_extended(self):
+        # arrange
+        tz = ZoneInfo("Europe/Paris")
+        _TRANSITIONS.clear()
+
+        # act
+        snap_array(np.array(["2024-06-01"], dtype="datetime64[us]"), "@d", tz=tz)
+        table = _TRANSITIONS.get(tz)
+        snap_array(np.array(["2024-07-01"], dtype="datetime64[ns]"), "@d", tz=tz)
+        cached = _TRANSITIONS.get(tz)
+        result = snap_array(np.array(["1990-03-25T00:59:59", "1990-03-25T01:00"], dtype="datetime64[us]"), "@h", tz=tz)
+
+        # assert
+        assert cached is table
+        assert _TRANSITIONS.get(tz) is not table
+        assert _TRANSITIONS.get(tz).covers(table.start, table.end)
+        assert result.tolist() == [datetime(1990, 3, 25, 0), datetime(1990, 3, 25, 1)]
+
+
+def test_snap_array_datetime_input():
+    # arrange
+    arr = [datetime(2024, 12, 30, 13, 1, 10)]
+
+    # act
+    result = snap_array(np.array(arr, dtype="datetime64[us]"), "@d-2h")
+
+    # assert
+    assert result.tolist() == [datetime(2024, 12, 29, 22, 0)]
+
+
+class TestSnapRangeArray:
+    @pytest.mark.parametrize("step", ["+15m", "-90m", "+1d", "-1w", "+1mon", "+1q"])
+    @pytest.mark.parametrize("tz", [None, "Europe/London", "America/New_York"])
+    def test_matches_snap_range(self, step, tz):
+        # arrange
+        start = datetime(2024, 3, 30, 22, 17, tzinfo=timezone.utc)
+        end = start + timedelta(days=60) if step.startswith("+") else start - timedelta(days=60)
+        lazy_start = start.astimezone(ZoneInfo(tz)) if tz else start.replace(tzinfo=None)
+        lazy_end = end if tz else end.replace(tzinfo=None)
+        expected = [
+            dtm.astimezone(timezone.utc).replace(tzinfo=None) if tz else dtm
+            for dtm in snap_range(lazy_start, lazy_end, step, align="@h")
+        ]
+
+        # act
+        result = snap_range_array(start, end, step, align="@h", tz=tz)
+
+        # assert
+        assert result.dtype == np.dtype("datetime64[us]")
+        assert result.tolist() == expected
+
+    def test_month_end(self):
+        # act
+        result = snap_range_array("2024-01-31T10:00", "2024-06-01", "1mon", unit="ns")
+
+        # assert
+        assert result.dtype == np.dtype("datetime64[ns]")
+        assert result.astype("datetime64[D]").astype(str).tolist() == [
+            "2024-01-31",
+            "2024-02-29",
+            "2024-03-31",
+            "2024-04-30",
+            "2024-05-31",
+        ]
+
+    def test_long_range(self):
+        # act
+        result = snap_range_array("2024-01-01", "2025-01-01", "+7s", tz="Europe/London")
+
+        # assert
+        assert len(result) == 366 * 86400 // 7 + 1
+        assert (np.diff(result.view("int64")) == 7_000_000).all()
+
+    def test_empty(self):
+        # act/assert
+        assert len(snap_range_array("2024-01-01", "2024-01-01", "+1h")) == 0
+        assert len(snap_range_array("2024-01-01", "2024-01-02", "-1h")) == 0
@@ -0,0 +1,93 @@
+import re
+from datetime import datetime, timedelta
+
+import pendulum
+import pytest
+
+from python_snaptime.main import snap
+
+pa = pytest.importorskip("pyarrow")
+np = pytest.importorskip("numpy")
+
+from python_snaptime.arrow import _values, snap_arrow  # noqa: E402
+
+
+def _to_pylist(arr):
+    # `ns` timestamps are converted to `pandas` timestamps, so they are compared as microseconds
+    return arr.cast(pa.timestamp("us", tz=arr.type.tz)).to_pylist()
+
+
+@pytest.fixture()
+def values():
+    # every 37 minutes and a second across the start of British Summer Time, with a null every seventh value
+    start = datetime(2024, 3, 31, 0, 30)
+    return [None if i % 7 == 3 else start + timedelta(minutes=37 * i, seconds=i) for i in range(60)]
+
+
+class TestSnapArrow:
+    @pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+    @pytest.mark.parametrize("tz", [None, "UTC", "Europe/London", "+05:30", "-03:00"])
+    def test_matches_snap(self, unit, tz, values):
+        # arrange
+        arr = pa.array(values, type=pa.timestamp(unit, tz=tz))
+
+        # act
+        result = snap_arrow(arr, "@h-10m")
+
+        # assert
+        assert result.type == arr.type
+        expected = [
+            None if dtm is None else snap(pendulum.instance(dtm) if dtm.tzinfo else dtm, "@h-10m")
+            for dtm in _to_pylist(arr)
+        ]
+        assert _to_pylist(result) == expected
+        assert [dtm and dtm.utcoffset() for dtm in _to_pylist(result)] == [dtm and dtm.utcoffset() for dtm in expected]
+
+    def test_nulls_and_slices(self, values):
+        # arrange
+        arr = pa.array(values, type=pa.timestamp("us", tz="Europe/London")).slice(5, 40)
+
+        # act
+        result = snap_arrow(arr, "@d")
+
+        # assert
+        result.validate(full=True)
+        assert result.null_count == arr.null_count
+        assert result.is_null().to_pylist() == arr.is_null().to_pylist()
+
+    def test_chunked_array(self, values):
+        # arrange
+        arr = pa.array(values, type=pa.timestamp("ms"))
+        chunked = pa.chunked_array([arr.slice(0, 10), arr.slice(10)])
+
+        # act
+        result = snap_arrow(chunked, "@d")
+
+        # assert
+        assert isinstance(result, pa.ChunkedArray)
+        assert [len(chunk) for chunk in result.chunks] == [10, 50]
+        assert result.combine_chunks().equals(snap_arrow(arr, "@d"))
+
+    def test_values_are_not_copied(self):
+        # arrange
+        arr = pa.array([1, 2, 3], type=pa.timestamp("us")).slice(1)
+
+        # act
+        result = _values(arr)
+
+        # assert
+        assert result.tolist() == [2, 3]
+        assert result.ctypes.data == arr.buffers()[1].address + 8
+
+    def test_unrepresentable(self):
+        # arrange
+        arr = pa.array([datetime(2024, 12, 30, 13)], type=pa.timestamp("s"))
+
+        # act/assert
+        with pytest.raises(ValueError, match=re.escape("cannot be represented with the `s` resolution of the input.")):
+            snap_arrow(arr, "+1ms")
+
+    def test_invalid_type(self):
+        # act/assert
+        with pytest.raises(TypeError, match="Invalid array type. Must be an Arrow timestamp array."):
+            snap_arrow(pa.array([1, 2]), "@d")
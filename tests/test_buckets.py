@@ -0,0 +1,153 @@
+from datetime import datetime, timezone
+
+import pendulum
+import pytest
+
+from python_snaptime.main import snap
+from python_snaptime.models import Unit
+
+np = pytest.importorskip("numpy")
+
+from python_snaptime.buckets import bucket_ids, histogram  # noqa: E402
+
+
+@pytest.fixture()
+def dst_values():
+    # every 7 minutes across the DST transitions of Europe/London in 2024
+    return np.concatenate(
+        [
+            np.arange("2024-03-30T12:00", "2024-04-01T12:00", np.timedelta64(7, "m"), dtype="datetime64[us]"),
+            np.arange("2024-10-26T12:00", "2024-10-28T12:00", np.timedelta64(7, "m"), dtype="datetime64[us]"),
+        ]
+    )
+
+
+class TestBucketIds:
+    @pytest.mark.parametrize("unit", ["s", "m", "h", "d", "w", "mon", "q", "y"])
+    @pytest.mark.parametrize("tz", [None, "Europe/London", "Asia/Kolkata"])
+    def test_matches_snap(self, unit, tz, dst_values):
+        # arrange
+        values = np.concatenate(
+            [dst_values, np.arange("2023-11-01", "2025-02-01", 86_400 * 3 + 1, dtype="datetime64[s]")]
+        )
+        values = values.astype("datetime64[us]")
+        snapped = []
+        for value in values.tolist():
+            dtm = pendulum.instance(value) if tz is None else pendulum.instance(value.replace(tzinfo=timezone.utc))
+            snapped.append(snap(dtm.in_timezone(tz) if tz else dtm, f"@{unit}").timestamp())
+
+        # act
+        result = bucket_ids(values, unit, tz=tz)
+
+        # assert
+        keys = np.array(snapped)
+        order = np.argsort(keys, kind="stable")
+        # timestamps share a bucket when they snap to the same datetime, and later buckets have larger indices
+        assert np.array_equal(np.diff(keys[order]) != 0, np.diff(result[order]) != 0)
+        assert (np.diff(result[order]) >= 0).all()
+
+    @pytest.mark.parametrize(
+        ("unit", "origin", "expected"),
+        [
+            ("h", None, [473_352, 473_353, 473_354]),
+            (Unit.HOUR, "2024-01-01T01:30", [-1, 0, 1]),
+            ("@2h", "2024-01-01T01:30", [-1, 0, 0]),
+            ("15m", "2024-01-01", [0, 4, 11]),
+            ("d", datetime(2023, 12, 31, 23, tzinfo=timezone.utc), [1, 1, 1]),
+            ("2w", np.datetime64("2023-12-25"), [0, 0, 0]),
+            ("q", "2023-05-17", [3, 3, 3]),
+        ],
+    )
+    def test_units_and_origins(self, unit, origin, expected):
+        # arrange
+        values = np.array(
+            ["2024-01-01T00:10", "2024-01-01T01:10", "2024-01-01T02:59:59.999999"], dtype="datetime64[us]"
+        )
+
+        # act
+        result = bucket_ids(values, unit, origin=origin)
+
+        # assert
+        assert result.dtype == np.int64
+        assert result.tolist() == expected
+
+    def test_dst_days(self):
+        # arrange
+        values = np.array(
+            ["2024-10-26T22:59", "2024-10-26T23:00", "2024-10-27T23:59", "2024-10-28T00:00"], dtype="datetime64[us]"
+        )
+
+        # act
+        result = bucket_ids(values, "d", origin="2024-10-26T00:00", tz="Europe/London")
+
+        # assert
+        # the 27th is 25 hours long, from 23:00 UTC on the 26th to 00:00 UTC on the 28th
+        assert result.tolist() == [0, 1, 1, 2]
+
+    def test_nat_and_shape(self):
+        # arrange
+        values = np.array(
+            [["2024-01-01T10:00", "NaT"], ["2024-01-02T10:00", "2024-01-03T10:00"]], dtype="datetime64[ns]"
+        )
+
+        # act
+        result = bucket_ids(values, "d", origin="2024-01-01")
+
+        # assert
+        assert result.shape == (2, 2)
+        assert result.tolist() == [[0, np.iinfo(np.int64).min], [1, 2]]
+
+    @pytest.mark.parametrize(
+        ("unit", "match"),
+        [
+            ("ms", "must be a positive multiple of a snap unit"),
+            ("0h", "must be a positive multiple of a snap unit"),
+            ("h15", "Invalid bucket unit `h15`."),
+            ("15x", "unknown time unit `x`"),
+        ],
+    )
+    def test_invalid_unit(self, unit, match):
+        # act/assert
+        with pytest.raises(ValueError, match=match):
+            bucket_ids(np.array(["2024-01-01"], dtype="datetime64[us]"), unit)
+
+    def test_invalid_array(self):
+        # act/assert
+        with pytest.raises(TypeError, match="Invalid array type."):
+            bucket_ids(np.array(["2024-01-01"], dtype="datetime64[D]"), "d")
+
+
+class TestHistogram:
+    def test_dst_days(self, dst_values):
+        # act
+        result = histogram(dst_values, "d", "2024-03-30", "2024-04-01", tz="Europe/London")
+
+        # assert
+        # 12 hours on the 30th, 23 hours on the 31st, and the hour on the 1st before midnight UTC
+        assert result.tolist() == [103, 197, 9]
+        assert result.sum() == np.count_nonzero(
+            (dst_values >= np.datetime64("2024-03-30")) & (dst_values < np.datetime64("2024-04-01"))
+        )
+
+    def test_multiple_of_unit(self):
+        # arrange
+        values = np.arange("2024-01-01", "2024-01-02", np.timedelta64(10, "m"), dtype="datetime64[us]")
+
+        # act
+        result = histogram(values, "4h", "2024-01-01T02:00", "2024-01-01T12:30")
+
+        # assert
+        assert result.tolist() == [24, 24, 15]
+
+    def test_empty(self):
+        # arrange
+        values = np.array(["2024-01-01", "NaT"], dtype="datetime64[us]")
+
+        # act/assert
+        assert histogram(values, "h", "2024-01-02", "2024-01-02").tolist() == []
+        assert histogram(values, "h", "2024-01-02", "2024-01-02T03:00").tolist() == [0, 0, 0]
+
+    def test_invalid_boundary(self):
+        # act/assert
+        with pytest.raises(ValueError, match="Boundaries must not be NaT."):
+            histogram(np.array(["2024-01-01"], dtype="datetime64[us]"), "h", "NaT", "2024-01-02")
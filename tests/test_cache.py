@@ -0,0 +1,217 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from python_snaptime.cache import CacheInfo, LRUCache, ThreadLocalCache
+
+
+def _in_thread(function):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(function()))
+    thread.start()
+    thread.join()
+    return results[0]
+
+
+class TestLRUCache:
+    def test_lru_cache_hit_and_miss(self):
+        # arrange
+        cache = LRUCache(2)
+        cache.put("a", 1)
+
+        # act
+        hit = cache.get("a")
+        miss = cache.get("b")
+
+        # assert
+        assert hit == 1
+        assert miss is None
+        assert cache.info() == CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1)
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        # arrange
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        # act
+        cache.put("c", 3)
+
+        # assert
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.info().evictions == 1
+
+    def test_lru_cache_shrink_maxsize(self):
+        # arrange
+        cache = LRUCache(3)
+        for key, value in (("a", 1), ("b", 2), ("c", 3)):
+            cache.put(key, value)
+
+        # act
+        cache.maxsize = 1
+
+        # assert
+        assert cache.info() == CacheInfo(hits=0, misses=0, evictions=2, maxsize=1, currsize=1)
+        assert cache.get("c") == 3
+
+    def test_lru_cache_disabled(self):
+        # arrange
+        cache = LRUCache(0)
+
+        # act
+        cache.put("a", 1)
+
+        # assert
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_cache_disabled_does_not_evict(self):
+        # arrange
+        cache = LRUCache(0)
+
+        # act
+        cache.put("a", 1)
+        result = cache.setdefault("b", 2)
+
+        # assert
+        assert result == 2
+        assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=0, currsize=0)
+
+    def test_lru_cache_clear(self):
+        # arrange
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.get("a")
+
+        # act
+        cache.clear()
+
+        # assert
+        assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=2, currsize=0)
+
+    def test_lru_cache_invalid_maxsize(self):
+        # act/assert
+        with pytest.raises(ValueError, match="Cache size must be a positive integer or zero."):
+            LRUCache(-1)
+
+
+class TestThreadLocalCache:
+    def test_thread_local_cache_hit_and_miss(self):
+        # arrange
+        cache = ThreadLocalCache(2)
+        cache.put("a", 1)
+
+        # act
+        hits = [cache.get("a") for _ in range(3)]
+        miss = cache.get("b")
+
+        # assert
+        assert hits == [1, 1, 1]
+        assert miss is None
+        assert cache.info() == CacheInfo(hits=3, misses=1, evictions=0, maxsize=2, currsize=1)
+
+    def test_thread_local_cache_shared_between_threads(self):
+        # arrange
+        cache = ThreadLocalCache(2)
+        cache.put("a", 1)
+
+        # act
+        result = _in_thread(lambda: (cache.get("a"), cache.get("a"), cache.setdefault("b", 2)))
+
+        # assert
+        assert result == (1, 1, 2)
+        assert cache.get("b") == 2
+        # the hits of the thread are kept after it exits
+        assert cache.info() == CacheInfo(hits=3, misses=0, evictions=0, maxsize=2, currsize=2)
+
+    def test_thread_local_cache_clear(self):
+        # arrange
+        cache = ThreadLocalCache(2)
+        cache.put("a", 1)
+        cache.get("a")
+
+        # act
+        cache.clear()
+
+        # assert
+        assert cache.get("a") is None
+        assert _in_thread(lambda: cache.get("a")) is None
+        assert cache.info() == CacheInfo(hits=0, misses=2, evictions=0, maxsize=2, currsize=0)
+
+    def test_thread_local_cache_disabled(self):
+        # arrange
+        cache = ThreadLocalCache(2)
+        cache.put("a", 1)
+
+        # act
+        cache.maxsize = 0
+
+        # assert
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.setdefault("b", 2) == 2
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        # only the entry cached before the cache was disabled is evicted
+        assert cache.info() == CacheInfo(hits=0, misses=3, evictions=1, maxsize=0, currsize=0)
+
+    def test_thread_local_cache_eviction_invalidates_fronts(self):
+        # arrange
+        cache = ThreadLocalCache(2)
+        cache.put("a", 1)
+        looked_up, evicted = threading.Event(), threading.Event()
+
+        def work():
+            first = cache.get("a")
+            looked_up.set()
+            evicted.wait()
+            return first, cache.get("a")
+
+        # act
+        with ThreadPoolExecutor(1) as executor:
+            future = executor.submit(work)
+            looked_up.wait()
+            cache.put("b", 2)
+            cache.put("c", 3)
+            evicted.set()
+            result = future.result()
+
+        # assert
+        assert result == (1, None)
+        assert cache.info().evictions == 1
+
+    def test_thread_local_cache_front_hits_are_recent(self):
+        # arrange
+        cache = ThreadLocalCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        # act
+        for _ in range(ThreadLocalCache._TOUCH_BATCH):
+            cache.get("a")
+        cache.put("c", 3)
+
+        # assert
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_thread_local_cache_concurrent(self):
+        # arrange
+        cache = ThreadLocalCache(8)
+        barrier = threading.Barrier(8)
+
+        def work():
+            barrier.wait()
+            return all(cache.setdefault(i % 16, i % 16) == i % 16 for i in range(1000))
+
+        # act
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: work(), range(8)))
+
+        # assert
+        assert results == [True] * 8
+        assert len(cache) == 8
@@ -0,0 +1,126 @@
+import re
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime.main import snap
+from python_snaptime.models import Unit
+
+np = pytest.importorskip("numpy")
+
+from python_snaptime.arrays import snap_array  # noqa: E402
+from python_snaptime.calendars import CalendarIndex  # noqa: E402
+
+
+@pytest.fixture()
+def values():
+    # random instants over thirty years
+    rng = np.random.default_rng(0)
+    arr = np.datetime64("1995-01-01", "us") + rng.integers(0, 30 * 365 * 86_400_000_000, 5000)
+    return arr.astype("datetime64[us]")
+
+
+class TestCalendarIndex:
+    @pytest.mark.parametrize("unit", ["mon", "@q", "y"])
+    @pytest.mark.parametrize(
+        "tz", [None, "UTC", "Europe/London", "America/St_Johns", "America/Sao_Paulo", "America/Havana"]
+    )
+    def test_matches_snap_array(self, unit, tz, values):
+        # arrange
+        index = CalendarIndex(tz, values.min(), values.max())
+        starts = index.starts(unit).astype("datetime64[us]")[1:-1]
+        around = np.concatenate([starts + np.timedelta64(seconds, "s") for seconds in (-3601, -1, 0, 1, 1800, 3600)])
+        arr = np.concatenate([values, around[(around >= values.min()) & (around <= values.max())]])
+
+        # act
+        result = index.snap(arr, unit)
+
+        # assert
+        np.testing.assert_array_equal(result, snap_array(arr, f"@{unit.lstrip('@')}", tz=tz))
+
+    @pytest.mark.parametrize(
+        "dtm",
+        [
+            pendulum.datetime(2024, 5, 17, 10, 30, tz="Europe/London"),
+            pendulum.datetime(2009, 11, 1, 0, 30, tz="America/St_Johns"),
+            datetime(2024, 11, 3, 1, 30, fold=1, tzinfo=ZoneInfo("America/New_York")),
+            datetime(2024, 5, 17, 10, 30),
+        ],
+    )
+    @pytest.mark.parametrize("unit", ["mon", "q", Unit.YEAR])
+    def test_scalar(self, dtm, unit):
+        # arrange
+        tz = None if dtm.tzinfo is None else dtm.tzinfo
+        index = CalendarIndex(tz, "2000-01-01", "2030-01-01")
+
+        # act
+        result = index.snap(dtm, unit)
+
+        # assert
+        expected = snap(dtm, "@y" if unit == Unit.YEAR else f"@{unit}")
+        assert result == expected
+        assert type(result) is type(expected)
+        assert result.utcoffset() == expected.utcoffset()
+
+    def test_ambiguous_month_start(self):
+        # arrange
+        # the clocks went back from 00:01 to 23:01 on the 1st of November 2009 in St John's
+        arr = np.array(["2009-11-01T02:30:30", "2009-11-01T03:00", "2009-11-01T03:31"], dtype="datetime64[ns]")
+        index = CalendarIndex("America/St_Johns", "2009-01-01", "2010-01-01")
+
+        # act
+        result = index.snap(arr, "mon")
+
+        # assert
+        assert result.dtype == np.dtype("datetime64[ns]")
+        assert result.astype(str).tolist() == [
+            "2009-11-01T02:30:00.000000000",
+            "2009-10-01T02:30:00.000000000",
+            "2009-11-01T02:30:00.000000000",
+        ]
+
+    def test_nat_and_shape(self):
+        # arrange
+        arr = np.array([["2024-05-17T10:30", "NaT"]], dtype="datetime64[us]")
+
+        # act
+        result = CalendarIndex(None, "2024-01-01", "2024-12-31").snap(arr, "q")
+
+        # assert
+        assert result.shape == (1, 2)
+        assert result.astype(str).tolist() == [["2024-04-01T00:00:00.000000", "NaT"]]
+
+    def test_starts(self):
+        # act
+        result = CalendarIndex("Europe/London", datetime(2024, 5, 1, tzinfo=timezone.utc), "2024-08-01").starts("q")
+
+        # assert
+        assert result.astype(str).tolist() == [
+            "2024-01-01T00:00:00",
+            "2024-03-31T23:00:00",
+            "2024-06-30T23:00:00",
+            "2024-09-30T23:00:00",
+            "2025-01-01T00:00:00",
+        ]
+
+    def test_out_of_range(self):
+        # arrange
+        index = CalendarIndex("Europe/London", "2024-01-01", "2024-02-01")
+
+        # act/assert
+        with pytest.raises(ValueError, match="Datetimes must be within the range of the calendar index."):
+            index.snap(np.array(["2026-01-01"], dtype="datetime64[us]"), "mon")
+
+    @pytest.mark.parametrize(
+        ("args", "unit", "match"),
+        [
+            ((None, "2024-02-01", "2024-01-01"), "mon", "The end of a calendar index must not be before its start."),
+            ((None, "2024-01-01", "2024-02-01"), "w", "Invalid calendar unit `w`: must be a month, quarter or year."),
+        ],
+    )
+    def test_invalid(self, args, unit, match):
+        # act/assert
+        with pytest.raises(ValueError, match=re.escape(match)):
+            CalendarIndex(*args).snap(datetime(2024, 1, 10), unit)
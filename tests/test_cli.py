@@ -0,0 +1,168 @@
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pendulum
+import pytest
+
+from python_snaptime.cli import main
+from python_snaptime.main import snap
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], stdin: str, *argv: str) -> list[str]:
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    assert main(argv) == 0
+    return capsys.readouterr().out.splitlines()
+
+
+class TestCli:
+    def test_iso(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+        # act
+        result = _run(monkeypatch, capsys, "2024-12-30T13:45:12Z\n2024-03-31 01:30+01:00\n", "-e", "@d", "-e=-2h")
+
+        # assert
+        assert result == [
+            "2024-12-30T00:00:00+00:00\t2024-12-30T11:45:12+00:00",
+            "2024-03-31T00:00:00+01:00\t2024-03-30T23:30:00+01:00",
+        ]
+
+    def test_iso_in_timezone(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+        # arrange
+        expected = snap(pendulum.datetime(2024, 3, 31, 3, tz="Europe/London"), "@d+90m").isoformat()
+
+        # act
+        result = _run(monkeypatch, capsys, "2024-03-31T02:00:00Z\n", "-e", "@d+90m", "--tz", "Europe/London")
+
+        # assert
+        assert result == [expected]
+
+    @pytest.mark.parametrize(
+        ("unit", "timestamp", "expected"),
+        [
+            ("s", "1735566312", "1735516800\t1735569912"),
+            ("s", "1735566312.25", "1735516800\t1735569912.25"),
+            ("ms", "1735566312250", "1735516800000\t1735569912250"),
+            ("ns", "1735566312123456789", "1735516800000000000\t1735569912123456789"),
+            ("s", "-1", "-86400\t3599"),
+        ],
+    )
+    def test_epoch(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        unit: str,
+        timestamp: str,
+        expected: str,
+    ):
+        # act
+        result = _run(monkeypatch, capsys, f"{timestamp}\n", "-e", "@d", "-e", "+1h", "--unit", unit)
+
+        # assert
+        assert result == [expected]
+
+    @pytest.mark.parametrize("tz", ["Europe/London", "America/New_York", "Asia/Kolkata"])
+    def test_epoch_in_timezone(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], tz: str):
+        # arrange
+        timestamps = [1711846800, 1730596500, 1735566312]
+        expected = [str(snap(pendulum.from_timestamp(ts, tz=tz), "@w-1d+3h").int_timestamp) for ts in timestamps]
+
+        # act
+        result = _run(monkeypatch, capsys, "\n".join(map(str, timestamps)), "-e", "@w-1d+3h", "--tz", tz)
+
+        # assert
+        assert result == expected
+
+    def test_output_format(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+        # act
+        result = _run(
+            monkeypatch,
+            capsys,
+            "1735566312\n2024-12-30T13:45:12\n",
+            "-e",
+            "@h",
+            "--output-format",
+            "iso",
+            "--tz",
+            "UTC",
+        )
+        epoch = _run(monkeypatch, capsys, "2024-12-30T13:45:12Z\n", "-e", "@h", "--output-format", "epoch")
+
+        # assert
+        assert result == ["2024-12-30T13:00:00+00:00", "2024-12-30T13:00:00+00:00"]
+        assert epoch == ["1735563600"]
+
+    def test_fields(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+        # arrange
+        stdin = 'id,ts\n1,2024-12-30T13:45:12Z\n"2,3",1735566312\n'
+
+        # act
+        result = _run(monkeypatch, capsys, stdin, "-e", "@mon", "--field", "2", "--delimiter", ",", "--header")
+
+        # assert
+        assert result == [
+            "id,ts,@mon",
+            "1,2024-12-30T13:45:12Z,2024-12-01T00:00:00+00:00",
+            '"2,3",1735566312,1733011200',
+        ]
+
+    def test_files_and_chunks(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], tmp_path: Path
+    ):
+        # arrange
+        path = tmp_path / "timestamps.txt"
+        path.write_text("".join(f"{ts}\n" for ts in range(0, 86_400 * 10, 3_600)))
+
+        # act
+        result = _run(monkeypatch, capsys, "86400\n", "-e", "@d", "--chunk-size", "7", str(path), "-")
+
+        # assert
+        assert result == [str(ts // 86_400 * 86_400) for ts in range(0, 86_400 * 10, 3_600)] + ["86400"]
+
+    def test_invalid_timestamp(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+        # arrange
+        monkeypatch.setattr(sys, "stdin", io.StringIO("60\nnope\n120\n"))
+
+        # act
+        status = main(["-e", "@m"])
+        captured = capsys.readouterr()
+
+        # assert
+        assert status == 1
+        assert captured.out == "60\n"
+        assert "line 2: Invalid timestamp `nope`." in captured.err
+
+    def test_skip_invalid(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+        # act
+        result = _run(monkeypatch, capsys, "60\nnope\n\n120\n", "-e", "@m", "-e", "+1s", "--skip-invalid")
+
+        # assert
+        assert result == ["60\t61", "\t", "\t", "120\t121"]
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["-e", "@x"],
+            ["-e", "@d", "--tz", "Not/AZone"],
+            ["-e", "@d", "--field", "0"],
+            ["-e", "@d", "--chunk-size", "0"],
+            [],
+        ],
+    )
+    def test_invalid_arguments(self, argv: list[str]):
+        # act/assert
+        with pytest.raises(SystemExit, match="2"):
+            main(argv)
+
+    def test_module_entry_point(self):
+        # act
+        result = subprocess.run(
+            [sys.executable, "-m", "python_snaptime", "-e", "@d", "--input-format", "epoch"],
+            input="1735566312\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # assert
+        assert result.stdout == "1735516800\n"
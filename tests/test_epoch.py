@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+import pendulum
+import pytest
+
+from python_snaptime._epoch import from_microseconds, run, to_microseconds
+from python_snaptime.handlers import handle_timesnapping
+from python_snaptime.parsers import _parse_raw_snaptime
+
+
+class TestEpoch:
+    @pytest.mark.parametrize(
+        "dtm",
+        [
+            datetime(1970, 1, 1),
+            datetime(1969, 12, 31, 23, 59, 59, 999999),
+            datetime(2024, 2, 29, 13, 1, 10, 999999, tzinfo=timezone(timedelta(hours=-7))),
+            pendulum.datetime(1, 1, 1),
+            pendulum.datetime(9999, 12, 31, 23, 59, 59, 999999),
+        ],
+    )
+    def test_microseconds_round_trip(self, dtm: datetime):
+        # act
+        microseconds = to_microseconds(dtm)
+        result = from_microseconds(microseconds, dtm)
+
+        # assert
+        assert result == dtm
+        assert type(result) is type(dtm)
+        assert result.tzinfo is dtm.tzinfo
+        naive = datetime(*dtm.timetuple()[:6], dtm.microsecond)
+        assert microseconds == (naive - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+
+    @pytest.mark.parametrize(
+        "snaptime",
+        [
+            "@s",
+            "@m",
+            "@h",
+            "@d",
+            "@w",
+            "@mon",
+            "@q",
+            "@y",
+            "+1500us",
+            "-250ms",
+            "+90s",
+            "-45m",
+            "+26h",
+            "-3d",
+            "+2w",
+            "+1mon",
+            "-13mon",
+            "+1q",
+            "-1y",
+            "@d-2h+10m",
+            "@mon-1d+1mon",
+            "@w+1y@q",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "dtm",
+        [
+            pendulum.datetime(2024, 1, 31, 13, 1, 10, 999999),
+            pendulum.datetime(2024, 2, 29, 0, 0, 0, tz=pendulum.fixed_timezone(19800)),
+            pendulum.datetime(1969, 12, 31, 23, 59, 59, 500000, tz=pendulum.fixed_timezone(-3600)),
+            pendulum.naive(2023, 12, 31, 12, 30),
+        ],
+    )
+    def test_run(self, snaptime: str, dtm: pendulum.DateTime):
+        # arrange
+        expected = dtm
+        for operation in _parse_raw_snaptime(snaptime):
+            expected = handle_timesnapping(operation, expected)
+
+        # act
+        result = from_microseconds(run(_parse_raw_snaptime(snaptime), to_microseconds(dtm)), dtm)
+
+        # assert
+        assert result.isoformat() == expected.isoformat()
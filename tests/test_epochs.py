@@ -0,0 +1,95 @@
+import re
+from datetime import timedelta
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime import snap, snap_epoch
+from python_snaptime.parsers import compile
+
+_NANOSECONDS = {"s": 1_000_000_000, "ms": 1_000_000, "us": 1_000, "ns": 1}
+_EPOCH = pendulum.datetime(1970, 1, 1)
+
+
+def _expected(timestamp, snaptime, tz, unit):
+    # the epoch timestamp is snapped as a `pendulum.DateTime`, keeping the nanoseconds of a plan without snaps
+    nanoseconds = timestamp * _NANOSECONDS[unit]
+    dtm = _EPOCH.add(microseconds=nanoseconds // 1_000).in_tz(tz or "UTC")
+    result = (snap(dtm, snaptime) - _EPOCH).as_timedelta() // timedelta(microseconds=1) * 1_000
+    if "@" not in snaptime:
+        result += nanoseconds % 1_000
+    return result // _NANOSECONDS[unit]
+
+
+@pytest.fixture()
+def timestamps():
+    # the last day of March 2024 in epoch seconds, every 17 minutes across the start of British Summer Time
+    return [1_711_843_200 + minutes * 60 + 7 for minutes in range(-1440, 1440, 17)]
+
+
+class TestSnapEpoch:
+    @pytest.mark.parametrize("snaptime", ["@d", "@h-10m", "+500ms", "-1500us@s", "@w+1d", "@mon-1d+3h", "@q+90m"])
+    @pytest.mark.parametrize("tz", [None, "Europe/London", "Australia/Lord_Howe", ZoneInfo("Asia/Kolkata")])
+    @pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+    def test_matches_snap(self, snaptime, tz, unit, timestamps):
+        # arrange
+        values = [timestamp * _NANOSECONDS["s"] // _NANOSECONDS[unit] + 123 for timestamp in timestamps]
+        name = tz.key if isinstance(tz, ZoneInfo) else tz
+
+        # act
+        scalars = [snap_epoch(value, snaptime, tz, unit) for value in values]
+        batch = snap_epoch(values, snaptime, tz, unit)
+
+        # assert
+        expected = [_expected(value, snaptime, name, unit) for value in values]
+        assert scalars == expected
+        assert batch == expected
+
+    def test_sub_unit_deltas_round_down(self):
+        # act
+        result = [snap_epoch(ts, "+500ms", unit="s") for ts in (10, -10)]
+
+        # assert
+        assert result == [10, -10]
+
+    def test_nanoseconds_kept_without_snaps(self):
+        # act
+        result = snap_epoch(1_711_846_800_123_456_789, "+1d", "Europe/London", "ns")
+        snapped = snap_epoch(1_711_846_800_123_456_789, "@s", "Europe/London", "ns")
+
+        # assert
+        assert result == 1_711_933_200_123_456_789
+        assert snapped == 1_711_846_800_000_000_000
+
+    def test_iterables(self):
+        # arrange
+        plan = compile("@d")
+
+        # act
+        result = snap_epoch(iter([86_401, 172_801]), plan)
+        empty = snap_epoch((), plan)
+
+        # assert
+        assert result == [86_400, 172_800]
+        assert empty == []
+
+    def test_numpy(self):
+        # arrange
+        np = pytest.importorskip("numpy")
+        arr = np.array([1_711_846_799_000, 1_711_846_801_000], dtype=np.int64)
+
+        # act
+        result = snap_epoch(arr, "@h", "Europe/London", "ms")
+        scalar = snap_epoch(arr[0], "@h", "Europe/London", "ms")
+
+        # assert
+        assert result.dtype == np.int64
+        assert result.tolist() == [1_711_843_200_000, 1_711_846_800_000]
+        assert scalar == 1_711_843_200_000
+        assert type(scalar) is int
+
+    def test_invalid_unit(self):
+        # act/assert
+        with pytest.raises(ValueError, match=re.escape("Invalid epoch unit `m`: must be one of s, ms, us or ns.")):
+            snap_epoch(0, "@d", unit="m")
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+import python_snaptime
+
+
+def _run(code: str) -> str:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+class TestImports:
+    def test_import_is_lazy(self):
+        # act
+        result = _run(
+            "import sys, python_snaptime; print(sorted(set(sys.modules) & {'pendulum', 'pydantic', 'python_snaptime.main'}))"
+        )
+
+        # assert
+        assert result == "[]"
+
+    def test_core_path_without_pendulum_or_pydantic(self):
+        # arrange
+        code = (
+            "import sys, datetime, zoneinfo\n"
+            "from python_snaptime import snap\n"
+            "snap(datetime.datetime(2024, 12, 30, 13), '@d-2h')\n"
+            "snap(datetime.datetime(2024, 12, 30, 13, tzinfo=zoneinfo.ZoneInfo('Europe/London')), '@w+1mon')\n"
+            "print(sorted(set(sys.modules) & {'pendulum', 'pydantic'}))"
+        )
+
+        # act
+        result = _run(code)
+
+        # assert
+        assert result == "[]"
+
+    def test_snaptime_model_is_lazy(self):
+        # act
+        result = _run(
+            "import sys; from python_snaptime.models import Operation; print('pydantic' in sys.modules)\n"
+            "from python_snaptime.models import Snaptime; print('pydantic' in sys.modules)"
+        )
+
+        # assert
+        assert result.split() == ["False", "True"]
+
+    @pytest.mark.parametrize("name", python_snaptime.__all__)
+    def test_public_api(self, name: str):
+        # assert
+        assert getattr(python_snaptime, name) is not None
+        assert name in dir(python_snaptime)
+
+    def test_unknown_attribute(self):
+        # act/assert
+        with pytest.raises(AttributeError, match="module 'python_snaptime' has no attribute 'unknown'"):
+            python_snaptime.unknown  # noqa: B018
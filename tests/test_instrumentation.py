@@ -0,0 +1,171 @@
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime import instrumentation
+from python_snaptime.main import snap
+from python_snaptime.parsers import cache_clear, compile
+from python_snaptime.plans import SnapPlan
+from tests.helpers import CentralEuropeanTime
+
+
+@pytest.fixture(autouse=True)
+def _disable():
+    cache_clear()
+    yield
+    instrumentation.disable()
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self):
+        # act
+        snap(pendulum.datetime(2024, 12, 30, 13, tz="Europe/London"), "@d-2h")
+
+        # assert
+        assert not instrumentation.is_enabled()
+        assert instrumentation.stats() == {}
+
+    def test_compile_phases(self):
+        # arrange
+        instrumentation.enable()
+
+        # act
+        compile("@d-2h")
+        compile("@d-2h")
+
+        # assert
+        stats = instrumentation.stats()
+        assert {phase: phase_stats.count for phase, phase_stats in stats.items()} == {
+            "cache.miss": 1,
+            "parse": 1,
+            "validate": 1,
+            "optimize": 1,
+            "cache.hit": 1,
+        }
+        assert all(phase_stats.nanoseconds >= 0 for phase_stats in stats.values())
+
+    @pytest.mark.parametrize(
+        ("dtm", "phase"),
+        [
+            (pendulum.datetime(2024, 12, 30, 13, tz="Europe/London"), "apply.pendulum"),
+            (datetime(2024, 12, 30, 13, tzinfo=ZoneInfo("Europe/London")), "apply.native"),
+            (datetime(2024, 12, 30, 13, tzinfo=timezone.utc), "apply.epoch"),
+            (datetime(2024, 12, 30, 13), "apply.epoch"),  # noqa: DTZ001
+        ],
+    )
+    def test_apply_engine(self, dtm, phase):
+        # arrange
+        plan = compile("@d-2h")
+        instrumentation.enable()
+
+        # act
+        plan.apply(dtm)
+
+        # assert
+        assert list(instrumentation.stats()) == [phase]
+
+    def test_callback(self):
+        # arrange
+        calls = []
+        instrumentation.enable(lambda phase, nanoseconds: calls.append((phase, nanoseconds)))
+
+        # act
+        snap(datetime(2024, 12, 30, 13), "@d")  # noqa: DTZ001
+
+        # assert
+        assert [phase for phase, _ in calls] == ["cache.miss", "parse", "validate", "optimize", "apply.epoch"]
+        assert all(isinstance(nanoseconds, int) for _, nanoseconds in calls)
+
+    def test_reset_and_disable(self):
+        # arrange
+        instrumentation.enable()
+        snap(datetime(2024, 12, 30, 13), "@d")  # noqa: DTZ001
+
+        # act
+        instrumentation.reset()
+        reset = instrumentation.stats()
+        snap(datetime(2024, 12, 30, 13), "@d")  # noqa: DTZ001
+        instrumentation.disable()
+
+        # assert
+        assert reset == {}
+        assert not instrumentation.is_enabled()
+        assert instrumentation.stats() == {}
+
+    def test_array_phase(self):
+        # arrange
+        np = pytest.importorskip("numpy")
+        from python_snaptime.arrays import snap_array  # noqa: PLC0415
+
+        plan = compile("@d")
+        instrumentation.enable()
+
+        # act
+        snap_array(np.array(["2024-12-30T13:00"], dtype="datetime64[us]"), plan, tz="Europe/London")
+
+        # assert
+        assert list(instrumentation.stats()) == ["apply.array"]
+
+    def test_disabled_is_untimed(self, mocker):
+        # arrange
+        np = pytest.importorskip("numpy")
+        from python_snaptime.arrays import snap_array
+
+        perf_counter_ns = mocker.patch("time.perf_counter_ns")
+
+        # act
+        SnapPlan(compile("@d-2h").operations)
+        snap(datetime(2024, 12, 30, 13, tzinfo=CentralEuropeanTime()), "@d-2h")
+        snap_array(np.array(["2024-12-30T13:00"], dtype="datetime64[us]"), "@d", tz="Europe/London")
+
+        # assert
+        assert perf_counter_ns.call_count == 0
+
+
+class TestExplain:
+    @pytest.mark.parametrize(
+        ("dtm", "engine"),
+        [
+            (pendulum.datetime(2024, 3, 31, 12, tz="Europe/London"), "pendulum"),
+            (datetime(2024, 3, 31, 12, tzinfo=ZoneInfo("Europe/London")), "native"),
+            (datetime(2024, 3, 31, 12), "epoch"),  # noqa: DTZ001
+        ],
+    )
+    def test_explain(self, dtm, engine):
+        # act
+        steps = instrumentation.explain("@d-2h+30m@h", dtm)
+
+        # assert
+        assert [step.name for step in steps] == ["parse", "optimize", "@d", "-90m", "@h"]
+        assert [step.engine for step in steps] == [None, None, engine, engine, engine]
+        assert len(steps[0].value) == 4
+        assert steps[1].value == SnapPlan(steps[0].value)
+        assert steps[-1].value == compile("@d-2h+30m@h").apply(dtm)
+        assert not instrumentation.is_enabled()
+
+    def test_explain_engine_per_step(self):
+        # arrange
+        dtm = datetime(2024, 3, 31, 12, tzinfo=CentralEuropeanTime())
+
+        # act
+        steps = instrumentation.explain("@d-2h+30m@h", dtm)
+
+        # assert
+        # the first step converts the datetime to a `pendulum` fixed offset, which the epoch engine snaps
+        assert [step.engine for step in steps] == [None, None, "pendulum", "epoch", "epoch"]
+        assert steps[-1].value == compile("@d-2h+30m@h").apply(dtm)
+
+    def test_explain_plan(self):
+        # arrange
+        plan = compile("@w+1d")
+        dtm = pendulum.datetime(2024, 12, 30, 13, tz="America/New_York")
+
+        # act
+        steps = instrumentation.explain(plan, dtm)
+
+        # assert
+        assert [step.name for step in steps] == ["@w", "+1d"]
+        assert steps[0].value == pendulum.datetime(2024, 12, 30, tz="America/New_York")
+        assert steps[1].value == plan.apply(dtm)
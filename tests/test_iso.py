@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from python_snaptime.iso import SnappedStrings, _parse_iso, snap_iso
+from python_snaptime.main import snap
+from python_snaptime.parsers import compile
+
+
+@pytest.fixture()
+def strings():
+    # every 37 minutes across the start of British Summer Time, with and without offsets
+    start = datetime(2024, 3, 30, 20, 0, 0, 250000)
+    suffixes = ["", "Z", "+01:00", "-05:30"]
+    return [
+        f"{(start + timedelta(minutes=37 * i)).isoformat()}{suffixes[i % len(suffixes)]}".replace("+00:00", "")
+        for i in range(60)
+    ]
+
+
+def _expected(text, snaptime, tz):
+    dtm = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if tz is not None:
+        dtm = dtm.replace(tzinfo=tz) if dtm.tzinfo is None else dtm.astimezone(tz)
+    return snap(dtm, snaptime).isoformat()
+
+
+class TestSnapIso:
+    @pytest.mark.parametrize("snaptime", ["@h-10m", "+1d@d", "-30m", "@w+2h", "+1mon@d", "+90m@q"])
+    @pytest.mark.parametrize("tz", [None, ZoneInfo("Europe/London"), timezone(timedelta(hours=2))])
+    def test_matches_snap(self, snaptime, tz, strings):
+        # act
+        result = snap_iso(strings, snaptime, tz)
+
+        # assert
+        assert result.values == [_expected(text, snaptime, tz) for text in strings]
+        assert result.errors == [False] * len(strings)
+
+    def test_timezone_name(self):
+        # act
+        result = snap_iso(["2024-03-31T01:30:00", "2024-03-31T03:30:00+02:00"], compile("@h"), "Europe/London")
+
+        # assert
+        assert result.values == ["2024-03-31T00:00:00+00:00", "2024-03-31T02:00:00+01:00"]
+
+    @pytest.mark.parametrize(
+        ("tz", "snaptime", "strings"),
+        [
+            ("Australia/Lord_Howe", "@h", ["2024-10-06T02:10", "2024-10-06T02:40"]),
+            ("America/Sao_Paulo", "@d", ["2018-11-04T00:30", "2018-11-04T05:00"]),
+        ],
+    )
+    def test_skipped_wall_time(self, tz, snaptime, strings):
+        # act
+        batch = [snap_iso(strings, snaptime, tz).values, snap_iso(strings[::-1], snaptime, tz).values[::-1]]
+
+        # assert
+        single = [snap_iso([text], snaptime, tz).values[0] for text in strings]
+        assert batch == [single, single]
+        assert len(set(single)) == 2
+
+    def test_error_mask(self):
+        # act
+        result = snap_iso(["2024-12-30T13:45:12Z", "garbage", "2024-02-30", "", " 2024-12-30 "], "@d")
+
+        # assert
+        assert result == SnappedStrings(
+            ["2024-12-30T00:00:00+00:00", None, None, None, "2024-12-30T00:00:00"], [False, True, True, True, False]
+        )
+
+    def test_overflow_is_an_error(self):
+        # act
+        result = snap_iso(["9999-12-31T12:00:00", "2024-12-30T12:00:00"], "+1d")
+
+        # assert
+        assert result.errors == [True, False]
+
+    def test_out_format(self):
+        # act
+        result = snap_iso(iter(["2024-12-30T13:45:12+01:00"]), "@h", out_format="%Y-%m-%d %H:%M %z")
+
+        # assert
+        assert result.values == ["2024-12-30 13:00 +0100"]
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("2024-12-30T13:45:12z", datetime(2024, 12, 30, 13, 45, 12, tzinfo=timezone.utc)),
+            ("2024-12-30T13:45:12.123456789Z", datetime(2024, 12, 30, 13, 45, 12, 123456, tzinfo=timezone.utc)),
+            ("2024-12-30 13:45:12,5", datetime(2024, 12, 30, 13, 45, 12, 500000)),
+            ("2024-12-30T13:45-0330", datetime(2024, 12, 30, 13, 45, tzinfo=timezone(-timedelta(hours=3.5)))),
+            ("2024-12-30", datetime(2024, 12, 30)),
+        ],
+    )
+    def test_parse_extended_forms(self, text, expected):
+        # act
+        result = _parse_iso(text)
+
+        # assert
+        assert result == expected
+        assert result.utcoffset() == expected.utcoffset()
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime import snap, snap_many
+from python_snaptime.many import _Trie
+from python_snaptime.parsers import compile
+from tests.helpers import CentralEuropeanTime
+
+_SNAPTIMES = [
+    "@d",
+    "@d-1d",
+    "@d-7d",
+    "@w",
+    "@w-1w",
+    "@mon",
+    "@mon-1mon",
+    "@q",
+    "@y-1y",
+    "-24h@h",
+    "@h",
+    "+1d@d-2h",
+    "@d",
+    "+1h-1h",
+]
+
+
+class TestSnapMany:
+    @pytest.mark.parametrize(
+        "dtm",
+        [
+            pendulum.datetime(2024, 3, 31, 1, 30, tz="Europe/London"),
+            datetime(2024, 3, 31, 1, 30, tzinfo=ZoneInfo("Europe/London")),
+            datetime(2024, 11, 3, 1, 30, fold=1, tzinfo=ZoneInfo("America/New_York")),
+            datetime(2024, 12, 30, 13, 5, tzinfo=timezone.utc),
+            datetime(2024, 12, 30, 13, 5, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(2024, 12, 30, 13, 5),
+            datetime(2024, 12, 30, 13, 5, tzinfo=CentralEuropeanTime()),
+        ],
+    )
+    def test_matches_snap(self, dtm):
+        # act
+        result = snap_many(dtm, iter(_SNAPTIMES))
+
+        # assert
+        expected = [snap(dtm, snaptime) for snaptime in _SNAPTIMES]
+        assert result == expected
+        assert [type(result_dtm) for result_dtm in result] == [type(dtm) for dtm in expected]
+        assert [result_dtm.utcoffset() for result_dtm in result] == [dtm.utcoffset() for dtm in expected]
+
+    def test_compiled_plans(self):
+        # arrange
+        dtm = datetime(2024, 12, 30, 13, 5, tzinfo=ZoneInfo("Europe/London"))
+
+        # act
+        result = snap_many(dtm, [compile("@d-2h"), "@d"])
+
+        # assert
+        assert result == [
+            datetime(2024, 12, 29, 22, tzinfo=ZoneInfo("Europe/London")),
+            datetime(2024, 12, 30, tzinfo=ZoneInfo("Europe/London")),
+        ]
+
+    def test_empty(self):
+        # act
+        result = snap_many(datetime(2024, 12, 30, 13, 5), [])
+
+        # assert
+        assert result == []
+
+    def test_invalid_datetime(self):
+        # act/assert
+        with pytest.raises(TypeError, match="Invalid datetime type."):
+            snap_many("2024-12-30", ["@d"])
+
+
+class TestTrie:
+    def test_shared_prefixes(self):
+        # arrange
+        chains = [compile(snaptime).operations for snaptime in ["@d", "@d-1d", "@d-7d", "@w-1w+2h", "@w-1w+2h"]]
+
+        # act
+        trie = _Trie(chains)
+
+        # assert
+        assert trie.indexes == ()
+        assert {step.indexes: step.operations for step in trie.steps} == {
+            (0,): compile("@d").operations,
+            (1,): compile("-1d").operations,
+            (2,): compile("-7d").operations,
+            (3, 4): compile("@w-1w+2h").operations,
+        }
+        assert all(step.source < step.target for step in trie.steps)
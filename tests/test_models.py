@@ -2,7 +2,7 @@ import re
 
 import pytest
 
-from python_snaptime.models import Snaptime, Unit
+from python_snaptime.models import Action, Operation, Snaptime, Unit
 
 
 @pytest.mark.parametrize(
@@ -125,3 +125,57 @@ class TestSnaptime:
             match=re.escape("Snaptime string is invalid: missing time unit for time addition or subtraction."),
         ):
             Snaptime(**snaptime)
+
+
+class TestOperation:
+    @pytest.mark.parametrize(
+        "action,unit,time_int,operation",
+        [
+            ("@", "day", None, Operation(Action.SNAP, Unit.DAY)),
+            ("+", "hrs", 2, Operation(Action.ADD, Unit.HOUR, 2)),
+            (Action.SUB, Unit.MILLISECOND, 10, Operation(Action.SUB, Unit.MILLISECOND, 10)),
+        ],
+    )
+    def test_operation_create(self, action, unit, time_int, operation):
+        # act
+        result = Operation.create(action, unit, time_int)
+
+        # assert
+        assert result == operation
+
+    @pytest.mark.parametrize(
+        "action,unit,time_int,message",
+        [
+            (None, "day", 2, "Snaptime string is invalid: must provide either a snap `@` or time delta `+-`."),
+            ("@@", "day", None, "Snaptime string is invalid: unknown action `@@`."),
+            ("@", "day", 2, "Snaptime string is invalid: cannot use a time integer when snapping."),
+            ("@", None, None, "Snaptime string is invalid: missing time unit when snapping."),
+            ("@", Unit.MILLISECOND, None, "Snaptime string is invalid: cannot snap to nearest millisecond."),
+            ("@", "us", None, "Snaptime string is invalid: cannot snap to nearest microsecond."),
+            ("+", "day", None, "Snaptime string is invalid: missing time integer for time addition or subtraction."),
+            ("-", None, 2, "Snaptime string is invalid: missing time unit for time addition or subtraction."),
+            ("-", "fortnight", 2, "Snaptime string is invalid: unknown time unit `fortnight`."),
+        ],
+    )
+    def test_operation_create_invalid(self, action, unit, time_int, message):
+        # act/assert
+        with pytest.raises(ValueError, match=re.escape(message)):
+            Operation.create(action, unit, time_int)
+
+    def test_operation_immutable(self):
+        # arrange
+        operation = Operation(Action.SNAP, Unit.DAY)
+
+        # act/assert
+        with pytest.raises(AttributeError):
+            operation.unit = Unit.HOUR  # type: ignore[misc]
+
+    def test_snaptime_to_operation(self):
+        # arrange
+        snaptime = Snaptime(action="-", unit="hours", time_int=2)
+
+        # act
+        result = snaptime.to_operation()
+
+        # assert
+        assert result == Operation(Action.SUB, Unit.HOUR, 2)
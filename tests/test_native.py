@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime._native import run
+from python_snaptime.handlers import handle_timesnapping
+from python_snaptime.parsers import _parse_raw_snaptime
+
+SNAPTIMES = [
+    "@s",
+    "@h",
+    "@d",
+    "@w",
+    "@mon",
+    "@q",
+    "@y",
+    "+1500us",
+    "-90m",
+    "+1h",
+    "-1d",
+    "+1w",
+    "-1mon",
+    "+1q",
+    "-1y",
+    "+0d",
+    "-1d+0mon@h",
+    "@d-2h+10m",
+    "@w+3d@d-12h+350ms",
+]
+
+
+class TestNative:
+    @pytest.mark.parametrize("snaptime", SNAPTIMES)
+    @pytest.mark.parametrize(
+        ("dtm", "fold"),
+        [
+            (datetime(2024, 3, 31, 1, 30, tzinfo=ZoneInfo("Europe/London")), 0),
+            (datetime(2024, 3, 31, 1, 30, tzinfo=ZoneInfo("Europe/London")), 1),
+            (datetime(2024, 10, 27, 1, 30, tzinfo=ZoneInfo("Europe/London")), 0),
+            (datetime(2024, 10, 27, 1, 30, tzinfo=ZoneInfo("Europe/London")), 1),
+            (datetime(2024, 11, 4, 0, 30, tzinfo=ZoneInfo("America/New_York")), 1),
+            (datetime(1986, 1, 2, 0, 10, tzinfo=ZoneInfo("Asia/Kathmandu")), 0),
+            (datetime(2024, 4, 7, 1, 45, tzinfo=ZoneInfo("Australia/Lord_Howe")), 1),
+        ],
+    )
+    def test_run_matches_handlers(self, snaptime: str, dtm: datetime, fold: int):
+        # arrange
+        dtm = dtm.replace(fold=fold)
+        operations = _parse_raw_snaptime(snaptime)
+        expected = pendulum.instance(dtm)
+        for operation in operations:
+            expected = handle_timesnapping(operation, expected)
+
+        # act
+        result = run(operations, dtm)
+
+        # assert
+        assert result.isoformat() == expected.isoformat()
+        assert result.fold == expected.fold
+        assert type(result) is datetime
+        assert result.tzinfo is dtm.tzinfo
+
+    def test_run_week_skipped_day(self):
+        # arrange
+        dtm = datetime(2011, 12, 31, 2, 26, tzinfo=ZoneInfo("Pacific/Apia"))  # 2011-12-30 was skipped
+
+        # act
+        result = run(_parse_raw_snaptime("@w"), dtm)
+
+        # assert
+        assert result == datetime(2011, 12, 26, 10, 0, tzinfo=timezone.utc)
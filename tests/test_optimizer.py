@@ -0,0 +1,103 @@
+import pendulum
+import pytest
+
+from python_snaptime.handlers import handle_timesnapping
+from python_snaptime.models import Operation
+from python_snaptime.optimizer import optimize
+from python_snaptime.parsers import _parse_raw_snaptime
+
+
+def _operations(snaptime: str) -> tuple[Operation, ...]:
+    return tuple(_parse_raw_snaptime(snaptime)) if snaptime else ()
+
+
+def _apply(operations: tuple[Operation, ...], dtm: pendulum.DateTime) -> pendulum.DateTime:
+    for operation in operations:
+        dtm = handle_timesnapping(operation, dtm)
+    return dtm
+
+
+class TestOptimize:
+    @pytest.mark.parametrize(
+        ("snaptime", "expected"),
+        [
+            ("@d-2h+10m", "@d-110m"),
+            ("+1h-60m", "+0h"),
+            ("+1h-60m+1d", "+1d"),
+            ("+0d", "+0h"),
+            ("+1h-0mon", "+1h"),
+            ("+500ms+500ms", "+1s"),
+            ("@m@s", "@m"),
+            ("@s@h", "@h"),
+            ("@h+1d@s", "@h+1d"),
+            ("@h+1500ms@s", "@h+1500ms@s"),
+            ("@d@d", "@d@d"),
+            ("@d@h", "@d@h"),
+            ("@h@d", "@h@d"),
+            ("+1d-2h", "+1d-2h"),
+            ("@mon+1mon+1mon", "@mon+1mon+1mon"),
+        ],
+    )
+    def test_optimize(self, snaptime: str, expected: str):
+        # act
+        result = optimize(_operations(snaptime))
+
+        # assert
+        assert result == _operations(expected)
+
+    @pytest.mark.parametrize(
+        ("snaptime", "expected"),
+        [
+            ("@d-2h+10m", "@d-110m"),
+            ("+1d-2h", "+22h"),
+            ("+1w-7d", ""),
+            ("@d+0mon", "@d"),
+            ("@d@d", "@d"),
+            ("@d@h", "@d"),
+            ("@h@d", "@d"),
+            ("@d@w@mon", "@w@mon"),
+            ("@mon@q", "@q"),
+            ("@q+1y-1q", "@q+3q"),
+            ("@q+1mon+2mon", "@q+1q"),
+            ("@mon+6mon+6mon", "@mon+1y"),
+            ("-1mon-1mon", "-1mon-1mon"),
+            ("@d+1mon+1mon", "@d+1mon+1mon"),
+            ("@y+3mon@q", "@y+1q"),
+            ("@y+1mon@q", "@y+1mon@q"),
+            ("@d+2d@d", "@d+2d"),
+            ("@w+6d@w", "@w+6d@w"),
+        ],
+    )
+    def test_optimize_fixed_offset(self, snaptime: str, expected: str):
+        # act
+        result = optimize(_operations(snaptime), fixed_offset=True)
+
+        # assert
+        assert result == _operations(expected)
+
+    @pytest.mark.parametrize(
+        "snaptime",
+        ["@d@d", "@d-2h+10m", "+1h-60m+1d", "@s@h", "@h+1d@s", "@mon@d+1mon+1mon", "+30m-30m@w", "@d+1d-24h"],
+    )
+    @pytest.mark.parametrize(
+        "dtm",
+        [
+            pendulum.datetime(1986, 1, 1, 0, 5, tz="Asia/Kathmandu", fold=0),
+            pendulum.datetime(1986, 1, 1, 0, 5, tz="Asia/Kathmandu", fold=1),
+            pendulum.datetime(2024, 3, 31, 1, 30, tz="Europe/London", fold=0),
+            pendulum.datetime(2024, 10, 27, 1, 30, tz="Europe/London", fold=0),
+            pendulum.datetime(2024, 10, 27, 1, 30, tz="Europe/London", fold=1),
+            pendulum.datetime(2024, 4, 7, 1, 45, tz="Australia/Lord_Howe", fold=0),
+        ],
+    )
+    def test_optimize_equivalent(self, snaptime: str, dtm: pendulum.DateTime):
+        # arrange
+        operations = _operations(snaptime)
+
+        # act
+        result = _apply(optimize(operations), dtm)
+
+        # assert
+        expected = _apply(operations, dtm)
+        assert result.isoformat() == expected.isoformat()
+        assert result.fold == expected.fold
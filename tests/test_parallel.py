@@ -0,0 +1,105 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime.parsers import compile
+from python_snaptime.parallel import snap_parallel
+
+SNAPTIMES = ["@d", "@w-2h", "+1d@h", "@mon-1w+250ms", "-0d"]
+
+
+@pytest.fixture(scope="module")
+def datetimes():
+    # every 7 hours and a bit across 2024, in naive, fixed offset, `zoneinfo` and `pendulum` timezones
+    tzs = [None, timezone.utc, timezone(timedelta(hours=5, minutes=30)), ZoneInfo("Europe/London")]
+    values = []
+    for i in range(1_300):
+        dtm = datetime(2024, 1, 1, 0, 0, 1, 250) + timedelta(hours=7 * i, minutes=i % 60)
+        if i % 5 == 4:
+            values.append(pendulum.instance(dtm.replace(tzinfo=timezone.utc)).in_timezone("America/New_York"))
+        else:
+            values.append(dtm.replace(tzinfo=tzs[i % 5], fold=i % 2))
+    return values
+
+
+class TestSnapParallel:
+    @pytest.mark.parametrize("snaptime", SNAPTIMES)
+    def test_matches_serial(self, snaptime, datetimes):
+        # arrange
+        plan = compile(snaptime)
+        expected = [plan.apply(dtm) for dtm in datetimes]
+
+        # act
+        result = snap_parallel(iter(datetimes), snaptime, workers=2, chunk_size=500)
+
+        # assert
+        assert len(result) == len(expected)
+        for res, exp in zip(result, expected):
+            assert res == exp
+            assert res.isoformat() == exp.isoformat()
+            assert res.fold == exp.fold
+            assert type(res) is type(exp)
+            assert res.tzinfo is exp.tzinfo
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_in_process(self, workers, datetimes):
+        # act
+        result = snap_parallel(datetimes[:100], "@d-2h", workers=workers)
+
+        # assert
+        assert result == [compile("@d-2h").apply(dtm) for dtm in datetimes[:100]]
+
+    def test_empty(self):
+        # act/assert
+        assert snap_parallel([], "@d", workers=2) == []
+
+    @pytest.mark.parametrize("tz", [None, "Europe/London"])
+    def test_array(self, tz):
+        # arrange
+        np = pytest.importorskip("numpy")
+        from python_snaptime.arrays import snap_array
+
+        arr = np.arange("2024-03-01", "2024-04-01", np.timedelta64(37, "m"), dtype="datetime64[us]")
+        arr[5] = np.datetime64("NaT")
+        arr = arr[:1200].reshape(-1, 4)
+
+        # act
+        result = snap_parallel(arr, "@w-2h", tz=tz, workers=2, chunk_size=100)
+
+        # assert
+        assert result.dtype == arr.dtype
+        assert result.shape == arr.shape
+        np.testing.assert_array_equal(result, snap_array(arr, "@w-2h", tz=tz))
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error", "match"),
+        [
+            ({"workers": 0}, ValueError, "Number of workers must be a positive integer."),
+            ({"chunk_size": 0}, ValueError, "Chunk size must be a positive integer."),
+            ({"tz": "UTC"}, ValueError, "A timezone can only be given for arrays, datetimes keep their own."),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, error, match):
+        # act/assert
+        with pytest.raises(error, match=match):
+            snap_parallel([datetime(2024, 1, 1)], "@d", **kwargs)
+
+    def test_invalid_datetime(self):
+        # act/assert
+        with pytest.raises(TypeError, match="Invalid datetime type."):
+            snap_parallel([datetime(2024, 1, 1), "2024-01-01"], "@d", workers=2, chunk_size=1)
+
+    def test_plan_is_picklable(self):
+        # arrange
+        plan = compile("@d-2h+10m")
+
+        # act
+        result = pickle.loads(pickle.dumps(plan))
+
+        # assert
+        assert result == plan
+        assert result.operations == plan.operations
+        assert result.fixed_offset_operations == plan.fixed_offset_operations
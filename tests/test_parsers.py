@@ -1,10 +1,23 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pendulum
 import pytest
 from pytest_mock import MockerFixture
 
 from python_snaptime import parsers
-from python_snaptime.models import Action, Snaptime, Unit
-from python_snaptime.parsers import _parse_raw_snaptime, parse_snaptime_string
+from python_snaptime.models import Action, Operation, Unit
+from python_snaptime.parsers import (
+    SnaptimeSyntaxError,
+    _parse_raw_snaptime,
+    cache_clear,
+    cache_info,
+    compile,
+    parse_snaptime_string,
+    set_cache_size,
+)
+from python_snaptime.plans import SnapPlan
 
 
 class TestParseRawSnaptime:
@@ -12,9 +25,9 @@ class TestParseRawSnaptime:
         # arrange
         snaptime = "@d-2h+10m"
         snap_results = [
-            Snaptime(action=Action.SNAP, unit=Unit.DAY),
-            Snaptime(action=Action.SUB, unit=Unit.HOUR, time_int=2),
-            Snaptime(action=Action.ADD, unit=Unit.MINUTE, time_int=10),
+            Operation(action=Action.SNAP, unit=Unit.DAY),
+            Operation(action=Action.SUB, unit=Unit.HOUR, time_int=2),
+            Operation(action=Action.ADD, unit=Unit.MINUTE, time_int=10),
         ]
 
         # act
@@ -31,6 +44,56 @@ class TestParseRawSnaptime:
         with pytest.raises(ValueError, match="^Snaptime string is invalid$"):
             _parse_raw_snaptime(snaptime)
 
+    @pytest.mark.parametrize(
+        ("snaptime", "position", "message"),
+        [
+            ("@@d", 0, "unknown action `@@`"),
+            ("@d+-2h", 2, "unknown action `+-`"),
+            ("@d -2h", 2, "expected a snap `@` or time delta `+-`, found ` `"),
+            ("d", 0, "expected a snap `@` or time delta `+-`, found `d`"),
+            ("@d@", 2, "missing time unit when snapping"),
+            ("@d-2h+10fortnight", 5, "unknown time unit `fortnight`"),
+            ("-2h@2d", 3, "cannot use a time integer when snapping"),
+            ("@ms", 0, "cannot snap to nearest millisecond"),
+            ("+h", 0, "missing time integer for time addition or subtraction"),
+        ],
+    )
+    def test_parse_raw_snaptime_syntax_error(self, snaptime, position, message):
+        # act/assert
+        with pytest.raises(SnaptimeSyntaxError, match=re.escape(f"{message} at position {position}.")) as e:
+            _parse_raw_snaptime(snaptime)
+        assert e.value.snaptime == snaptime
+        assert e.value.position == position
+        assert isinstance(e.value, ValueError)
+
+    def test_parse_raw_snaptime_aliases(self):
+        # act
+        results = _parse_raw_snaptime("@days+2hours-30min@qtr+1mon")
+
+        # assert
+        assert results == [
+            Operation(action=Action.SNAP, unit=Unit.DAY),
+            Operation(action=Action.ADD, unit=Unit.HOUR, time_int=2),
+            Operation(action=Action.SUB, unit=Unit.MINUTE, time_int=30),
+            Operation(action=Action.SNAP, unit=Unit.QUARTER),
+            Operation(action=Action.ADD, unit=Unit.MONTH, time_int=1),
+        ]
+
+    def test_parse_raw_snaptime_long(self):
+        # arrange
+        snaptime = "+1h-1h@d" * 10_000
+
+        # act
+        results = _parse_raw_snaptime(snaptime)
+
+        # assert
+        assert len(results) == 30_000
+        assert results[-3:] == [
+            Operation(action=Action.ADD, unit=Unit.HOUR, time_int=1),
+            Operation(action=Action.SUB, unit=Unit.HOUR, time_int=1),
+            Operation(action=Action.SNAP, unit=Unit.DAY),
+        ]
+
 
 def test_parse_snaptime_string(mocker: MockerFixture):
     # arrange
@@ -39,21 +102,16 @@ def test_parse_snaptime_string(mocker: MockerFixture):
     snaptime = "@d-2h+10m"
     call_args = [
         (
-            Snaptime(action=Action.SNAP, unit=Unit.DAY),
+            Operation(action=Action.SNAP, unit=Unit.DAY),
             pendulum.datetime(2024, 12, 30, 13, 1, 10, 999999),
         ),
         (
-            Snaptime(action=Action.SUB, unit=Unit.HOUR, time_int=2),
+            Operation(action=Action.SUB, unit=Unit.MINUTE, time_int=110),
             pendulum.datetime(2024, 12, 30, 0, 0, 0, 000000),
         ),
-        (
-            Snaptime(action=Action.ADD, unit=Unit.MINUTE, time_int=10),
-            pendulum.datetime(2024, 12, 29, 22, 0, 0),
-        ),
     ]
     return_values = [
         pendulum.datetime(2024, 12, 30, 0, 0, 0, 000000),
-        pendulum.datetime(2024, 12, 29, 22, 0, 0),
         pendulum.datetime(2024, 12, 29, 22, 10, 0),
     ]
 
@@ -64,6 +122,81 @@ def test_parse_snaptime_string(mocker: MockerFixture):
     result = parse_snaptime_string(snaptime, dtm)
 
     # assert
-    assert mock_handle_timesnapping.call_count == 3
+    assert mock_handle_timesnapping.call_count == 2
     assert [arg.args for arg in mock_handle_timesnapping.call_args_list] == call_args
     assert result == dtm_snap
+
+
+class TestCompile:
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self):
+        cache_clear()
+        yield
+        set_cache_size(parsers.DEFAULT_CACHE_SIZE)
+        cache_clear()
+
+    def test_compile(self):
+        # act
+        plan = compile("@day-2hours+10m")
+
+        # assert
+        assert isinstance(plan, SnapPlan)
+        assert plan.expression == "@d-110m"
+
+    def test_compile_equivalent_shared(self):
+        # act
+        first = compile("@d-2h+10m")
+        second = compile("@d-110m")
+
+        # assert
+        assert first is second
+        assert cache_info().currsize == 2
+
+    def test_compile_cached(self, mocker: MockerFixture):
+        # arrange
+        mock_parse_raw_snaptime = mocker.spy(parsers, "_parse_raw_snaptime")
+
+        # act
+        first = compile("@d-2h")
+        second = compile("@d-2h")
+
+        # assert
+        assert first is second
+        assert mock_parse_raw_snaptime.call_count == 1
+        assert cache_info() == (1, 1, 0, parsers.DEFAULT_CACHE_SIZE, 1)
+
+    def test_compile_cache_eviction(self):
+        # arrange
+        set_cache_size(1)
+
+        # act
+        compile("@d")
+        compile("@h")
+
+        # assert
+        assert cache_info() == (0, 2, 1, 1, 1)
+
+    def test_compile_threads(self):
+        # arrange
+        snaptimes = ["@d-2h+10m", "@d-110m", "@h", "-1h@h"] * 50
+        barrier = threading.Barrier(4)
+
+        def work():
+            barrier.wait()
+            return [compile(snaptime) for snaptime in snaptimes]
+
+        # act
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda _: work(), range(4)))
+
+        # assert
+        for plans in results:
+            assert [plan.expression for plan in plans] == ["@d-110m", "@d-110m", "@h", "-1h@h"] * 50
+            assert plans[0] is results[0][0] is results[0][1]
+        assert cache_info().hits + cache_info().misses == len(snaptimes) * 4
+
+    def test_compile_invalid_not_cached(self):
+        # act/assert
+        with pytest.raises(ValueError, match="^Snaptime string is invalid$"):
+            compile("")
+        assert cache_info().currsize == 0
@@ -0,0 +1,246 @@
+import re
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime.models import Action, Operation, Snaptime, Unit
+from python_snaptime.parsers import compile
+from python_snaptime.plans import SnapPlan
+
+
+class TestSnapPlan:
+    @pytest.fixture()
+    def plan(self):
+        return SnapPlan(
+            [
+                Snaptime(action=Action.SNAP, unit=Unit.DAY),
+                Snaptime(action=Action.SUB, unit=Unit.HOUR, time_int=2),
+                Snaptime(action=Action.ADD, unit=Unit.MINUTE, time_int=10),
+            ]
+        )
+
+    def test_snap_plan_expression(self, plan: SnapPlan):
+        # assert
+        assert plan.expression == "@d-110m"
+        assert repr(plan) == "SnapPlan('@d-110m')"
+
+    def test_snap_plan_empty(self):
+        # act/assert
+        with pytest.raises(ValueError, match="^Snaptime string is invalid$"):
+            SnapPlan([])
+
+    def test_snap_plan_hashable(self, plan: SnapPlan):
+        # arrange
+        other = SnapPlan([Snaptime(action="@", unit="day"), Snaptime(action="-", unit="hours", time_int=2)])
+        other = SnapPlan([*other.operations, Snaptime(action="+", unit="mins", time_int=10)])
+
+        # assert
+        assert plan == other
+        assert hash(plan) == hash(other)
+        assert len({plan, other}) == 1
+
+    def test_snap_plan_operations(self, plan: SnapPlan):
+        # assert
+        assert plan.operations == (
+            Operation(action=Action.SNAP, unit=Unit.DAY),
+            Operation(action=Action.SUB, unit=Unit.MINUTE, time_int=110),
+        )
+
+    def test_snap_plan_fixed_offset_operations(self):
+        # arrange
+        plan = SnapPlan([Operation(Action.SNAP, Unit.HOUR), Operation(Action.SNAP, Unit.DAY)])
+
+        # assert
+        assert plan.operations == (Operation(Action.SNAP, Unit.HOUR), Operation(Action.SNAP, Unit.DAY))
+        assert plan.fixed_offset_operations == (Operation(Action.SNAP, Unit.DAY),)
+
+    def test_snap_plan_immutable(self, plan: SnapPlan):
+        # act/assert
+        with pytest.raises(AttributeError, match="SnapPlan is immutable."):
+            plan._operations = ()  # noqa: SLF001
+
+    def test_snap_plan_apply_pendulum(self, plan: SnapPlan):
+        # arrange
+        dtm = pendulum.datetime(2024, 12, 30, 13, 1, 10, 999999, tz="America/New_York")
+
+        # act
+        result = plan.apply(dtm)
+
+        # assert
+        assert result == pendulum.datetime(2024, 12, 29, 22, 10, 0, 0, tz="America/New_York")
+
+    def test_snap_plan_apply_datetime(self, plan: SnapPlan):
+        # arrange
+        dtm = datetime(2024, 12, 30, 13, 1, 10, 999999, tzinfo=ZoneInfo("America/New_York"))
+
+        # act
+        result = plan.apply(dtm)
+
+        # assert
+        assert result == datetime(2024, 12, 29, 22, 10, 0, 0, tzinfo=ZoneInfo("America/New_York"))
+
+    @pytest.mark.parametrize(
+        ("dtm", "expected"),
+        [
+            (
+                pendulum.datetime(2024, 12, 30, 13, 1, 10, 999999, tz=pendulum.fixed_timezone(-18000)),
+                pendulum.datetime(2024, 12, 29, 22, 10, 0, 0, tz=pendulum.fixed_timezone(-18000)),
+            ),
+            (
+                datetime(2024, 12, 30, 13, 1, 10, 999999, tzinfo=timezone(timedelta(hours=-5))),
+                datetime(2024, 12, 29, 22, 10, 0, 0, tzinfo=timezone(timedelta(hours=-5))),
+            ),
+            (
+                datetime(2024, 12, 30, 13, 1, 10, 999999, tzinfo=ZoneInfo("UTC")),
+                datetime(2024, 12, 29, 22, 10, 0, 0, tzinfo=ZoneInfo("UTC")),
+            ),
+        ],
+    )
+    def test_snap_plan_apply_fixed_offset(self, plan: SnapPlan, dtm: datetime, expected: datetime):
+        # act
+        result = plan.apply(dtm)
+
+        # assert
+        assert result == expected
+        assert type(result) is type(dtm)
+        assert result.tzinfo is dtm.tzinfo
+
+    def test_snap_plan_apply_zoneinfo(self, plan: SnapPlan):
+        # arrange
+        dtm = datetime(2024, 3, 10, 13, 1, 10, 999999, tzinfo=ZoneInfo("America/New_York"))
+
+        # act
+        result = plan.apply(dtm)
+
+        # assert
+        assert result == datetime(2024, 3, 9, 22, 10, 0, 0, tzinfo=ZoneInfo("America/New_York"))
+        assert type(result) is datetime
+        assert result.tzinfo is dtm.tzinfo
+
+    def test_snap_plan_apply_invalid_datetime(self, plan: SnapPlan):
+        # act/assert
+        with pytest.raises(
+            TypeError, match=re.escape("Invalid datetime type. Must be pendulum.DateTime or datetime.datetime.")
+        ):
+            plan.apply(date(2024, 12, 30))
+
+
+class TestMemoizedPlan:
+    @pytest.mark.parametrize("expression", ["@h+10m", "@d-2h", "@w@d+1000us", "@mon-1d", "@q+1mon", "@y-1s"])
+    @pytest.mark.parametrize("tz", ["Europe/London", "America/St_Johns"])
+    def test_matches_plan(self, expression, tz):
+        # arrange
+        plan = compile(expression)
+        memoized = plan.memoize()
+        # every 13 minutes across the DST transitions of 2009, with both folds
+        dtms = [
+            dtm.replace(fold=fold)
+            for start in (datetime(2009, 3, 7, tzinfo=timezone.utc), datetime(2009, 10, 30, tzinfo=timezone.utc))
+            for dtm in (start + timedelta(minutes=13 * i) for i in range(400))
+            for fold in (0, 1)
+        ]
+        dtms = [dtm.astimezone(ZoneInfo(tz)) for dtm in dtms] + [pendulum.instance(dtm).in_tz(tz) for dtm in dtms]
+
+        # act
+        result = [memoized.apply(dtm) for dtm in dtms]
+
+        # assert
+        expected = [plan.apply(dtm) for dtm in dtms]
+        assert result == expected
+        assert [(type(dtm), dtm.tzinfo, dtm.fold, dtm.utcoffset()) for dtm in result] == [
+            (type(dtm), dtm.tzinfo, dtm.fold, dtm.utcoffset()) for dtm in expected
+        ]
+        assert memoized.cache_info().hits > 0
+
+    @pytest.mark.parametrize(
+        ("tz", "snaptime", "dtms"),
+        [
+            ("Australia/Lord_Howe", "@h", [datetime(2024, 10, 6, 2, 10), datetime(2024, 10, 6, 2, 40)]),
+            ("America/Sao_Paulo", "@d", [datetime(2018, 11, 4, 0, 30), datetime(2018, 11, 4, 5)]),
+        ],
+    )
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_skipped_wall_time(self, tz, snaptime, dtms, reverse):
+        # arrange
+        plan = compile(snaptime)
+        memoized = plan.memoize()
+        dtms = [dtm.replace(tzinfo=ZoneInfo(tz)) for dtm in (reversed(dtms) if reverse else dtms)]
+
+        # act
+        result = [memoized.apply(dtm) for dtm in dtms]
+
+        # assert
+        expected = [plan.apply(dtm) for dtm in dtms]
+        assert result == expected
+        assert [dtm.utcoffset() for dtm in result] == [dtm.utcoffset() for dtm in expected]
+        assert len(set(expected)) == 2
+
+    def test_one_computation_per_bucket(self):
+        # arrange
+        memoized = compile("@h-2h").memoize(maxsize=2)
+        dtms = [pendulum.datetime(2024, 12, 30, 10, tz="Europe/London").add(seconds=7 * i) for i in range(1000)]
+
+        # act
+        result = [memoized.apply(dtm) for dtm in dtms]
+
+        # assert
+        assert len(set(result)) == 2
+        info = memoized.cache_info()
+        assert (info.hits, info.misses, info.evictions, info.currsize) == (998, 2, 0, 2)
+
+    def test_bucket_includes_timezone_and_type(self):
+        # arrange
+        memoized = compile("@d").memoize()
+        dtm = datetime(2024, 12, 30, 10, tzinfo=ZoneInfo("Europe/London"))
+
+        # act
+        result = [
+            memoized.apply(dtm),
+            memoized.apply(dtm.replace(tzinfo=ZoneInfo("Asia/Tokyo"))),
+            memoized.apply(pendulum.instance(dtm)),
+            memoized.apply(dtm.replace(tzinfo=None)),
+        ]
+
+        # assert
+        assert [str(dtm) for dtm in result] == [
+            "2024-12-30 00:00:00+00:00",
+            "2024-12-30 00:00:00+09:00",
+            "2024-12-30 00:00:00+00:00",
+            "2024-12-30 00:00:00",
+        ]
+        assert type(result[2]) is pendulum.DateTime
+        assert memoized.cache_info().currsize == 4
+
+    def test_leading_delta_bypasses_cache(self):
+        # arrange
+        memoized = compile("+1h@d").memoize()
+
+        # act
+        result = memoized.apply(datetime(2024, 12, 30, 23, 30))
+
+        # assert
+        assert result == datetime(2024, 12, 31)
+        assert memoized.cache_info().misses == 0
+        assert memoized.cache_info().currsize == 0
+
+    def test_clear_and_repr(self):
+        # arrange
+        memoized = compile("@d-2h+30m").memoize()
+        memoized.apply(datetime(2024, 12, 30, 10))
+
+        # act
+        memoized.cache_clear()
+
+        # assert
+        assert memoized.cache_info().currsize == 0
+        assert memoized.plan == compile("@d-90m")
+        assert repr(memoized) == "MemoizedPlan('@d-90m')"
+
+    def test_invalid_datetime(self):
+        # act/assert
+        with pytest.raises(
+            TypeError, match=re.escape("Invalid datetime type. Must be pendulum.DateTime or datetime.datetime.")
+        ):
+            compile("@d").memoize().apply(date(2024, 12, 30))
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime import snap, snap_range
+from python_snaptime.parsers import compile
+
+
+class TestSnapRange:
+    @pytest.mark.parametrize(
+        ("step", "align", "expected"),
+        [
+            ("+15m", "@h", ["10:00", "10:15", "10:30", "10:45", "11:00", "11:15", "11:30", "11:45"]),
+            ("30m", None, ["10:17", "10:47", "11:17", "11:47"]),
+            (compile("+1h+30m"), compile("@h"), ["10:00", "11:30"]),
+        ],
+    )
+    def test_steps(self, step, align, expected):
+        # arrange
+        start = datetime(2024, 12, 30, 10, 17)
+
+        # act
+        result = snap_range(start, datetime(2024, 12, 30, 12), step, align)
+
+        # assert
+        assert [dtm.strftime("%H:%M") for dtm in result] == expected
+
+    def test_descending(self):
+        # act
+        result = list(snap_range(datetime(2024, 3, 2, 10), datetime(2024, 2, 26), "-1d", "@d"))
+
+        # assert
+        assert [dtm.day for dtm in result] == [2, 1, 29, 28, 27]
+
+    def test_month_end_does_not_drift(self):
+        # act
+        result = list(snap_range(pendulum.datetime(2024, 1, 31, 10), pendulum.datetime(2024, 6, 1), "+1mon"))
+
+        # assert
+        assert [dtm.day for dtm in result] == [31, 29, 31, 30, 31]
+        assert all(isinstance(dtm, pendulum.DateTime) for dtm in result)
+
+    @pytest.mark.parametrize(
+        "start",
+        [
+            datetime(2024, 10, 25, 12, tzinfo=ZoneInfo("Europe/London")),
+            pendulum.datetime(2024, 10, 25, 12, tz="Europe/London"),
+        ],
+    )
+    def test_dst_calendar_steps(self, start):
+        # act
+        result = list(snap_range(start, start + timedelta(days=4), "+1d", "@d+1h"))
+
+        # assert
+        # days keep the wall time across the transition, and the repeated 1am resolves to its second occurrence
+        assert [dtm.isoformat() for dtm in result] == [
+            "2024-10-25T01:00:00+01:00",
+            "2024-10-26T01:00:00+01:00",
+            "2024-10-27T01:00:00+00:00",
+            "2024-10-28T01:00:00+00:00",
+            "2024-10-29T01:00:00+00:00",
+        ]
+        assert result == [snap(start, f"@d+1h+{k}d") for k in range(5)]
+        assert type(result[0]) is type(start)
+
+    def test_dst_fixed_steps(self):
+        # arrange
+        start = datetime(2024, 10, 27, tzinfo=ZoneInfo("Europe/London"))
+
+        # act
+        result = list(snap_range(start, datetime(2024, 10, 27, 3, tzinfo=timezone.utc), "+1h"))
+
+        # assert
+        assert [dtm.isoformat() for dtm in result] == [
+            "2024-10-27T00:00:00+01:00",
+            "2024-10-27T01:00:00+01:00",
+            "2024-10-27T01:00:00+00:00",
+            "2024-10-27T02:00:00+00:00",
+        ]
+
+    def test_lazy(self):
+        # act
+        result = snap_range(datetime(2024, 1, 1), datetime.max, "+1s")
+
+        # assert
+        assert next(result) == datetime(2024, 1, 1)
+        assert next(result) == datetime(2024, 1, 1, 0, 0, 1)
+
+    @pytest.mark.parametrize("step", ["@h", "+1h@h", "+0h", "+1d-24h"])
+    def test_invalid_step(self, step):
+        # act/assert
+        with pytest.raises(ValueError, match="Invalid range step"):
+            snap_range(datetime(2024, 1, 1), datetime(2024, 1, 2), step)
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pendulum
+import pytest
+
+from python_snaptime import TimeWindow, snap, time_window, time_windows
+from python_snaptime.parsers import compile
+from tests.helpers import CentralEuropeanTime
+
+_SNAPTIMES = ["-24h@h", "@h", "@d-7d", "@d", "@w+1d@d", "@mon-1mon", "+1d@d-2h", "@d+1d"]
+
+
+class TestTimeWindow:
+    @pytest.mark.parametrize(
+        "now",
+        [
+            pendulum.datetime(2024, 3, 31, 1, 30, tz="Europe/London"),
+            datetime(2024, 3, 31, 1, 30, tzinfo=ZoneInfo("Europe/London")),
+            datetime(2024, 11, 3, 1, 30, fold=1, tzinfo=ZoneInfo("America/New_York")),
+            datetime(2024, 12, 30, 13, 5, tzinfo=timezone.utc),
+            datetime(2024, 12, 30, 13, 5),
+            datetime(2024, 12, 30, 13, 5, tzinfo=CentralEuropeanTime()),
+        ],
+    )
+    def test_matches_snap(self, now):
+        # arrange
+        windows = [(earliest, latest) for earliest in _SNAPTIMES for latest in _SNAPTIMES]
+
+        # act
+        batch = time_windows(windows, now)
+        single = [time_window(earliest, latest, now) for earliest, latest in windows]
+
+        # assert
+        expected = [TimeWindow(snap(now, earliest), snap(now, latest)) for earliest, latest in windows]
+        assert batch == expected
+        assert single == expected
+        for window, expected_window in zip(batch, expected):
+            assert [type(dtm) for dtm in window] == [type(dtm) for dtm in expected_window]
+            assert [dtm.utcoffset() for dtm in window] == [dtm.utcoffset() for dtm in expected_window]
+
+    def test_half_open(self):
+        # arrange
+        now = datetime(2024, 12, 30, 13, 5, tzinfo=timezone.utc)
+
+        # act
+        window = time_window(compile("-24h@h"), "@h", now)
+
+        # assert
+        assert window == (
+            datetime(2024, 12, 29, 13, tzinfo=timezone.utc),
+            datetime(2024, 12, 30, 13, tzinfo=timezone.utc),
+        )
+        assert window.duration == timedelta(hours=24)
+        assert window.earliest in window
+        assert window.latest not in window
+        assert datetime(2024, 12, 30, 12, 59, tzinfo=timezone.utc) in window
+        assert "2024-12-30" not in window
+
+    def test_default_now(self):
+        # act
+        window = time_window("@d", "+1d@d")
+
+        # assert
+        assert window.earliest.tzinfo is timezone.utc
+        assert datetime.now(timezone.utc) in window